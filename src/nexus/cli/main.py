@@ -5,8 +5,6 @@ from typing import Optional
 
 import typer
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.table import Table
 
 app = typer.Typer(
     name="nexus",
@@ -56,9 +54,10 @@ def init(
 @app.command()
 def status() -> None:
     """Show Nexus status and statistics."""
+    from rich.table import Table
+
     from nexus.config import load_config
-    from nexus.storage.metadata import MetadataStore
-    from nexus.storage.vectors import VectorStore
+    from nexus.runtime import get_metadata_store
 
     config_path = Path("~/.nexus/config.yaml").expanduser()
     if not config_path.exists():
@@ -78,11 +77,10 @@ def status() -> None:
     # Get database stats if available
     if config.storage.metadata_db.exists():
         try:
-            store = MetadataStore(config.storage.metadata_db)
+            store = get_metadata_store(config.storage.metadata_db)
             stats = store.get_stats()
             table.add_row("Documents", str(stats.get("documents", 0)))
             table.add_row("Chunks", str(stats.get("chunks", 0)))
-            store.close()
         except Exception:
             table.add_row("Database", "[yellow]Not accessible[/yellow]")
     else:
@@ -95,14 +93,16 @@ def status() -> None:
 def index(
     path: Optional[Path] = typer.Argument(None, help="Path to index (defaults to configured sources)"),
     recursive: bool = typer.Option(True, "--recursive/--no-recursive", "-r", help="Recursively index directories"),
+    workers: int | None = typer.Option(None, "--workers", "-w", help="Parser processes (default: CPU count)"),
 ) -> None:
     """Index documents into the knowledge base."""
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
     from nexus.config import load_config
     from nexus.ingest.pipeline import IngestionPipeline
     from nexus.ingest.chunker import TextChunker
-    from nexus.rag.embedder import Embedder
-    from nexus.storage.metadata import MetadataStore
-    from nexus.storage.vectors import VectorStore
+    from nexus.ingest.loader import find_files
+    from nexus.runtime import get_embedder, get_metadata_store, get_vector_store
 
     config_path = Path("~/.nexus/config.yaml").expanduser()
     if not config_path.exists():
@@ -130,20 +130,23 @@ def index(
     ) as progress:
         # Initialize embedder
         task = progress.add_task("Loading embedding model...", total=None)
-        embedder = Embedder(
+        embedder = get_embedder(
             model_name=config.embedding.model,
             batch_size=config.embedding.batch_size,
+            backend=config.embedding.backend,
+            model_file=config.embedding.model_file,
         )
         _ = embedder.dimension  # Force model load
         progress.update(task, description=f"[green]✓ Loaded {config.embedding.model}[/green]")
 
         # Initialize stores
         progress.update(task, description="Initializing storage...")
-        metadata_store = MetadataStore(config.storage.metadata_db)
-        vector_store = VectorStore(
+        metadata_store = get_metadata_store(config.storage.metadata_db)
+        vector_store = get_vector_store(
             collection_name=config.storage.collection_name,
             path=config.storage.qdrant_path,
             embedding_dim=embedder.dimension,
+            quantize=config.storage.quantize_vectors,
         )
 
         # Create pipeline
@@ -155,29 +158,27 @@ def index(
                 chunk_size=config.chunking.chunk_size,
                 chunk_overlap=config.chunking.chunk_overlap,
                 min_chunk_size=config.chunking.min_chunk_size,
+                strategy=config.chunking.strategy,
+                max_depth=config.chunking.max_depth,
+                overlap_ratio=config.chunking.overlap_ratio,
             ),
         )
 
-        # Index each path
-        total_docs = 0
+        # Collect files from every path, then parse them in one parallel pass
+        files: list[Path] = []
         for index_path in paths_to_index:
             if index_path.is_file():
-                progress.update(task, description=f"Indexing {index_path.name}...")
-                doc = pipeline.ingest_file(index_path)
-                if doc:
-                    total_docs += 1
+                files.append(index_path)
             elif index_path.is_dir():
-                progress.update(task, description=f"Indexing {index_path}...")
-                docs = pipeline.ingest_directory(index_path, recursive=recursive)
-                total_docs += len(docs)
+                files.extend(find_files(index_path, recursive=recursive))
             else:
                 console.print(f"[yellow]Skipping {index_path}: not found[/yellow]")
 
-        progress.update(task, description=f"[green]✓ Indexed {total_docs} documents[/green]")
+        progress.update(task, description=f"Indexing {len(files)} files...")
+        docs = pipeline.ingest_files(files, workers=workers)
+        total_docs = len(docs)
 
-        # Clean up
-        metadata_store.close()
-        vector_store.close()
+        progress.update(task, description=f"[green]✓ Indexed {total_docs} documents[/green]")
 
     # Show stats
     console.print()
@@ -190,7 +191,7 @@ def serve(
 ) -> None:
     """Start the Nexus MCP server."""
     from nexus.config import load_config
-    from nexus.tools.server import NexusServer
+    from nexus.tools.server import NexusServer, run_async
 
     config_path = Path("~/.nexus/config.yaml").expanduser()
     if not config_path.exists():
@@ -213,10 +214,9 @@ def serve(
     if stdio:
         stderr_console = Console(stderr=True)
         stderr_console.print("[cyan]Starting Nexus MCP server (stdio)...[/cyan]")
-        import asyncio
         server = NexusServer(config=config)
         try:
-            asyncio.run(server.run_stdio())
+            run_async(server.run_stdio())
         finally:
             server.close()
     else:
@@ -256,7 +256,8 @@ def add_source(
         type=source_type,
         watch=watch,
     )
-    config.sources.append(new_source)
+    # load_config may hand out a shared instance, so build a new one
+    config = config.model_copy(update={"sources": [*config.sources, new_source]})
     save_config(config, config_path)
 
     console.print(f"[green]✓ Added source: {resolved_path}[/green]")
@@ -266,6 +267,8 @@ def add_source(
 @app.command("list-sources")
 def list_sources() -> None:
     """List configured sources."""
+    from rich.table import Table
+
     from nexus.config import load_config
 
     config_path = Path("~/.nexus/config.yaml").expanduser()
@@ -300,12 +303,12 @@ def search(
     limit: int = typer.Option(5, "--limit", "-n", help="Number of results"),
 ) -> None:
     """Search the knowledge base."""
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
     from nexus.config import load_config
-    from nexus.rag.embedder import Embedder
     from nexus.rag.hybrid import HybridSearchEngine
     from nexus.rag.bm25 import BM25Index
-    from nexus.storage.metadata import MetadataStore
-    from nexus.storage.vectors import VectorStore
+    from nexus.runtime import get_embedder, get_metadata_store, get_vector_store
 
     config_path = Path("~/.nexus/config.yaml").expanduser()
     if not config_path.exists():
@@ -321,16 +324,22 @@ def search(
     ) as progress:
         task = progress.add_task("Loading...", total=None)
 
-        embedder = Embedder(model_name=config.embedding.model)
-        metadata_store = MetadataStore(config.storage.metadata_db)
-        vector_store = VectorStore(
+        embedder = get_embedder(
+            model_name=config.embedding.model,
+            batch_size=config.embedding.batch_size,
+            backend=config.embedding.backend,
+            model_file=config.embedding.model_file,
+        )
+        metadata_store = get_metadata_store(config.storage.metadata_db)
+        vector_store = get_vector_store(
             collection_name=config.storage.collection_name,
             path=config.storage.qdrant_path,
             embedding_dim=embedder.dimension,
+            quantize=config.storage.quantize_vectors,
         )
 
         bm25_index = BM25Index(metadata_store)
-        bm25_index.build_index()
+        bm25_index.load_or_build(config.storage.qdrant_path.parent / "bm25.pkl")
 
         engine = HybridSearchEngine(
             embedder=embedder,
@@ -363,9 +372,6 @@ def search(
         console.print(r.content[:500] + "..." if len(r.content) > 500 else r.content)
         console.print()
 
-    metadata_store.close()
-    vector_store.close()
-
 
 if __name__ == "__main__":
     app()
@@ -1,26 +1,52 @@
 """Configuration management for Nexus."""
 
+import functools
+import os
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar, get_args, get_origin
 
 import yaml
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from nexus.exceptions import ConfigError
 
+try:
+    # libyaml-backed loader/dumper are much faster; fall back to pure Python
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader
+
+
+_ModelT = TypeVar("_ModelT", bound=BaseModel)
+
+# Config is read-mostly: freeze it and drop unknown keys instead of storing them
+_FROZEN = ConfigDict(frozen=True, extra="ignore", validate_assignment=False)
+
 
 class EmbeddingConfig(BaseModel):
     """Configuration for embedding model."""
 
+    model_config = _FROZEN
+
     model: str = Field(default="BAAI/bge-base-en-v1.5", description="Embedding model name")
     batch_size: int = Field(default=32, description="Batch size for embedding")
     normalize: bool = Field(default=True, description="Normalize embeddings")
+    backend: str = Field(
+        default="torch", description="Inference backend: torch, onnx or openvino"
+    )
+    model_file: str | None = Field(
+        default=None,
+        description="ONNX/OpenVINO file in the model repo, e.g. an int8-quantized export",
+    )
 
 
 class RerankerConfig(BaseModel):
     """Configuration for reranker model."""
 
+    model_config = _FROZEN
+
     model: str = Field(default="BAAI/bge-reranker-base", description="Reranker model name")
     top_k: int = Field(default=5, description="Number of results after reranking")
 
@@ -28,6 +54,8 @@ class RerankerConfig(BaseModel):
 class StorageConfig(BaseModel):
     """Configuration for storage backends."""
 
+    model_config = _FROZEN
+
     vector_db: str = Field(default="embedded", description="Vector DB mode: embedded or server")
     qdrant_path: Path = Field(
         default=Path("~/.nexus/qdrant").expanduser(),
@@ -39,22 +67,39 @@ class StorageConfig(BaseModel):
         description="Path for SQLite metadata database",
     )
     collection_name: str = Field(default="nexus_knowledge", description="Qdrant collection name")
+    quantize_vectors: bool = Field(
+        default=False,
+        description="Create the Qdrant collection with int8 scalar quantization (server mode)",
+    )
 
 
 class RetrievalConfig(BaseModel):
     """Configuration for retrieval settings."""
 
+    model_config = _FROZEN
+
     top_k: int = Field(default=20, description="Initial retrieval count")
     rerank_top_k: int = Field(default=5, description="Results after reranking")
     use_reranking: bool = Field(default=True, description="Enable reranking")
     hybrid_alpha: float = Field(
         default=0.5, ge=0.0, le=1.0, description="Weight for vector vs BM25 (1.0 = all vector)"
     )
+    # Off by default: any query within this cosine similarity of an earlier
+    # one gets that query's results, which can be wrong for near-identical
+    # queries that differ by a version number or a negation
+    semantic_cache_threshold: float | None = Field(
+        default=None,
+        ge=0.0,
+        le=1.0,
+        description="Cosine similarity for reusing a previous query's results (null disables)",
+    )
 
 
 class SourceConfig(BaseModel):
     """Configuration for a knowledge source."""
 
+    model_config = _FROZEN
+
     path: Path = Field(description="Path to source directory or file")
     type: str = Field(default="markdown", description="Source type: markdown, pdf")
     watch: bool = Field(default=True, description="Watch for changes")
@@ -64,9 +109,18 @@ class SourceConfig(BaseModel):
 class ChunkingConfig(BaseModel):
     """Configuration for text chunking."""
 
+    model_config = _FROZEN
+
     chunk_size: int = Field(default=512, description="Target chunk size in tokens")
     chunk_overlap: int = Field(default=50, description="Overlap between chunks")
     min_chunk_size: int = Field(default=100, description="Minimum chunk size")
+    strategy: str = Field(
+        default="sentence", description="Splitting strategy: sentence or hierarchical"
+    )
+    max_depth: int = Field(default=4, description="Maximum split depth (hierarchical)")
+    overlap_ratio: float = Field(
+        default=0.5, description="Leaf share taken by overlap chunks (hierarchical)"
+    )
 
 
 class Config(BaseSettings):
@@ -75,6 +129,9 @@ class Config(BaseSettings):
     model_config = SettingsConfigDict(
         env_prefix="NEXUS_",
         env_nested_delimiter="__",
+        frozen=True,
+        extra="ignore",
+        validate_assignment=False,
     )
 
     # Component configs
@@ -103,6 +160,12 @@ class Config(BaseSettings):
 def load_config(config_path: Path | None = None) -> Config:
     """Load configuration from YAML file.
 
+    Parsed configs are memoized on the file's path, mtime, size and any
+    ``NEXUS_*`` environment overrides, so repeated loads in one process
+    (e.g. ``nexus index`` followed by ``status``) skip YAML parsing and
+    validation. The returned instance is frozen and may be shared between
+    callers; use ``model_copy(update=...)`` to derive a modified config.
+
     Args:
         config_path: Path to config file. Defaults to ~/.nexus/config.yaml
 
@@ -119,9 +182,32 @@ def load_config(config_path: Path | None = None) -> Config:
         # Return default config if no file exists
         return Config()
 
+    resolved = config_path.resolve()
+    stat = resolved.stat()
+    env = tuple(sorted((k, v) for k, v in os.environ.items() if k.startswith("NEXUS_")))
+    return _load_config_cached(str(resolved), stat.st_mtime_ns, stat.st_size, env)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_config_cached(
+    path: str,
+    mtime_ns: int,
+    size: int,
+    env: tuple[tuple[str, str], ...],
+) -> Config:
+    """Parse and validate a config file (memoized by ``load_config``).
+
+    Files last written by ``save_config`` (per the sidecar stamp) were
+    produced from an already-validated Config, so they are rebuilt with
+    ``model_construct`` instead of being validated again. Hand-edited files
+    and environment overrides always go through full validation.
+    """
+    config_path = Path(path)
     try:
         with open(config_path) as f:
-            data = yaml.safe_load(f) or {}
+            data = yaml.load(f, Loader=SafeLoader) or {}
+        if not env and _read_stamp(config_path) == (mtime_ns, size):
+            return _construct_trusted(Config, data)
         return Config(**data)
     except yaml.YAMLError as e:
         raise ConfigError(f"Invalid YAML in config file {config_path}: {e}") from e
@@ -129,6 +215,48 @@ def load_config(config_path: Path | None = None) -> Config:
         raise ConfigError(f"Failed to load config from {config_path}: {e}") from e
 
 
+def _stamp_path(config_path: Path) -> Path:
+    """Sidecar file recording the mtime and size of the last ``save_config`` write."""
+    return config_path.with_name(config_path.name + ".stamp")
+
+
+def _read_stamp(config_path: Path) -> tuple[int, int] | None:
+    """Read the save stamp for a config file, if any."""
+    try:
+        mtime_ns, size = _stamp_path(config_path).read_text().split()
+        return int(mtime_ns), int(size)
+    except (OSError, ValueError):
+        return None
+
+
+def _construct_trusted(model: type[_ModelT], data: dict[str, Any]) -> _ModelT:
+    """Build a model from trusted data without validation.
+
+    ``model_construct`` does not recurse, so nested models, lists of models
+    and ``Path`` fields are converted here.
+    """
+    values = {
+        name: _construct_value(model.model_fields[name].annotation, value)
+        for name, value in data.items()
+        if name in model.model_fields
+    }
+    return model.model_construct(**values)
+
+
+def _construct_value(annotation: Any, value: Any) -> Any:
+    """Convert a dumped value back to the type named by its annotation."""
+    if value is None:
+        return None
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return _construct_trusted(annotation, value)
+    args = get_args(annotation)
+    if get_origin(annotation) is list and args:
+        return [_construct_value(args[0], item) for item in value]
+    if annotation is Path or Path in args:
+        return Path(value)
+    return value
+
+
 def save_config(config: Config, config_path: Path | None = None) -> None:
     """Save configuration to YAML file.
 
@@ -143,7 +271,11 @@ def save_config(config: Config, config_path: Path | None = None) -> None:
 
     data = config.model_dump(mode="json")
     with open(config_path, "w") as f:
-        yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+        yaml.dump(data, f, Dumper=SafeDumper, default_flow_style=False, sort_keys=False)
+
+    # Mark this exact write as trusted so load_config can skip validation
+    stat = config_path.stat()
+    _stamp_path(config_path).write_text(f"{stat.st_mtime_ns} {stat.st_size}")
 
 
 def create_default_config() -> Config:
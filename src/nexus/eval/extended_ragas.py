@@ -1,115 +1,310 @@
 """Extended RAGAS evaluation with LLM judge support."""
 
+import functools
+import hashlib
 import json
+import os
+import re
+import threading
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from importlib import resources
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 from loguru import logger
+from rich.progress import BarColumn, MofNCompleteColumn, Progress, TextColumn
 
+try:
+    import orjson
 
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from rapidfuzz import fuzz
+
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+from nexus.exceptions import EvaluationError
+from nexus.models.search import SearchResult
+
+# Default location for cached generation/judge responses
+DEFAULT_CACHE_DIR = Path("~/.nexus/cache/judge").expanduser()
+
+# Scores in [0, 1] as the judge might write them: 0, 1, 0.85, 1.0
+_SCORE_PATTERN = re.compile(r"\b[01](?:\.\d+)?\b")
+
+# Lexical overlap with the ground truth at or above which an answer is
+# scored as correct, and at or below which it is scored as wrong, without
+# asking the judge
+LEXICAL_MATCH_THRESHOLD = 0.95
+LEXICAL_MISMATCH_THRESHOLD = 0.10
+
+# Per-query scores averaged into the report metrics
+_SCORE_COLUMNS = ("hit", "faithfulness", "answer_relevancy", "context_precision")
+
+
+def iter_extended_eval_dataset() -> Iterator[dict[str, Any]]:
+    """Stream the 50+ question evaluation dataset.
+
+    Examples are read lazily from ``data/extended_eval.jsonl`` inside the
+    package, one JSON object per line.
+
+    Yields:
+        Evaluation examples with question, ground_truth, and expected_source.
+    """
+    data_file = resources.files("nexus.eval").joinpath("data").joinpath("extended_eval.jsonl")
+    with data_file.open("r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+@functools.cache
 def create_extended_eval_dataset() -> list[dict[str, Any]]:
     """Create 50+ question evaluation dataset.
     
+    The dataset is loaded once and the same list is returned on every call,
+    so callers must not mutate it.
+    
     Returns:
         List of evaluation examples with question, ground_truth, and expected contexts.
     """
-    return [
-        # Machine Learning - 10 questions
-        {"question": "What are the three types of machine learning?", "ground_truth": "Supervised learning, unsupervised learning, and reinforcement learning.", "expected_source": "machine_learning.md"},
-        {"question": "What is supervised learning?", "ground_truth": "Supervised learning is when the algorithm learns from labeled training data and makes predictions based on that data.", "expected_source": "machine_learning.md"},
-        {"question": "What is unsupervised learning?", "ground_truth": "Unsupervised learning is when the algorithm finds patterns in unlabeled data without guidance.", "expected_source": "machine_learning.md"},
-        {"question": "What is reinforcement learning?", "ground_truth": "Reinforcement learning is when the algorithm learns through trial and error, receiving rewards or penalties for actions.", "expected_source": "machine_learning.md"},
-        {"question": "What are features in machine learning?", "ground_truth": "Features are input variables used to make predictions, such as age or income.", "expected_source": "machine_learning.md"},
-        {"question": "What are labels in machine learning?", "ground_truth": "Labels are output variables we want to predict.", "expected_source": "machine_learning.md"},
-        {"question": "What is a decision tree?", "ground_truth": "Decision trees are tree-like models where each internal node represents a test on an attribute, each branch represents the outcome, and each leaf node represents a class label.", "expected_source": "machine_learning.md"},
-        {"question": "What are support vector machines?", "ground_truth": "SVMs are supervised learning models used for classification and regression that work by finding the hyperplane that best separates different classes.", "expected_source": "machine_learning.md"},
-        {"question": "What are some applications of machine learning?", "ground_truth": "Email spam filtering, image recognition, medical diagnosis, fraud detection, recommendation systems, and self-driving cars.", "expected_source": "machine_learning.md"},
-        {"question": "How do I get started with machine learning?", "ground_truth": "Learn Python programming, understand basic statistics and linear algebra, practice with libraries like scikit-learn, TensorFlow, or PyTorch.", "expected_source": "machine_learning.md"},
-        
-        # Deep Learning - 12 questions
-        {"question": "What is deep learning?", "ground_truth": "Deep learning is a subset of machine learning that uses neural networks with many layers to analyze data.", "expected_source": "deep_learning.md"},
-        {"question": "What is a neural network perceptron?", "ground_truth": "A perceptron is the simplest form of a neural network with input layer, weights, and activation function.", "expected_source": "deep_learning.md"},
-        {"question": "What is the ReLU activation function?", "ground_truth": "ReLU (Rectified Linear Unit) is defined as f(x) = max(0, x), the most popular activation function.", "expected_source": "deep_learning.md"},
-        {"question": "What is the sigmoid activation function?", "ground_truth": "Sigmoid outputs between 0 and 1, used in binary classification, can cause vanishing gradients.", "expected_source": "deep_learning.md"},
-        {"question": "What is softmax?", "ground_truth": "Softmax converts outputs to probability distribution where all outputs sum to 1, used in multi-class classification.", "expected_source": "deep_learning.md"},
-        {"question": "What are CNNs?", "ground_truth": "Convolutional Neural Networks are designed for processing grid-like data like images, using convolutional and pooling layers.", "expected_source": "deep_learning.md"},
-        {"question": "What are RNNs?", "ground_truth": "Recurrent Neural Networks are designed for sequential data, maintaining hidden state across time steps.", "expected_source": "deep_learning.md"},
-        {"question": "What is LSTM?", "ground_truth": "Long Short-Term Memory is an advanced RNN that solves vanishing gradient problem with memory cells and gates.", "expected_source": "deep_learning.md"},
-        {"question": "What are transformers?", "ground_truth": "Transformers are modern architecture based on self-attention, enabling parallel processing and capturing long-range dependencies.", "expected_source": "deep_learning.md"},
-        {"question": "What is dropout regularization?", "ground_truth": "Dropout randomly disables neurons during training to prevent overfitting.", "expected_source": "deep_learning.md"},
-        {"question": "What is TensorFlow?", "ground_truth": "TensorFlow is Google's open-source deep learning framework, production-ready with TensorBoard for visualization.", "expected_source": "deep_learning.md"},
-        {"question": "What is PyTorch?", "ground_truth": "PyTorch is Meta's research-friendly deep learning framework with dynamic computational graphs.", "expected_source": "deep_learning.md"},
-        
-        # Python - 10 questions
-        {"question": "Why is Python popular?", "ground_truth": "Python is easy to learn, versatile, has a large ecosystem, and strong community support.", "expected_source": "python_guide.md"},
-        {"question": "How do you define a function in Python?", "ground_truth": "Functions are defined using the 'def' keyword, followed by function name and parameters.", "expected_source": "python_guide.md"},
-        {"question": "What are Python data types?", "ground_truth": "Numbers (int, float), strings, lists, and dictionaries.", "expected_source": "python_guide.md"},
-        {"question": "How do you create a Python class?", "ground_truth": "Use the 'class' keyword with __init__ method for initialization and self for instance attributes.", "expected_source": "python_guide.md"},
-        {"question": "What is NumPy?", "ground_truth": "NumPy is a library for numerical computing with arrays.", "expected_source": "python_guide.md"},
-        {"question": "What is Pandas?", "ground_truth": "Pandas is a library for data manipulation and analysis.", "expected_source": "python_guide.md"},
-        {"question": "What is Django?", "ground_truth": "Django is a full-featured web framework for Python.", "expected_source": "python_guide.md"},
-        {"question": "What is Flask?", "ground_truth": "Flask is a lightweight web framework for Python.", "expected_source": "python_guide.md"},
-        {"question": "What is PEP 8?", "ground_truth": "PEP 8 is the Python style guide for writing clean, readable code.", "expected_source": "python_guide.md"},
-        {"question": "How do you use virtual environments?", "ground_truth": "Use virtualenv or conda to create isolated Python environments.", "expected_source": "python_guide.md"},
-        
-        # NLP - 12 questions
-        {"question": "What is NLP?", "ground_truth": "Natural Language Processing is a branch of AI that helps computers understand human language.", "expected_source": "nlp_fundamentals.md"},
-        {"question": "What is tokenization?", "ground_truth": "Tokenization is breaking text into individual units (tokens) like words or sentences.", "expected_source": "nlp_fundamentals.md"},
-        {"question": "What is Named Entity Recognition?", "ground_truth": "NER is identifying and classifying named entities like person names, organizations, and locations.", "expected_source": "nlp_fundamentals.md"},
-        {"question": "What is Part-of-Speech tagging?", "ground_truth": "POS tagging labels words with their grammatical category like nouns, verbs, adjectives.", "expected_source": "nlp_fundamentals.md"},
-        {"question": "What is text preprocessing?", "ground_truth": "Lowercasing, removing punctuation, removing stop words, stemming, and lemmatization.", "expected_source": "nlp_fundamentals.md"},
-        {"question": "What is Word2Vec?", "ground_truth": "Word2Vec is a Google model that learns word associations from text, with similar words having similar vectors.", "expected_source": "nlp_fundamentals.md"},
-        {"question": "What is GloVe?", "ground_truth": "GloVe (Global Vectors) combines matrix factorization with local context for word representations.", "expected_source": "nlp_fundamentals.md"},
-        {"question": "What are BERT embeddings?", "ground_truth": "BERT embeddings are context-aware, pre-trained on massive text data, state-of-the-art for many NLP tasks.", "expected_source": "nlp_fundamentals.md"},
-        {"question": "What is spaCy?", "ground_truth": "spaCy is an industrial-strength NLP library that is fast and efficient.", "expected_source": "nlp_fundamentals.md"},
-        {"question": "What is NLTK?", "ground_truth": "NLTK (Natural Language Toolkit) is comprehensive text processing library for education and research.", "expected_source": "nlp_fundamentals.md"},
-        {"question": "What is Hugging Face Transformers?", "ground_truth": "Hugging Face Transformers provides modern transformer models like BERT, GPT, RoBERTa with easy-to-use API.", "expected_source": "nlp_fundamentals.md"},
-        {"question": "What are challenges in NLP?", "ground_truth": "Ambiguity, context dependence, sarcasm/irony detection, low-resource languages, and model bias.", "expected_source": "nlp_fundamentals.md"},
-        
-        # Data Science - 8 questions
-        {"question": "What is the CRISP-DM framework?", "ground_truth": "CRISP-DM has six phases: Business Understanding, Data Understanding, Data Preparation, Modeling, Evaluation, Deployment.", "expected_source": "data_science_workflow.md"},
-        {"question": "What is exploratory data analysis?", "ground_truth": "EDA includes summary statistics, distribution analysis, correlation analysis, and outlier detection.", "expected_source": "data_science_workflow.md"},
-        {"question": "What is feature engineering?", "ground_truth": "Creating meaningful features from raw data like one-hot encoding, binning, and time-based features.", "expected_source": "data_science_workflow.md"},
-        {"question": "What is Matplotlib?", "ground_truth": "Matplotlib is a basic Python plotting library for data visualization.", "expected_source": "data_science_workflow.md"},
-        {"question": "What is Seaborn?", "ground_truth": "Seaborn is a statistical visualization library built on Matplotlib.", "expected_source": "data_science_workflow.md"},
-        {"question": "What is XGBoost?", "ground_truth": "XGBoost is a gradient boosting library for machine learning.", "expected_source": "data_science_workflow.md"},
-        {"question": "What metrics are used for classification?", "ground_truth": "Accuracy, Precision, Recall, F1-score, ROC-AUC, and confusion matrix.", "expected_source": "data_science_workflow.md"},
-        {"question": "What is the role of a data scientist vs ML engineer?", "ground_truth": "Data scientists build predictive models; ML engineers deploy ML systems at scale.", "expected_source": "data_science_workflow.md"},
-    ]
+    return list(iter_extended_eval_dataset())
 
 
-def evaluate_with_llm(
-    search_engine,
+def _cached_generate(
     llm_client,
-    eval_data: list[dict[str, Any]],
-    top_k: int = 5,
-) -> dict[str, Any]:
-    """Evaluate RAG with LLM as judge (RAGAS-style).
-    
+    prompt: str,
+    kind: str,
+    cache_dir: Path | None,
+    **kwargs: Any,
+) -> str:
+    """Call ``llm_client.generate``, reusing responses saved by earlier runs.
+
+    Responses are stored as one JSON file per request, keyed on the prompt
+    kind, model, sampling parameters and prompt text. Failed calls are not
+    cached.
+
     Args:
-        search_engine: Search engine to evaluate
-        llm_client: LLM client for generating answers and judging
-        eval_data: Evaluation dataset
-        top_k: Number of results to retrieve
-        
+        llm_client: LLM client with a ``generate(prompt, **kwargs)`` method
+        prompt: Prompt text
+        kind: Prompt kind (e.g. "generation", "judge")
+        cache_dir: Cache directory, or None to always call the LLM
+        **kwargs: Generation parameters passed through to the client
+
     Returns:
-        Evaluation results with metrics
+        Generated text
+    """
+    if cache_dir is None:
+        return llm_client.generate(prompt, **kwargs)
+
+    model = getattr(llm_client, "model", "")
+    params = json.dumps(kwargs, sort_keys=True)
+    key = hashlib.sha256(f"{kind}\x1f{model}\x1f{params}\x1f{prompt}".encode()).hexdigest()
+    cache_file = cache_dir / key[:2] / f"{key}.json"
+
+    try:
+        raw = cache_file.read_bytes()
+        return (orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw))["response"]
+    except (OSError, ValueError, KeyError):
+        pass
+
+    response = llm_client.generate(prompt, **kwargs)
+
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        entry = {"kind": kind, "response": response}
+        if ORJSON_AVAILABLE:
+            tmp_file.write_bytes(orjson.dumps(entry))
+        else:
+            tmp_file.write_text(json.dumps(entry), encoding="utf-8")
+        tmp_file.replace(cache_file)
+    except OSError as e:
+        logger.warning(f"Failed to cache {kind} response: {e}")
+
+    return response
+
+
+def _clamp_score(value: float) -> float:
+    """Clamp a judge score into [0, 1]."""
+    return max(0.0, min(1.0, value))
+
+
+def _parse_judge_scores(text: str) -> tuple[float, float]:
+    """Parse (faithfulness, relevancy) from a judge reply.
+
+    Expects the requested JSON object, but falls back to the first two
+    0-1 numbers in the text for judges that wrap or reformat it. Scores
+    are clamped into [0, 1].
+
+    Raises:
+        ValueError: If two scores cannot be recovered
     """
-    results = []
+    try:
+        data = json.loads(text)
+        return (
+            _clamp_score(float(data["faithfulness"])),
+            _clamp_score(float(data["relevancy"])),
+        )
+    except (ValueError, TypeError, KeyError):
+        pass
+
+    numbers = _SCORE_PATTERN.findall(text)
+    if len(numbers) < 2:
+        raise ValueError(f"Could not parse judge scores from: {text!r}")
+    return _clamp_score(float(numbers[0])), _clamp_score(float(numbers[1]))
+
+
+def _lexical_overlap(answer: str, ground_truth: str) -> float | None:
+    """Token similarity of an answer to the ground truth in [0, 1].
+
+    Tokens missing from either side count against the score, so a short
+    answer that happens to be a subset of the ground truth is not a match.
+
+    Returns:
+        Similarity, or None if rapidfuzz is not installed
+    """
+    if not RAPIDFUZZ_AVAILABLE:
+        return None
+    similarity: float = fuzz.token_sort_ratio(answer, ground_truth) / 100.0
+    return similarity
+
+
+class _JudgeMemo:
+    """Run-scoped memo of judge scores keyed on the judged content.
+
+    Queries that retrieve the same contexts and produce the same answer
+    for the same question are judged once per run, even with the on-disk
+    response cache disabled.
+    """
+
+    def __init__(self) -> None:
+        self._scores: dict[str, tuple[float, float]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.shortcuts = 0
+
+    @staticmethod
+    def key(context_text: str, question: str, answer: str) -> str:
+        """Content-addressed key for a judge input."""
+        return "|".join(
+            hashlib.sha1(part.encode()).hexdigest() for part in (context_text, question, answer)
+        )
+
+    def get(self, key: str) -> tuple[float, float] | None:
+        """Scores recorded for a judge input, if any."""
+        with self._lock:
+            scores = self._scores.get(key)
+            if scores is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return scores
+
+    def put(self, key: str, scores: tuple[float, float]) -> None:
+        """Record scores for a judge input."""
+        with self._lock:
+            self._scores[key] = scores
+
+    def record_shortcut(self) -> None:
+        """Count an example scored without calling the judge."""
+        with self._lock:
+            self.shortcuts += 1
+
+
+class _FailureTracker:
+    """Count LLM failures and abort runs that keep failing.
+
+    A run with a dead or misconfigured LLM would otherwise finish with
+    every example silently scored by fallbacks.
+    """
+
+    def __init__(self, max_consecutive: int | None = 5) -> None:
+        self.max_consecutive = max_consecutive
+        self.total = 0
+        self._consecutive = 0
+        self._lock = threading.Lock()
+
+    @property
+    def tripped(self) -> bool:
+        """Whether the run has hit the consecutive failure limit."""
+        return bool(self.max_consecutive) and self._consecutive >= self.max_consecutive
+
+    def check(self) -> None:
+        """Stop queued examples from calling the LLM once the run is aborted.
+
+        Raises:
+            EvaluationError: If the failure limit has been reached
+        """
+        if self.tripped:
+            raise EvaluationError("Evaluation aborted after repeated LLM failures")
+
+    def record(self, ok: bool, what: str) -> None:
+        """Record the outcome of one LLM call.
+
+        Raises:
+            EvaluationError: If too many calls in a row have failed
+        """
+        with self._lock:
+            if ok:
+                self._consecutive = 0
+                return
+            self.total += 1
+            self._consecutive += 1
+            if self.tripped:
+                raise EvaluationError(
+                    f"Aborting evaluation after {self._consecutive} consecutive LLM failures "
+                    f"(last: {what})"
+                )
+
+
+def _eval_one(
+    llm_client,
+    example: dict[str, Any],
+    search_results: list[SearchResult],
+    cache_dir: Path | None = None,
+    judge_memo: _JudgeMemo | None = None,
+    failures: _FailureTracker | None = None,
+    keep_contexts: bool = False,
+    context_max_chars: int = 400,
+    lexical_shortcut: bool = False,
+) -> dict[str, Any]:
+    """Generate and judge a single evaluation example from its retrieved results."""
+    question = example["question"]
+    ground_truth = example["ground_truth"]
+    expected_source = example["expected_source"]
     
-    for example in eval_data:
-        question = example["question"]
-        ground_truth = example["ground_truth"]
-        expected_source = example["expected_source"]
-        
-        # Retrieve contexts
-        search_results = search_engine.search(query=question, top_k=top_k)
-        contexts = [r.content for r in search_results]
-        sources = [Path(r.source).name if r.source else "" for r in search_results]
-        
-        # Generate answer using LLM
-        context_text = "\n\n".join(contexts)
-        generation_prompt = f"""Based on the following context, answer the question concisely.
+    if not search_results:
+        # Nothing retrieved: any answer would be ungrounded, so skip the LLM
+        return {
+            "question": question,
+            "answer": "",
+            "ground_truth": ground_truth,
+            "contexts": [] if keep_contexts else None,
+            "expected_source": expected_source,
+            "hit": False,
+            "faithfulness": 0.0,
+            "answer_relevancy": 0.0,
+            "context_precision": 0.0,
+        }
+    
+    if failures:
+        failures.check()
+    
+    contexts = [r.content for r in search_results]
+    sources = [os.path.basename(r.source) if r.source else "" for r in search_results]
+    
+    # Generate answer using LLM
+    context_text = "\n\n".join(contexts)
+    generation_prompt = f"""Based on the following context, answer the question concisely.
 
 Context:
 {context_text}
@@ -117,64 +312,205 @@ Context:
 Question: {question}
 
 Answer:"""
-        
-        try:
-            answer = llm_client.generate(generation_prompt, temperature=0.1, max_tokens=200)
-        except Exception as e:
-            answer = f"Error: {e}"
-        
-        # Judge faithfulness (is answer grounded in context?)
-        faithfulness_prompt = f"""Judge if the answer is fully supported by the context.
+    
+    generated = True
+    try:
+        answer = _cached_generate(
+            llm_client, generation_prompt, "generation", cache_dir,
+            temperature=0.1, max_tokens=150,
+        )
+    except Exception as e:
+        logger.warning(f"Generation failed for {question!r}: {e}")
+        answer = f"Error: {e}"
+        generated = False
+    if failures:
+        failures.record(generated, "generation")
+    
+    lexical = _lexical_overlap(answer, ground_truth) if generated and lexical_shortcut else None
+    shortcut = lexical is not None and (
+        lexical >= LEXICAL_MATCH_THRESHOLD or lexical <= LEXICAL_MISMATCH_THRESHOLD
+    )
+    
+    memo_key = _JudgeMemo.key(context_text, question, answer) if judge_memo else ""
+    judged = judge_memo.get(memo_key) if judge_memo and generated and not shortcut else None
+    
+    if not generated:
+        # Generation failed, so there is no answer to judge
+        faithfulness, relevancy = 0.0, 0.0
+    elif shortcut and lexical is not None:
+        # Clear lexical match or miss against the ground truth: skip the judge
+        faithfulness = relevancy = 1.0 if lexical >= LEXICAL_MATCH_THRESHOLD else 0.0
+        if judge_memo:
+            judge_memo.record_shortcut()
+    elif judged is not None:
+        faithfulness, relevancy = judged
+    else:
+        # Judge faithfulness (is answer grounded in context?) and answer relevancy
+        # (does answer address the question?) in a single call
+        judge_prompt = f"""Judge the answer below.
 
 Context:
 {context_text}
 
+Question: {question}
 Answer: {answer}
 
-Rate faithfulness from 0 to 1 (1 = fully grounded). Reply with just a number."""
+Rate faithfulness from 0 to 1 (1 = fully supported by the context) and
+relevancy from 0 to 1 (1 = fully addresses the question).
+Return ONLY compact JSON: {{"faithfulness":<0..1>,"relevancy":<0..1>}}"""
+        
+        try:
+            verdict = _cached_generate(
+                llm_client, judge_prompt, "judge", cache_dir,
+                temperature=0, max_tokens=24, stop=["\n"],
+            )
+        except Exception as e:
+            logger.warning(f"Judge request failed: {e}")
+            verdict = None
         
+        # Unparseable or failed verdicts score neutral
         try:
-            faithfulness = float(llm_client.generate(faithfulness_prompt, temperature=0, max_tokens=10))
-        except:
-            faithfulness = 0.5
+            faithfulness, relevancy = _parse_judge_scores(verdict or "")
+            judge_ok = True
+        except ValueError:
+            faithfulness, relevancy = 0.5, 0.5
+            judge_ok = False
+        if failures:
+            failures.record(judge_ok, "judge")
         
-        # Judge answer relevancy (does answer address the question?)
-        relevancy_prompt = f"""Judge if the answer addresses the question.
+        if judge_memo and verdict is not None:
+            judge_memo.put(memo_key, (faithfulness, relevancy))
+    
+    # Context precision (was expected source retrieved?)
+    hit_position = 0
+    for i, source in enumerate(sources):
+        if source == expected_source:
+            hit_position = i + 1
+            break
+    hit = hit_position > 0
+    context_precision = 1.0 / hit_position if hit else 0.0
+    
+    return {
+        "question": question,
+        "answer": answer,
+        "ground_truth": ground_truth,
+        # First 2 contexts, truncated, only when asked for
+        "contexts": [c[:context_max_chars] for c in contexts[:2]] if keep_contexts else None,
+        "expected_source": expected_source,
+        "hit": hit,
+        "faithfulness": faithfulness,
+        "answer_relevancy": relevancy,
+        "context_precision": context_precision,
+    }
 
-Question: {question}
-Answer: {answer}
 
-Rate relevancy from 0 to 1 (1 = fully addresses question). Reply with just a number."""
-        
-        try:
-            relevancy = float(llm_client.generate(relevancy_prompt, temperature=0, max_tokens=10))
-        except:
-            relevancy = 0.5
+def evaluate_with_llm(
+    search_engine,
+    llm_client,
+    eval_data: Iterable[dict[str, Any]],
+    top_k: int = 5,
+    max_workers: int = 16,
+    cache: bool = True,
+    cache_dir: Path | None = None,
+    keep_contexts: bool = False,
+    context_max_chars: int = 400,
+    max_consecutive_failures: int | None = 5,
+    show_progress: bool = True,
+    lexical_shortcut: bool = False,
+) -> dict[str, Any]:
+    """Evaluate RAG with LLM as judge (RAGAS-style).
+    
+    Examples are evaluated concurrently on a thread pool, since the run is
+    bound by LLM round-trip latency rather than local compute.
+    
+    Args:
+        search_engine: Search engine to evaluate
+        llm_client: LLM client for generating answers and judging
+        eval_data: Evaluation dataset (any iterable, e.g. iter_extended_eval_dataset())
+        top_k: Number of results to retrieve
+        max_workers: Maximum examples evaluated at once
+        cache: Reuse LLM responses from earlier runs (disable for CI)
+        cache_dir: Response cache directory (default: ~/.nexus/cache/judge)
+        keep_contexts: Include the first 2 retrieved contexts in each detail
+            record (None otherwise, keeping reports small)
+        context_max_chars: Characters kept per context when keep_contexts is set
+        max_consecutive_failures: Abort after this many LLM calls in a row fail
+            or return unparseable scores (None to never abort)
+        show_progress: Show a progress bar with a live LLM failure count
+        lexical_shortcut: Score answers that clearly match or miss the ground
+            truth lexically without the judge (needs rapidfuzz). Faithfulness
+            is then taken from the ground truth rather than the context, so
+            this trades accuracy for fewer judge calls
         
-        # Context precision (was expected source retrieved?)
-        hit = expected_source in sources
-        hit_position = sources.index(expected_source) + 1 if hit else 0
-        context_precision = 1.0 / hit_position if hit else 0.0
+    Returns:
+        Evaluation results with metrics
         
-        results.append({
-            "question": question,
-            "answer": answer,
-            "ground_truth": ground_truth,
-            "contexts": contexts[:2],  # Store first 2 for brevity
-            "expected_source": expected_source,
-            "hit": hit,
-            "faithfulness": faithfulness,
-            "answer_relevancy": relevancy,
-            "context_precision": context_precision,
-        })
-    
-    # Aggregate metrics
-    n = len(results)
+    Raises:
+        EvaluationError: If max_consecutive_failures is reached
+    """
+    response_cache = (cache_dir or DEFAULT_CACHE_DIR) if cache else None
+    
+    # Retrieve contexts for every question with one batched embedding pass
+    examples = list(eval_data)
+    all_results = search_engine.search_many(
+        [example["question"] for example in examples], top_k=top_k
+    )
+    
+    judge_memo = _JudgeMemo()
+    failures = _FailureTracker(max_consecutive_failures)
+    
+    with (
+        ThreadPoolExecutor(max_workers=max_workers) as pool,
+        Progress(
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            MofNCompleteColumn(),
+            disable=not show_progress,
+        ) as progress,
+    ):
+        futures = {
+            pool.submit(
+                _eval_one, llm_client, example, search_results, response_cache, judge_memo,
+                failures, keep_contexts, context_max_chars, lexical_shortcut,
+            ): i
+            for i, (example, search_results) in enumerate(zip(examples, all_results, strict=True))
+        }
+        task = progress.add_task("RAGAS eval", total=len(futures))
+        n = len(futures)
+        results: list[dict[str, Any] | None] = [None] * n
+        # Score columns filled as examples complete, averaged once at the end
+        scores = {name: np.zeros(n) for name in _SCORE_COLUMNS}
+        for future in as_completed(futures):
+            i = futures[future]
+            try:
+                result = future.result()
+            except EvaluationError:
+                pool.shutdown(wait=False, cancel_futures=True)
+                raise
+            results[i] = result
+            for name, column in scores.items():
+                column[i] = result[name]
+            progress.update(
+                task, advance=1, description=f"RAGAS eval ({failures.total} LLM failures)"
+            )
+    
+    if failures.total:
+        logger.warning(f"{failures.total} LLM calls failed; their examples used fallback scores")
+    if judge_memo.shortcuts:
+        logger.info(f"Lexical shortcut: {judge_memo.shortcuts} examples scored without the judge")
+    lookups = judge_memo.hits + judge_memo.misses
+    if lookups:
+        logger.info(
+            f"Judge memo: {judge_memo.hits}/{lookups} repeated inputs reused "
+            f"({judge_memo.hits / lookups:.0%})"
+        )
+    
+    means = {name: float(column.mean()) if n else 0.0 for name, column in scores.items()}
     metrics = {
-        "hit_rate": sum(1 for r in results if r["hit"]) / n,
-        "avg_faithfulness": sum(r["faithfulness"] for r in results) / n,
-        "avg_answer_relevancy": sum(r["answer_relevancy"] for r in results) / n,
-        "avg_context_precision": sum(r["context_precision"] for r in results) / n,
+        "hit_rate": means["hit"],
+        "avg_faithfulness": means["faithfulness"],
+        "avg_answer_relevancy": means["answer_relevancy"],
+        "avg_context_precision": means["context_precision"],
         "num_queries": n,
     }
     
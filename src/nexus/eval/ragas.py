@@ -1,15 +1,37 @@
 """RAGAS evaluation for Nexus RAG system."""
 
+import functools
 import json
+import os
+import time
+from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 from loguru import logger
 
+try:
+    import orjson
 
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from rich.console import Console
+    from rich.table import Table
+
+    RICH_AVAILABLE = True
+except ImportError:
+    RICH_AVAILABLE = False
+
+
+@functools.cache
 def create_eval_dataset() -> list[dict[str, Any]]:
     """Create evaluation dataset with questions and ground truth.
     
+    The same list is returned on every call, so callers must not mutate it.
+    
     Returns:
         List of evaluation examples with question, ground_truth, and expected contexts.
     """
@@ -83,24 +105,39 @@ def evaluate_retrieval(
         Dictionary with evaluation metrics
     """
     results = []
+    hits = 0
+    mrr_sum = 0.0
+    score_sum = 0.0
+    
+    # Embed every question in one batch, then search each
+    all_results = search_engine.search_many(
+        [example["question"] for example in eval_data], top_k=top_k
+    )
     
-    for example in eval_data:
+    for example, search_results in zip(eval_data, all_results, strict=True):
         question = example["question"]
         expected_source = example["expected_source"]
         
-        # Perform search
-        search_results = search_engine.search(query=question, top_k=top_k)
-        
         # Check if expected source is in results
         retrieved_sources = [
-            Path(r.source).name if r.source else "" 
+            os.path.basename(r.source) if r.source else "" 
             for r in search_results
         ]
         
         # Calculate metrics
-        hit = expected_source in retrieved_sources
-        hit_position = retrieved_sources.index(expected_source) + 1 if hit else 0
+        hit_position = 0
+        for i, source in enumerate(retrieved_sources):
+            if source == expected_source:
+                hit_position = i + 1
+                break
+        hit = hit_position > 0
         mrr = 1.0 / hit_position if hit else 0.0
+        top_score = search_results[0].relevance_score if search_results else 0.0
+        
+        # Accumulate aggregates as we go
+        hits += hit
+        mrr_sum += mrr
+        score_sum += top_score
         
         results.append({
             "question": question,
@@ -109,19 +146,16 @@ def evaluate_retrieval(
             "hit@k": hit,
             "hit_position": hit_position,
             "mrr": mrr,
-            "top_score": search_results[0].relevance_score if search_results else 0.0,
+            "top_score": top_score,
         })
     
-    # Aggregate metrics
-    hit_rate = sum(1 for r in results if r["hit@k"]) / len(results)
-    avg_mrr = sum(r["mrr"] for r in results) / len(results)
-    avg_score = sum(r["top_score"] for r in results) / len(results)
+    n = len(results) or 1
     
     return {
         "metrics": {
-            "hit_rate@k": hit_rate,
-            "mrr": avg_mrr,
-            "avg_top_score": avg_score,
+            "hit_rate@k": hits / n,
+            "mrr": mrr_sum / n,
+            "avg_top_score": score_sum / n,
             "num_queries": len(results),
         },
         "details": results,
@@ -141,14 +175,18 @@ def run_ragas_evaluation(
     Returns:
         Evaluation results with metrics
     """
-    from datetime import datetime
-    
     eval_data = create_eval_dataset()
     
     logger.info(f"Running RAGAS evaluation with {len(eval_data)} queries")
     
     # Basic retrieval evaluation (doesn't require LLM)
+    start = time.perf_counter()
     retrieval_results = evaluate_retrieval(search_engine, eval_data)
+    elapsed = time.perf_counter() - start
+    logger.info(
+        f"Evaluated {len(eval_data)} queries in {elapsed:.2f}s "
+        f"({elapsed / max(len(eval_data), 1) * 1000:.1f} ms/query)"
+    )
     
     # Format results
     report = {
@@ -162,10 +200,32 @@ def run_ragas_evaluation(
     return report
 
 
+def save_evaluation_report(report: dict[str, Any], output_path: Path) -> None:
+    """Write an evaluation report to a JSON file.
+
+    Uses orjson when installed, falling back to the standard library.
+
+    Args:
+        report: Evaluation report
+        output_path: Destination file
+    """
+    if ORJSON_AVAILABLE:
+        output_path.write_bytes(
+            orjson.dumps(
+                report,
+                default=str,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC,
+            )
+        )
+    else:
+        with open(output_path, "w") as f:
+            json.dump(report, f, indent=2, default=str)
+
+
 def print_evaluation_report(report: dict[str, Any]) -> None:
     """Print evaluation report to console."""
-    from rich.console import Console
-    from rich.table import Table
+    if not RICH_AVAILABLE:
+        raise ImportError("rich not installed. Run: pip install rich")
     
     console = Console()
     
@@ -197,7 +257,7 @@ def print_evaluation_report(report: dict[str, Any]) -> None:
     for i, r in enumerate(report["per_query"], 1):
         hit_str = "✓" if r["hit@k"] else "✗"
         pos_str = str(r["hit_position"]) if r["hit_position"] > 0 else "-"
-        expected = Path(r["expected_source"]).stem[:15]
+        expected = r["expected_source"].rsplit(".", 1)[0][:15]
         question = r["question"][:37] + "..." if len(r["question"]) > 40 else r["question"]
         
         results.add_row(str(i), question, expected, hit_str, pos_str)
@@ -208,7 +268,7 @@ def print_evaluation_report(report: dict[str, Any]) -> None:
 if __name__ == "__main__":
     # CLI for running evaluation
     import typer
-    from pathlib import Path
+    from rich.progress import Progress, SpinnerColumn, TextColumn
     
     from nexus.config import load_config
     from nexus.rag.embedder import Embedder
@@ -224,9 +284,6 @@ if __name__ == "__main__":
         output_path: Path = typer.Option(None, "--output", "-o", help="Save results to JSON"),
     ):
         """Run RAGAS evaluation on the knowledge base."""
-        from rich.console import Console
-        from rich.progress import Progress, SpinnerColumn, TextColumn
-        
         console = Console()
         config_path = Path("~/.nexus/config.yaml").expanduser()
         
@@ -243,12 +300,17 @@ if __name__ == "__main__":
         ) as progress:
             task = progress.add_task("Loading embedding model...", total=None)
             
-            embedder = Embedder(model_name=config.embedding.model)
+            embedder = Embedder(
+                model_name=config.embedding.model,
+                backend=config.embedding.backend,
+                model_file=config.embedding.model_file,
+            )
             metadata_store = MetadataStore(config.storage.metadata_db)
             vector_store = VectorStore(
                 collection_name=config.storage.collection_name,
                 path=config.storage.qdrant_path,
                 embedding_dim=embedder.dimension,
+                quantize=config.storage.quantize_vectors,
             )
             
             progress.update(task, description="Building BM25 index...")
@@ -270,8 +332,7 @@ if __name__ == "__main__":
         print_evaluation_report(report)
         
         if output_path:
-            with open(output_path, "w") as f:
-                json.dump(report, f, indent=2, default=str)
+            save_evaluation_report(report, output_path)
             console.print(f"\n[green]Results saved to {output_path}[/green]")
         
         metadata_store.close()
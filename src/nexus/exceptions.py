@@ -4,34 +4,40 @@
 class NexusError(Exception):
     """Base exception for all Nexus errors."""
 
-    pass
+    __slots__ = ()
 
 
 class ConfigError(NexusError):
     """Configuration-related errors."""
 
-    pass
+    __slots__ = ()
 
 
 class StorageError(NexusError):
     """Storage operation errors."""
 
-    pass
+    __slots__ = ()
 
 
 class IngestionError(NexusError):
     """Content ingestion errors."""
 
-    pass
+    __slots__ = ()
 
 
 class SearchError(NexusError):
     """Search operation errors."""
 
-    pass
+    __slots__ = ()
 
 
 class SourceNotFoundError(NexusError):
     """Requested source does not exist."""
 
-    pass
+    __slots__ = ()
+
+
+class EvaluationError(NexusError):
+    """Evaluation run errors."""
+
+    __slots__ = ()
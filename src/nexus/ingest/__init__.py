@@ -1,7 +1,46 @@
-"""Nexus ingestion package."""
+"""Nexus ingestion package.
 
-from nexus.ingest.chunker import ChunkInfo, TextChunker
-from nexus.ingest.loader import MarkdownLoader, ParsedDocument
-from nexus.ingest.pipeline import IngestionPipeline
+Submodules are imported on first attribute access (PEP 562), so importing
+one component does not pull in the others and their dependencies.
+"""
 
-__all__ = ["MarkdownLoader", "ParsedDocument", "TextChunker", "ChunkInfo", "IngestionPipeline"]
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from nexus.ingest.batcher import EmbeddingBatcher
+    from nexus.ingest.chunker import ChunkInfo, TextChunker
+    from nexus.ingest.loader import MarkdownLoader, ParsedDocument
+    from nexus.ingest.pipeline import IngestionPipeline
+
+__all__ = [
+    "MarkdownLoader",
+    "ParsedDocument",
+    "TextChunker",
+    "ChunkInfo",
+    "IngestionPipeline",
+    "EmbeddingBatcher",
+]
+
+# Public name -> defining module
+_LAZY = {
+    "MarkdownLoader": "nexus.ingest.loader",
+    "ParsedDocument": "nexus.ingest.loader",
+    "TextChunker": "nexus.ingest.chunker",
+    "ChunkInfo": "nexus.ingest.chunker",
+    "IngestionPipeline": "nexus.ingest.pipeline",
+    "EmbeddingBatcher": "nexus.ingest.batcher",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
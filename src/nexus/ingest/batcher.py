@@ -0,0 +1,129 @@
+"""Coalescing of concurrent embedding requests into shared batches."""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import TYPE_CHECKING
+
+from loguru import logger
+
+if TYPE_CHECKING:
+    from nexus.rag.embedder import Embedder
+
+
+class EmbeddingBatcher:
+    """Batch ``embed_texts`` calls from concurrent callers into shared forward passes.
+
+    Requests are queued and a background thread embeds them together, waiting
+    up to ``max_wait_ms`` after the first request for others to arrive or until
+    ``max_batch`` texts are queued. The thread stops when idle and is started
+    again by the next request.
+    """
+
+    def __init__(
+        self,
+        embedder: "Embedder",
+        max_batch: int = 128,
+        max_wait_ms: float = 20.0,
+        idle_timeout: float = 5.0,
+    ) -> None:
+        """Initialize batcher.
+
+        Args:
+            embedder: Embedding service to batch calls to
+            max_batch: Texts that trigger a batch without waiting further
+            max_wait_ms: How long the first request waits for company
+            idle_timeout: Seconds without requests before the worker exits
+        """
+        self.embedder = embedder
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self.idle_timeout = idle_timeout
+        self._queue: queue.SimpleQueue[tuple[list[str], Future[list[list[float]]]]] = (
+            queue.SimpleQueue()
+        )
+        self._lock = threading.Lock()
+        self._worker: threading.Thread | None = None
+
+    def submit(self, texts: list[str]) -> Future[list[list[float]]]:
+        """Queue texts for embedding.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            Future resolving to one embedding per text
+        """
+        future: Future[list[list[float]]] = Future()
+        if not texts:
+            future.set_result([])
+            return future
+
+        with self._lock:
+            self._queue.put((texts, future))
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run, name="embedding-batcher", daemon=True
+                )
+                self._worker.start()
+        return future
+
+    def embed_texts(self, texts: list[str]) -> list[list[float]]:
+        """Embed texts, sharing a batch with any concurrent callers.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            List of embedding vectors
+        """
+        return self.submit(texts).result()
+
+    def _run(self) -> None:
+        """Worker loop: collect requests into batches and embed them."""
+        while True:
+            try:
+                first = self._queue.get(timeout=self.idle_timeout)
+            except queue.Empty:
+                with self._lock:
+                    # submit() enqueues under the lock, so nothing can slip in here
+                    if self._queue.empty():
+                        self._worker = None
+                        return
+                continue
+
+            batch = [first]
+            size = len(first[0])
+            deadline = time.monotonic() + self.max_wait
+            while size < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    request = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                batch.append(request)
+                size += len(request[0])
+
+            self._embed_batch(batch)
+
+    def _embed_batch(
+        self, batch: list[tuple[list[str], Future[list[list[float]]]]]
+    ) -> None:
+        """Embed all texts of a batch in one call and hand each caller its slice."""
+        texts = [text for request_texts, _ in batch for text in request_texts]
+        try:
+            embeddings = self.embedder.embed_texts(texts)
+        except Exception as e:
+            for _, future in batch:
+                future.set_exception(e)
+            return
+
+        if len(batch) > 1:
+            logger.debug(f"Embedded {len(texts)} texts from {len(batch)} requests in one batch")
+        offset = 0
+        for request_texts, future in batch:
+            future.set_result(embeddings[offset:offset + len(request_texts)])
+            offset += len(request_texts)
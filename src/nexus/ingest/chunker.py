@@ -1,13 +1,15 @@
 """Text chunking strategies."""
 
+import math
 import re
+from bisect import bisect_left
 from dataclasses import dataclass
 from typing import Iterator
 
 from loguru import logger
 
 
-@dataclass
+@dataclass(slots=True)
 class ChunkInfo:
     """Information about a chunk."""
 
@@ -17,14 +19,41 @@ class ChunkInfo:
     heading: str | None = None
 
 
+# Sentence-ending punctuation and the whitespace after it
+_SENTENCE_END_RE = re.compile(r"[.!?]\s+")
+
+
+def _split_sentences(text: str) -> list[str]:
+    r"""Split text after sentence-ending punctuation followed by whitespace.
+
+    Same result as ``re.split(r"(?<=[.!?])\s+", text)``, but matching from the
+    punctuation lets the regex engine skip ahead to candidate characters
+    instead of testing a lookbehind at every position.
+    """
+    sentences: list[str] = []
+    start = 0
+    for match in _SENTENCE_END_RE.finditer(text):
+        sentences.append(text[start : match.start() + 1])
+        start = match.end()
+    sentences.append(text[start:])
+    return sentences
+
+
 class TextChunker:
     """Chunk text into semantic segments."""
 
+    STRATEGIES = ("sentence", "hierarchical")
+
+    _PARA_RE = re.compile(r"\n\s*\n")
+
     def __init__(
         self,
         chunk_size: int = 512,
         chunk_overlap: int = 50,
         min_chunk_size: int = 100,
+        strategy: str = "sentence",
+        max_depth: int = 4,
+        overlap_ratio: float = 0.5,
     ) -> None:
         """Initialize chunker.
 
@@ -32,10 +61,24 @@ class TextChunker:
             chunk_size: Target chunk size in characters
             chunk_overlap: Overlap between chunks
             min_chunk_size: Minimum chunk size
+            strategy: How text without headings and oversized sections are
+                split: "sentence" (greedy sentences with overlap) or
+                "hierarchical" (balanced binary split over paragraphs)
+            max_depth: Maximum binary split depth for the hierarchical strategy
+            overlap_ratio: Share of each neighbouring leaf that a hierarchical
+                overlap chunk takes (0 disables overlap chunks)
+
+        Raises:
+            ValueError: If the strategy is unknown
         """
+        if strategy not in self.STRATEGIES:
+            raise ValueError(f"Unknown chunking strategy: {strategy}")
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
         self.min_chunk_size = min_chunk_size
+        self.strategy = strategy
+        self.max_depth = max_depth
+        self.overlap_ratio = overlap_ratio
 
     def chunk_text(
         self,
@@ -56,13 +99,24 @@ class TextChunker:
         Returns:
             List of ChunkInfo objects
         """
-        lines = text.split("\n")
         chunks: list[ChunkInfo] = []
 
         # If no headings, chunk by paragraphs
         if not headings:
+            if self.strategy == "hierarchical":
+                return self._chunk_hierarchical(text, 1, None)
             return self._chunk_by_paragraphs(text)
 
+        # line_starts[i] is the offset of line i + 1; the sentinel past the end
+        # lets a section be sliced out of text without splitting it into lines
+        line_starts = [0]
+        pos = text.find("\n")
+        while pos != -1:
+            line_starts.append(pos + 1)
+            pos = text.find("\n", pos + 1)
+        line_count = len(line_starts)
+        line_starts.append(len(text) + 1)
+
         # Sort headings by line number
         sorted_headings = sorted(headings, key=lambda h: h[2])
 
@@ -74,7 +128,7 @@ class TextChunker:
             if i + 1 < len(sorted_headings):
                 end_line = sorted_headings[i + 1][2] - 1
             else:
-                end_line = len(lines)
+                end_line = line_count
 
             sections.append((line_num, end_line, heading_text))
 
@@ -84,8 +138,11 @@ class TextChunker:
 
         # Chunk each section
         for start_line, end_line, heading in sections:
-            section_lines = lines[start_line - 1 : end_line]
-            section_text = "\n".join(section_lines)
+            # Same lines as slicing a list of lines, out-of-range bounds included
+            first, last, _ = slice(start_line - 1, end_line).indices(line_count)
+            section_text = (
+                text[line_starts[first] : line_starts[last] - 1] if last > first else ""
+            )
 
             if len(section_text) <= self.chunk_size:
                 if len(section_text.strip()) >= self.min_chunk_size:
@@ -99,18 +156,21 @@ class TextChunker:
                     )
             else:
                 # Further chunk large sections
-                sub_chunks = self._chunk_large_text(
-                    section_text, start_line, heading
-                )
+                if self.strategy == "hierarchical":
+                    sub_chunks = self._chunk_hierarchical(section_text, start_line, heading)
+                else:
+                    sub_chunks = self._chunk_large_text(section_text, start_line, heading)
                 chunks.extend(sub_chunks)
 
         return chunks
 
     def _chunk_by_paragraphs(self, text: str) -> list[ChunkInfo]:
         """Chunk text by paragraphs when no headings are available."""
-        paragraphs = re.split(r"\n\s*\n", text)
+        paragraphs = self._PARA_RE.split(text)
         chunks: list[ChunkInfo] = []
-        current_chunk = ""
+        # Pieces of the current chunk and their total length; joined only on emit
+        buf: list[str] = []
+        buf_len = 0
         current_start = 1
         line_count = 1
 
@@ -121,33 +181,36 @@ class TextChunker:
 
             para_lines = para.count("\n") + 1
 
-            if len(current_chunk) + len(para) <= self.chunk_size:
-                if current_chunk:
-                    current_chunk += "\n\n" + para
+            if buf_len + len(para) <= self.chunk_size:
+                if buf:
+                    buf.append("\n\n")
+                    buf_len += 2
                 else:
-                    current_chunk = para
                     current_start = line_count
+                buf.append(para)
+                buf_len += len(para)
             else:
                 # Save current chunk
-                if len(current_chunk) >= self.min_chunk_size:
+                if buf_len >= self.min_chunk_size:
                     chunks.append(
                         ChunkInfo(
-                            content=current_chunk,
+                            content="".join(buf),
                             start_line=current_start,
                             end_line=line_count - 1,
                             heading=None,
                         )
                     )
-                current_chunk = para
+                buf = [para]
+                buf_len = len(para)
                 current_start = line_count
 
             line_count += para_lines + 1  # +1 for blank line
 
         # Add final chunk
-        if current_chunk and len(current_chunk) >= self.min_chunk_size:
+        if buf and buf_len >= self.min_chunk_size:
             chunks.append(
                 ChunkInfo(
-                    content=current_chunk,
+                    content="".join(buf),
                     start_line=current_start,
                     end_line=line_count,
                     heading=None,
@@ -164,51 +227,173 @@ class TextChunker:
     ) -> list[ChunkInfo]:
         """Chunk large text by sentences with overlap."""
         # Split into sentences
-        sentences = re.split(r"(?<=[.!?])\s+", text)
+        sentences = _split_sentences(text)
         chunks: list[ChunkInfo] = []
 
-        current_chunk = ""
+        # Pieces of the current chunk and their total length; joined only on emit
+        buf: list[str] = []
+        buf_len = 0
+        # Newlines in the current chunk, counted once per appended piece
+        buf_newlines = 0
+        # The current chunk split into sentences, reused for its overlap
+        current_sentences: list[str] = []
         chunk_start = start_line
 
         for sentence in sentences:
-            if len(current_chunk) + len(sentence) <= self.chunk_size:
-                current_chunk += (" " if current_chunk else "") + sentence
+            sentence_newlines = sentence.count("\n")
+            if buf_len + len(sentence) <= self.chunk_size:
+                if buf_len:
+                    buf.append(" ")
+                    buf_len += 1
+                buf.append(sentence)
+                buf_len += len(sentence)
+                buf_newlines += sentence_newlines
+                current_sentences.append(sentence)
             else:
-                if len(current_chunk) >= self.min_chunk_size:
+                current_chunk = "".join(buf)
+                if buf_len >= self.min_chunk_size:
                     chunks.append(
                         ChunkInfo(
                             content=current_chunk.strip(),
                             start_line=chunk_start,
-                            end_line=chunk_start + current_chunk.count("\n"),
+                            end_line=chunk_start + buf_newlines,
                             heading=heading,
                         )
                     )
 
                 # Start new chunk with overlap
-                overlap_text = self._get_overlap(current_chunk)
-                current_chunk = overlap_text + sentence
-                chunk_start += current_chunk.count("\n")
+                overlap_text = self._get_overlap(current_chunk, current_sentences)
+                buf = [overlap_text, sentence]
+                buf_len = len(overlap_text) + len(sentence)
+                buf_newlines = overlap_text.count("\n") + sentence_newlines
+                # A partial-sentence overlap may merge with the new sentence
+                current_sentences = _split_sentences(overlap_text + sentence)
+                chunk_start += buf_newlines
 
         # Add final chunk
-        if current_chunk and len(current_chunk) >= self.min_chunk_size:
+        if buf_len and buf_len >= self.min_chunk_size:
             chunks.append(
                 ChunkInfo(
-                    content=current_chunk.strip(),
+                    content="".join(buf).strip(),
                     start_line=chunk_start,
-                    end_line=chunk_start + current_chunk.count("\n"),
+                    end_line=chunk_start + buf_newlines,
                     heading=heading,
                 )
             )
 
         return chunks
 
-    def _get_overlap(self, text: str) -> str:
-        """Get overlap text from end of chunk."""
+    def _chunk_hierarchical(
+        self,
+        text: str,
+        start_line: int,
+        heading: str | None,
+    ) -> list[ChunkInfo]:
+        """Chunk text by recursively halving its paragraphs.
+
+        Paragraph ranges are split in two at the paragraph boundary closest
+        to the middle by characters, until a range fits ``chunk_size``, holds
+        a single paragraph or ``max_depth`` is reached. Between each pair of
+        neighbouring leaves an overlap chunk takes the last ``overlap_ratio``
+        of the left leaf's paragraphs and the first of the right one's, so L
+        leaves give up to 2L - 1 chunks. Paragraphs are dropped from an
+        overlap until it fits ``chunk_size``, and it is skipped once either
+        side runs out. A leaf still larger than ``chunk_size`` is split by
+        sentences like the "sentence" strategy, and gets no overlap chunks of
+        its own. Recursion works on paragraph indices; text is sliced only
+        once per emitted chunk.
+        """
+        # (start, end) offsets of each non-blank paragraph, whitespace trimmed
+        spans: list[tuple[int, int]] = []
+        pos = 0
+        for end, next_pos in [
+            *((m.start(), m.end()) for m in self._PARA_RE.finditer(text)),
+            (len(text), len(text)),
+        ]:
+            segment = text[pos:end]
+            stripped = segment.strip()
+            if stripped:
+                first = pos + len(segment) - len(segment.lstrip())
+                spans.append((first, first + len(stripped)))
+            pos = next_pos
+        if not spans:
+            return []
+
+        # offsets[i] is where paragraph i starts, with the end of the last
+        # as a sentinel, so a range's size is one subtraction
+        offsets = [start for start, _ in spans]
+        offsets.append(spans[-1][1])
+
+        def split(lo: int, hi: int, depth: int) -> list[tuple[int, int]]:
+            if depth == 0 or hi - lo < 2 or offsets[hi] - offsets[lo] <= self.chunk_size:
+                return [(lo, hi)]
+            middle = (offsets[lo] + offsets[hi]) / 2
+            mid = bisect_left(offsets, middle, lo + 1, hi)
+            if mid > lo + 1 and middle - offsets[mid - 1] < offsets[mid] - middle:
+                mid -= 1
+            mid = min(mid, hi - 1)
+            return split(lo, mid, depth - 1) + split(mid, hi, depth - 1)
+
+        leaves = split(0, len(spans), self.max_depth)
+
+        def oversized(lo: int, hi: int) -> bool:
+            return spans[hi - 1][1] - spans[lo][0] > self.chunk_size
+
+        # (lo, hi, is_leaf) paragraph ranges to emit, in document order
+        ranges: list[tuple[int, int, bool]] = []
+        for i, (lo, hi) in enumerate(leaves):
+            if i and self.overlap_ratio > 0:
+                prev_lo, prev_hi = leaves[i - 1]
+                # Oversized leaves are split by sentences, which overlap already
+                if not (oversized(prev_lo, prev_hi) or oversized(lo, hi)):
+                    tail = math.ceil(self.overlap_ratio * (prev_hi - prev_lo))
+                    head = math.ceil(self.overlap_ratio * (hi - lo))
+                    # Give up paragraphs from the larger side until it fits
+                    while tail and head and oversized(prev_hi - tail, lo + head):
+                        if tail >= head:
+                            tail -= 1
+                        else:
+                            head -= 1
+                    if tail and head:
+                        ranges.append((prev_hi - tail, lo + head, False))
+            ranges.append((lo, hi, True))
+
+        # Offsets of each newline, so an offset's line is one bisect
+        newlines = [m.start() for m in re.finditer("\n", text)]
+
+        chunks: list[ChunkInfo] = []
+        for lo, hi, is_leaf in ranges:
+            begin, end = spans[lo][0], spans[hi - 1][1]
+            if end - begin < self.min_chunk_size:
+                continue
+            first_line = start_line + bisect_left(newlines, begin)
+            # A single long paragraph, or a range left at max_depth
+            if is_leaf and end - begin > self.chunk_size:
+                chunks.extend(self._chunk_large_text(text[begin:end], first_line, heading))
+                continue
+            chunks.append(
+                ChunkInfo(
+                    content=text[begin:end],
+                    start_line=first_line,
+                    end_line=start_line + bisect_left(newlines, end),
+                    heading=heading,
+                )
+            )
+        return chunks
+
+    def _get_overlap(self, text: str, sentences: list[str] | None = None) -> str:
+        """Get overlap text from end of chunk.
+
+        Args:
+            text: Chunk text
+            sentences: ``text`` already split into sentences, if available
+        """
         if len(text) <= self.chunk_overlap:
             return text + " "
 
         # Try to get overlap at sentence boundary
-        sentences = re.split(r"(?<=[.!?])\s+", text)
+        if sentences is None:
+            sentences = _split_sentences(text)
         overlap = ""
         for sentence in reversed(sentences):
             if len(overlap) + len(sentence) <= self.chunk_overlap:
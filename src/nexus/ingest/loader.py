@@ -1,6 +1,11 @@
 """Markdown loader with frontmatter parsing."""
 
+import copy
+import fnmatch
+import os
 import re
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -11,8 +16,104 @@ from loguru import logger
 
 from nexus.exceptions import IngestionError
 
+try:
+    # libyaml-backed loader is much faster; fall back to pure Python
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
 
-@dataclass
+
+def find_files(directory: Path, recursive: bool = True, pattern: str = "*.md") -> list[Path]:
+    """Find files whose name matches a pattern, in sorted order.
+
+    Walks with ``os.scandir`` so file types come from the directory listing
+    instead of a stat per path. Like ``Path.rglob``, symlinked directories
+    are not descended into and unreadable directories are skipped.
+
+    Args:
+        directory: Directory to scan
+        recursive: Whether to scan subdirectories
+        pattern: Glob pattern matched against file names
+
+    Returns:
+        Sorted list of matching file paths
+    """
+    found: list[Path] = []
+    stack = [str(directory)]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive:
+                        stack.append(entry.path)
+                elif fnmatch.fnmatchcase(entry.name, pattern) and entry.is_file():
+                    found.append(Path(entry.path))
+    return sorted(found)
+
+
+def decode_source(raw: bytes) -> str:
+    """Decode file bytes the way text-mode reading would.
+
+    Args:
+        raw: File contents
+
+    Returns:
+        UTF-8 decoded text with universal newlines
+
+    Raises:
+        UnicodeDecodeError: If the bytes are not valid UTF-8
+    """
+    return raw.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+
+
+def _split_frontmatter(content: str) -> tuple[str, str] | None:
+    r"""Split leading ``---`` delimited frontmatter from the body.
+
+    Matches exactly what ``^---\s*\n(.*?)\n---\s*\n`` (DOTALL) would, using
+    ``str.find`` for the closing delimiter. A note that opens with a ``---``
+    rule and has no closing delimiter costs one scan per candidate opening
+    line instead of a regex backtracking through the whole body.
+
+    Args:
+        content: Raw markdown content
+
+    Returns:
+        Tuple of (frontmatter text, body), or None if there is no frontmatter
+    """
+    if not content.startswith("---"):
+        return None
+
+    n = len(content)
+    # Any newline in the whitespace after the opening dashes can end the
+    # opening line; like the regex, try the last one first
+    run_end = 3
+    while run_end < n and content[run_end].isspace():
+        run_end += 1
+    for newline in range(run_end - 1, 2, -1):
+        if content[newline] != "\n":
+            continue
+        start = newline + 1
+        close = content.find("\n---", start)
+        while close != -1:
+            # The closing dashes must be followed by whitespace containing a newline;
+            # the body starts after the last newline of that whitespace
+            body_start = -1
+            pos = close + 4
+            while pos < n and content[pos].isspace():
+                if content[pos] == "\n":
+                    body_start = pos + 1
+                pos += 1
+            if body_start != -1:
+                return content[start:close], content[body_start:]
+            close = content.find("\n---", close + 1)
+    return None
+
+
+@dataclass(slots=True)
 class ParsedDocument:
     """Result of parsing a markdown document."""
 
@@ -28,12 +129,34 @@ class ParsedDocument:
 class MarkdownLoader:
     """Load and parse markdown files with frontmatter."""
 
-    FRONTMATTER_PATTERN = re.compile(r"^---\s*\n(.*?)\n---\s*\n", re.DOTALL)
-    HEADING_PATTERN = re.compile(r"^(#{1,6})\s+(.+)$", re.MULTILINE)
+    # [^\S\n] is whitespace other than newline, so a match never spans lines
+    HEADING_PATTERN = re.compile(r"^(#{1,6})[^\S\n]+(.+)$", re.MULTILINE)
+
+    # Parsed files kept by each loader
+    FILE_CACHE_SIZE = 512
+
+    def __init__(self) -> None:
+        """Initialize loader with an empty parsed-file cache."""
+        self._file_cache: OrderedDict[tuple[str, int, int], ParsedDocument] = OrderedDict()
+        self._file_cache_lock = threading.Lock()
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Worker processes get a loader with an empty cache
+        state = self.__dict__.copy()
+        del state["_file_cache"], state["_file_cache_lock"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._file_cache = OrderedDict()
+        self._file_cache_lock = threading.Lock()
 
     def load_file(self, path: Path) -> ParsedDocument:
         """Load and parse a markdown file.
 
+        Results are memoized by path, mtime and size, so loading an unchanged
+        file again skips parsing; each call returns its own copy.
+
         Args:
             path: Path to markdown file
 
@@ -43,11 +166,37 @@ class MarkdownLoader:
         if not path.exists():
             raise IngestionError(f"File not found: {path}")
 
-        try:
-            content = path.read_text(encoding="utf-8")
-            return self.parse(content)
-        except UnicodeDecodeError as e:
-            raise IngestionError(f"Failed to read file {path}: {e}") from e
+        stat = path.stat()
+        key = (str(path), stat.st_mtime_ns, stat.st_size)
+        with self._file_cache_lock:
+            doc = self._file_cache.get(key)
+            if doc is not None:
+                self._file_cache.move_to_end(key)
+        if doc is None:
+            try:
+                doc = self.parse_bytes(path.read_bytes())
+            except UnicodeDecodeError as e:
+                raise IngestionError(f"Failed to read file {path}: {e}") from e
+            with self._file_cache_lock:
+                self._file_cache[key] = doc
+                while len(self._file_cache) > self.FILE_CACHE_SIZE:
+                    self._file_cache.popitem(last=False)
+        # Tags, metadata and headings are mutable, so callers never share them
+        return copy.deepcopy(doc)
+
+    def parse_bytes(self, raw: bytes) -> ParsedDocument:
+        """Parse markdown from raw file bytes.
+
+        Args:
+            raw: UTF-8 encoded markdown
+
+        Returns:
+            ParsedDocument with content and metadata
+
+        Raises:
+            UnicodeDecodeError: If the bytes are not valid UTF-8
+        """
+        return self.parse(decode_source(raw))
 
     def parse(self, content: str) -> ParsedDocument:
         """Parse markdown content.
@@ -62,22 +211,25 @@ class MarkdownLoader:
         frontmatter: dict[str, Any] = {}
         body = content
 
-        match = self.FRONTMATTER_PATTERN.match(content)
-        if match:
+        split = _split_frontmatter(content)
+        if split:
             try:
-                frontmatter = yaml.safe_load(match.group(1)) or {}
-                body = content[match.end() :]
+                frontmatter = yaml.load(split[0], Loader=SafeLoader) or {}
+                body = split[1]
             except yaml.YAMLError as e:
                 logger.warning(f"Failed to parse frontmatter: {e}")
 
-        # Extract headings
+        # Extract headings in one pass, counting newlines between matches
+        # to recover line numbers
         headings: list[tuple[int, str, int]] = []
-        for i, line in enumerate(body.split("\n"), start=1):
-            heading_match = re.match(r"^(#{1,6})\s+(.+)$", line)
-            if heading_match:
-                level = len(heading_match.group(1))
-                text = heading_match.group(2).strip()
-                headings.append((level, text, i))
+        line_num = 1
+        last_pos = 0
+        for heading_match in self.HEADING_PATTERN.finditer(body):
+            line_num += body.count("\n", last_pos, heading_match.start())
+            last_pos = heading_match.start()
+            level = len(heading_match.group(1))
+            text = heading_match.group(2).strip()
+            headings.append((level, text, line_num))
 
         # Extract metadata
         title = frontmatter.get("title")
@@ -132,15 +284,13 @@ class MarkdownLoader:
             raise IngestionError(f"Directory not found: {directory}")
 
         results: list[tuple[Path, ParsedDocument]] = []
-        glob_func = directory.rglob if recursive else directory.glob
-
-        for path in sorted(glob_func(pattern)):
-            if path.is_file():
-                try:
-                    doc = self.load_file(path)
-                    results.append((path, doc))
-                except IngestionError as e:
-                    logger.warning(f"Skipping {path}: {e}")
+
+        for path in find_files(directory, recursive=recursive, pattern=pattern):
+            try:
+                doc = self.load_file(path)
+                results.append((path, doc))
+            except IngestionError as e:
+                logger.warning(f"Skipping {path}: {e}")
 
         logger.info(f"Loaded {len(results)} documents from {directory}")
         return results
@@ -1,22 +1,72 @@
 """Document ingestion pipeline."""
 
 import hashlib
+import multiprocessing
+import os
 import uuid
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from loguru import logger
 
 from nexus.config import Config
 from nexus.exceptions import IngestionError
+from nexus.ingest.batcher import EmbeddingBatcher
 from nexus.ingest.chunker import ChunkInfo, TextChunker
-from nexus.ingest.loader import MarkdownLoader, ParsedDocument
+from nexus.ingest.loader import MarkdownLoader, ParsedDocument, decode_source, find_files
 from nexus.models.document import Chunk, ChunkMetadata, Document
 from nexus.models.source import Source, SourceType
-from nexus.rag.embedder import Embedder
 from nexus.storage.metadata import MetadataStore
-from nexus.storage.vectors import VectorStore
+
+if TYPE_CHECKING:
+    # Keep torch and qdrant out of the import graph of spawned parser workers
+    from nexus.rag.embedder import Embedder
+    from nexus.storage.vectors import VectorStore
+
+
+# Below this many changed files, spawning worker processes costs more than it saves
+MIN_PARALLEL_FILES = 32
+
+# Number of files whose chunks are embedded together in one call
+EMBED_FILE_BATCH = 64
+
+# Chunk metadata copied into each vector's payload
+_PAYLOAD_KEYS = ("source_path", "source_type", "heading", "title", "tags")
+_payload_values = attrgetter(*(f"metadata.{key}" for key in _PAYLOAD_KEYS))
+
+
+def _read_source(path: Path) -> tuple[str, str]:
+    """Read a file and hash its decoded text.
+
+    The hash is MD5 of the text with universal newlines, as stored for every
+    indexed document, so it never depends on which optional packages are
+    installed and matches existing rows.
+
+    Args:
+        path: File to read
+
+    Returns:
+        Tuple of (decoded text with universal newlines, content hash)
+
+    Raises:
+        OSError: If the file cannot be read
+        UnicodeDecodeError: If the file is not valid UTF-8
+    """
+    content = decode_source(path.read_bytes())
+    return content, hashlib.md5(content.encode()).hexdigest()
+
+
+def _parse_and_chunk(
+    content: str,
+    loader: MarkdownLoader,
+    chunker: TextChunker,
+) -> tuple[ParsedDocument, list[ChunkInfo]]:
+    """Parse markdown and chunk it (module-level so worker processes can run it)."""
+    parsed = loader.parse(content)
+    return parsed, chunker.chunk_text(parsed.content, parsed.headings)
 
 
 class IngestionPipeline:
@@ -24,11 +74,12 @@ class IngestionPipeline:
 
     def __init__(
         self,
-        embedder: Embedder,
+        embedder: "Embedder",
         metadata_store: MetadataStore,
-        vector_store: VectorStore,
+        vector_store: "VectorStore",
         chunker: TextChunker | None = None,
         loader: MarkdownLoader | None = None,
+        batcher: EmbeddingBatcher | None = None,
     ) -> None:
         """Initialize ingestion pipeline.
 
@@ -38,12 +89,15 @@ class IngestionPipeline:
             vector_store: Vector storage
             chunker: Text chunker (default: TextChunker())
             loader: Markdown loader (default: MarkdownLoader())
+            batcher: Shares embedding batches between concurrent ingests
+                (default: EmbeddingBatcher(embedder))
         """
         self.embedder = embedder
         self.metadata_store = metadata_store
         self.vector_store = vector_store
         self.chunker = chunker or TextChunker()
         self.loader = loader or MarkdownLoader()
+        self.batcher = batcher or EmbeddingBatcher(embedder)
 
     def ingest_file(self, path: Path) -> Document | None:
         """Ingest a single file.
@@ -54,19 +108,153 @@ class IngestionPipeline:
         Returns:
             Ingested document or None if skipped
         """
+        # Stat before reading, so a write racing the read is seen next time
+        st = path.stat()
+        if self.metadata_store.fingerprint_matches(str(path), st.st_mtime_ns, st.st_size):
+            logger.debug(f"Skipping unchanged file: {path}")
+            return None
+
         # Compute content hash
-        content = path.read_text(encoding="utf-8")
-        content_hash = hashlib.md5(content.encode()).hexdigest()
+        content, content_hash = _read_source(path)
 
         # Check if already indexed
-        if self.metadata_store.document_exists(str(path), content_hash):
+        if self._content_unchanged(path, content_hash, st):
             logger.debug(f"Skipping unchanged file: {path}")
             return None
 
-        # Parse document
-        parsed = self.loader.parse(content)
+        parsed, chunk_infos = _parse_and_chunk(content, self.loader, self.chunker)
+        doc = self._build_document(path, content_hash, st, parsed, chunk_infos)
+
+        # Generate embeddings and store
+        self._store_document(doc)
+
+        logger.info(f"Ingested {path}: {len(doc.chunks)} chunks")
+        return doc
+
+    def ingest_files(
+        self,
+        paths: list[Path],
+        workers: int | None = None,
+    ) -> list[Document]:
+        """Ingest many files, parsing and chunking them in parallel.
+
+        Stat, reading, hashing and the unchanged-file checks happen in this
+        process; files whose mtime and size match the index are not read.
+        Parsing and chunking of changed files is spread over a process pool,
+        and chunks from a group of files are embedded in one batch. Storage
+        stays in this process since embedded Qdrant cannot be shared.
 
-        # Create document
+        Args:
+            paths: Files to ingest
+            workers: Worker processes for parsing (default: CPU count, 1 disables)
+
+        Returns:
+            List of ingested documents
+        """
+        pending: list[tuple[Path, str, str, os.stat_result]] = []
+        for path in paths:
+            try:
+                st = path.stat()
+                if self.metadata_store.fingerprint_matches(str(path), st.st_mtime_ns, st.st_size):
+                    logger.debug(f"Skipping unchanged file: {path}")
+                    continue
+                content, content_hash = _read_source(path)
+            except (OSError, UnicodeDecodeError) as e:
+                logger.warning(f"Failed to ingest {path}: {e}")
+                continue
+            if self._content_unchanged(path, content_hash, st):
+                logger.debug(f"Skipping unchanged file: {path}")
+                continue
+            pending.append((path, content, content_hash, st))
+
+        if not pending:
+            return []
+
+        workers = workers or os.cpu_count() or 1
+        if workers > 1 and len(pending) >= MIN_PARALLEL_FILES:
+            # Spawn rather than fork: this process already holds model threads and a Qdrant lock
+            executor = ProcessPoolExecutor(
+                max_workers=min(workers, len(pending)),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        else:
+            executor = None
+
+        docs: list[Document] = []
+        try:
+            if executor is not None:
+                futures = [
+                    executor.submit(_parse_and_chunk, content, self.loader, self.chunker)
+                    for _, content, _, _ in pending
+                ]
+
+            batch: list[Document] = []
+            for i, (path, content, content_hash, st) in enumerate(pending):
+                try:
+                    if executor is not None:
+                        parsed, chunk_infos = futures[i].result()
+                    else:
+                        parsed, chunk_infos = _parse_and_chunk(content, self.loader, self.chunker)
+                except Exception as e:
+                    logger.warning(f"Failed to ingest {path}: {e}")
+                    continue
+
+                batch.append(self._build_document(path, content_hash, st, parsed, chunk_infos))
+                if len(batch) >= EMBED_FILE_BATCH:
+                    docs.extend(self._embed_and_store(batch))
+                    batch = []
+            docs.extend(self._embed_and_store(batch))
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+
+        return docs
+
+    def ingest_directory(
+        self,
+        directory: Path,
+        recursive: bool = True,
+        workers: int | None = 1,
+    ) -> list[Document]:
+        """Ingest all markdown files in a directory.
+
+        Args:
+            directory: Directory to ingest
+            recursive: Whether to recurse into subdirectories
+            workers: Worker processes for parsing (see ``ingest_files``)
+
+        Returns:
+            List of ingested documents
+        """
+        paths = find_files(directory, recursive=recursive)
+
+        docs = self.ingest_files(paths, workers=workers)
+
+        logger.info(f"Ingested {len(docs)} documents from {directory}")
+        return docs
+
+    def _content_unchanged(self, path: Path, content_hash: str, st: os.stat_result) -> bool:
+        """Check the index by content hash after a stat mismatch.
+
+        A file that was touched but not edited keeps its document; its new
+        mtime and size are recorded so the next run skips it from the stat.
+        """
+        if not self.metadata_store.document_exists(str(path), content_hash):
+            return False
+        self.metadata_store.update_fingerprint(
+            str(path), content_hash, st.st_mtime_ns, st.st_size
+        )
+        return True
+
+    def _build_document(
+        self,
+        path: Path,
+        content_hash: str,
+        st: os.stat_result,
+        parsed: ParsedDocument,
+        chunk_infos: list[ChunkInfo],
+    ) -> Document:
+        """Create a document and its chunk objects from parsed content."""
         doc_id = str(uuid.uuid4())
         doc = Document(
             id=doc_id,
@@ -75,12 +263,11 @@ class IngestionPipeline:
             title=parsed.title,
             content=parsed.content,
             content_hash=content_hash,
+            mtime_ns=st.st_mtime_ns,
+            size=st.st_size,
             metadata=parsed.metadata,
         )
 
-        # Chunk document
-        chunk_infos = self.chunker.chunk_text(parsed.content, parsed.headings)
-
         # Create chunk objects
         chunks: list[Chunk] = []
         for i, chunk_info in enumerate(chunk_infos):
@@ -105,63 +292,66 @@ class IngestionPipeline:
             chunks.append(chunk)
 
         doc.chunks = chunks
+        return doc
 
-        # Generate embeddings
-        texts = [c.content for c in chunks]
-        embeddings = self.embedder.embed_texts(texts)
+    def _store_document(self, doc: Document) -> None:
+        """Embed a document's chunks and write everything to storage."""
+        self._store_documents([doc])
 
-        # Store in metadata DB
-        self.metadata_store.add_document(doc)
-        for chunk in chunks:
-            self.metadata_store.add_chunk(chunk)
+    def _store_documents(self, docs: list[Document]) -> None:
+        """Embed the chunks of documents and write everything to storage.
 
-        # Store vectors
-        chunk_ids = [c.id for c in chunks]
-        payloads = [
-            {
-                "source_path": c.metadata.source_path,
-                "source_type": c.metadata.source_type,
-                "heading": c.metadata.heading,
-                "title": c.metadata.title,
-                "tags": c.metadata.tags,
-            }
-            for c in chunks
-        ]
-        self.vector_store.add_vectors(chunk_ids, embeddings, payloads)
-
-        logger.info(f"Ingested {path}: {len(chunks)} chunks")
-        return doc
+        Embedding runs on the batcher's thread, possibly together with chunks
+        from concurrent ingests, while metadata for all documents is written in
+        one transaction; vectors are upserted once both finish. If embedding or
+        the upsert fails, the metadata just written is deleted again so no
+        document is left without vectors.
 
-    def ingest_directory(
-        self,
-        directory: Path,
-        recursive: bool = True,
-    ) -> list[Document]:
-        """Ingest all markdown files in a directory.
+        Raises:
+            Exception: Whatever failed while embedding or storing
+        """
+        chunks = [c for doc in docs for c in doc.chunks]
+        pending = self.batcher.submit([c.content for c in chunks])
 
-        Args:
-            directory: Directory to ingest
-            recursive: Whether to recurse into subdirectories
+        # Store in metadata DB while the embedder runs
+        self.metadata_store.add_documents(docs)
 
-        Returns:
-            List of ingested documents
-        """
-        docs: list[Document] = []
+        try:
+            embeddings = pending.result()
 
-        glob_func = directory.rglob if recursive else directory.glob
-        paths = sorted(glob_func("*.md"))
+            # Store vectors
+            chunk_ids = [c.id for c in chunks]
+            payloads = [dict(zip(_PAYLOAD_KEYS, _payload_values(c), strict=True)) for c in chunks]
+            self.vector_store.add_vectors(chunk_ids, embeddings, payloads)
+        except Exception:
+            for doc in docs:
+                self.metadata_store.delete_document(doc.id)
+            raise
 
-        for path in paths:
-            if path.is_file():
-                try:
-                    doc = self.ingest_file(path)
-                    if doc:
-                        docs.append(doc)
-                except Exception as e:
-                    logger.warning(f"Failed to ingest {path}: {e}")
+    def _embed_and_store(self, docs: list[Document]) -> list[Document]:
+        """Embed the chunks of several documents in one batch and store them."""
+        if not docs:
+            return []
 
-        logger.info(f"Ingested {len(docs)} documents from {directory}")
-        return docs
+        try:
+            self._store_documents(docs)
+        except Exception as e:
+            logger.warning(f"Batch write failed ({e}); storing documents one at a time")
+        else:
+            for doc in docs:
+                logger.info(f"Ingested {doc.source_path}: {len(doc.chunks)} chunks")
+            return docs
+
+        stored: list[Document] = []
+        for doc in docs:
+            try:
+                self._store_document(doc)
+            except Exception as e:
+                logger.warning(f"Failed to ingest {doc.source_path}: {e}")
+                continue
+            logger.info(f"Ingested {doc.source_path}: {len(doc.chunks)} chunks")
+            stored.append(doc)
+        return stored
 
     def delete_document(self, doc_id: str) -> None:
         """Delete a document and its chunks.
@@ -1,6 +1,7 @@
 """File watcher for auto-indexing."""
 
 import time
+from collections import OrderedDict
 from pathlib import Path
 from typing import Callable
 
@@ -15,6 +16,9 @@ except ImportError:
     Observer = None
     FileSystemEventHandler = object
 
+# Paths remembered for debouncing; older entries are past the window anyway
+DEBOUNCE_MAX_PATHS = 1024
+
 
 class MarkdownHandler(FileSystemEventHandler):
     """Handle markdown file changes."""
@@ -38,7 +42,7 @@ class MarkdownHandler(FileSystemEventHandler):
         self.on_modified = on_modified
         self.on_deleted = on_deleted
         self.extensions = extensions or [".md"]
-        self._last_event: dict[str, float] = {}
+        self._last_event: OrderedDict[str, float] = OrderedDict()
         self._debounce_seconds = 1.0
 
     def _should_handle(self, path: Path) -> bool:
@@ -47,11 +51,14 @@ class MarkdownHandler(FileSystemEventHandler):
 
     def _debounce(self, path: str) -> bool:
         """Debounce rapid events on same file."""
-        now = time.time()
-        last = self._last_event.get(path, 0)
-        if now - last < self._debounce_seconds:
+        now = time.monotonic()
+        last = self._last_event.get(path)
+        if last is not None and now - last < self._debounce_seconds:
             return False
         self._last_event[path] = now
+        self._last_event.move_to_end(path)
+        if len(self._last_event) > DEBOUNCE_MAX_PATHS:
+            self._last_event.popitem(last=False)
         return True
 
     def on_created(self, event):
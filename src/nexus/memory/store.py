@@ -1,14 +1,122 @@
 """Memory layer for AI assistants - fast context retrieval and storage."""
 
+import heapq
+import json
+import mmap
+import os
+import queue
+import re
+import threading
+import time
+import weakref
+from collections.abc import Iterable
 from datetime import datetime
 from pathlib import Path
-from typing import Any
-import json
+from typing import IO, Any
 
 from loguru import logger
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import xxhash
+
+    XXHASH_AVAILABLE = True
+except ImportError:
+    from hashlib import blake2b
+
+    XXHASH_AVAILABLE = False
+
+from nexus.models.document import Chunk, Document
 from nexus.storage.metadata import MetadataStore
-from nexus.models.document import Document, Chunk
+
+# Compact the mutation log into index.json once it grows past either limit
+LOG_COMPACT_ENTRIES = 1000
+LOG_COMPACT_BYTES = 1 << 20
+
+# The background writer gathers writes for this long after the first one,
+# then stops once idle this many seconds (the next write restarts it)
+WRITE_MAX_WAIT_MS = 20.0
+WRITE_IDLE_TIMEOUT = 5.0
+
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def _created_at(memory: dict[str, Any]) -> str:
+    """Sort key ordering memories by creation time."""
+    created_at: str = memory.get("created_at", "")
+    return created_at
+
+
+def _query_tokens(query_lower: str) -> set[str]:
+    """Tokens a memory must contain whole for ``query_lower`` to be a substring of it.
+
+    The first and last word of the query may be cut off by the substring
+    match (e.g. "pyth" in "python"), so they count only when the query
+    itself separates them from its ends.
+    """
+    tokens: set[str] = set()
+    for match in _TOKEN_RE.finditer(query_lower):
+        if match.start() > 0 and match.end() < len(query_lower):
+            tokens.add(match.group())
+    return tokens
+
+
+def _memory_id(content: str, timestamp: str) -> str:
+    """Derive a 12 hex digit memory ID from its content and creation time.
+
+    Uses xxHash (XXH3-64) when installed, otherwise BLAKE2b.
+    """
+    data = f"{content}{timestamp}".encode()
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh3_64_hexdigest(data)[:12]
+    return blake2b(data, digest_size=6).hexdigest()
+
+
+def _apply_update(
+    memory: dict[str, Any],
+    changes: dict[str, Any],
+    metadata: dict[str, Any] | None,
+) -> None:
+    """Apply an update to a memory in place: replace fields, merge metadata."""
+    memory.update(changes)
+    if metadata:
+        memory.setdefault("metadata", {}).update(metadata)
+
+
+def _dumps_line(entry: dict[str, Any]) -> bytes:
+    """Serialize a log entry as one compact JSON line."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(entry, default=str, option=orjson.OPT_NON_STR_KEYS) + b"\n"
+    return (json.dumps(entry, default=str, separators=(",", ":")) + "\n").encode()
+
+
+def _dumps_indented(obj: Any) -> bytes:
+    """Serialize a file's contents as indented JSON."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, default=str).encode()
+
+
+def _loads(data: bytes | memoryview) -> Any:
+    """Parse JSON bytes.
+
+    orjson parses a memoryview in place; the json fallback needs a copy.
+
+    Raises:
+        ValueError: If the data is not valid JSON
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
 
 
 class MemoryType:
@@ -36,25 +144,198 @@ class MemoryStore:
         
         # Fast in-memory index for quick lookups
         self._index: dict[str, dict[str, Any]] = {}
+        # Mutations since the last compaction are appended to a log instead
+        # of rewriting the whole index on every change
+        self._log_fh: IO[bytes] | None = None
+        self._log_entries = 0
+        self._log_bytes = 0
         self._load_index()
 
+        # Log lines are written on a background thread so callers don't wait
+        # on disk. Pending writes are finished at exit.
+        self._write_queue: queue.Queue[bytes] = queue.Queue()
+        self._writer_lock = threading.Lock()
+        self._writer: threading.Thread | None = None
+        weakref.finalize(self, self._write_queue.join)
+
+        # Secondary indexes: field value -> IDs of memories that have it
+        self._by_type: dict[str, set[str]] = {}
+        self._by_project: dict[str, set[str]] = {}
+        self._by_tag: dict[str, set[str]] = {}
+        self._by_token: dict[str, set[str]] = {}
+        # Lowercased content and tag sets, derived once per write for recall;
+        # kept beside the index so returned and persisted memories stay clean
+        self._content_lower: dict[str, str] = {}
+        self._tag_sets: dict[str, frozenset[str]] = {}
+        for memory in self._index.values():
+            self._add_to_lookups(memory)
+
+    def _lookup_keys(self, memory: dict[str, Any]) -> list[tuple[dict[str, set[str]], Any]]:
+        """List the (secondary index, key) pairs a memory is filed under."""
+        keys: list[tuple[dict[str, set[str]], Any]] = [
+            (self._by_type, memory.get("type")),
+            (self._by_project, memory.get("project")),
+        ]
+        keys.extend((self._by_tag, tag) for tag in self._tag_sets[memory["id"]])
+        content = self._content_lower[memory["id"]]
+        keys.extend((self._by_token, token) for token in set(_TOKEN_RE.findall(content)))
+        return keys
+
+    def _add_to_lookups(self, memory: dict[str, Any]) -> None:
+        """File a memory in the secondary indexes."""
+        self._content_lower[memory["id"]] = memory.get("content", "").lower()
+        self._tag_sets[memory["id"]] = frozenset(memory.get("tags") or ())
+        for lookup, key in self._lookup_keys(memory):
+            lookup.setdefault(key, set()).add(memory["id"])
+
+    def _remove_from_lookups(self, memory: dict[str, Any]) -> None:
+        """Remove a memory from the secondary indexes."""
+        for lookup, key in self._lookup_keys(memory):
+            ids = lookup.get(key)
+            if ids is not None:
+                ids.discard(memory["id"])
+                if not ids:
+                    del lookup[key]
+        del self._content_lower[memory["id"]]
+        del self._tag_sets[memory["id"]]
+
     def _index_path(self) -> Path:
         """Get path to memory index."""
         return self.memories_dir / "index.json"
 
+    def _log_path(self) -> Path:
+        """Get path to the append-only mutation log."""
+        return self.memories_dir / "log.jsonl"
+
     def _load_index(self) -> None:
-        """Load memory index from disk."""
+        """Load memory index from disk and replay the mutation log."""
         index_path = self._index_path()
         if index_path.exists():
             try:
-                self._index = json.loads(index_path.read_text())
+                # Parse straight from the page cache instead of copying the
+                # file into a bytes object first
+                with (
+                    open(index_path, "rb") as f,
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+                    memoryview(mm) as view,
+                ):
+                    self._index = _loads(view)
             except Exception as e:
                 logger.warning(f"Failed to load memory index: {e}")
                 self._index = {}
 
+        log_path = self._log_path()
+        if not log_path.exists():
+            return
+        with open(log_path, "rb") as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    # A crash mid-append left a partial last line; cut it off
+                    # so the next append starts on a line of its own
+                    logger.warning("Dropping partial last line of memory log")
+                    os.truncate(log_path, self._log_bytes)
+                    break
+                self._log_entries += 1
+                self._log_bytes += len(line)
+                try:
+                    entry = _loads(line)
+                    if entry["op"] == "put":
+                        self._index[entry["memory"]["id"]] = entry["memory"]
+                    elif entry["op"] == "del":
+                        self._index.pop(entry["id"], None)
+                    elif entry["op"] == "update":
+                        memory = self._index.get(entry["id"])
+                        if memory is not None:
+                            _apply_update(memory, entry["set"], entry.get("metadata"))
+                except (ValueError, KeyError, TypeError) as e:
+                    logger.warning(f"Skipping unreadable memory log entry: {e}")
+
+    def _append_log(self, entry: dict[str, Any]) -> None:
+        """Queue one mutation for the log, compacting it when it grows large."""
+        line = _dumps_line(entry)
+        self._enqueue_write(line)
+        self._log_entries += 1
+        self._log_bytes += len(line)
+        if self._log_entries >= LOG_COMPACT_ENTRIES or self._log_bytes >= LOG_COMPACT_BYTES:
+            self.compact()
+
+    def _enqueue_write(self, line: bytes) -> None:
+        """Hand a log line to the background writer, starting it if needed."""
+        with self._writer_lock:
+            self._write_queue.put(line)
+            if self._writer is None:
+                self._writer = threading.Thread(
+                    target=self._run_writer, name="memory-writer", daemon=True
+                )
+                self._writer.start()
+
+    def _run_writer(self) -> None:
+        """Writer loop: gather queued log lines and append them together."""
+        while True:
+            try:
+                first = self._write_queue.get(timeout=WRITE_IDLE_TIMEOUT)
+            except queue.Empty:
+                with self._writer_lock:
+                    # _enqueue_write() enqueues under the lock, so nothing can slip in here
+                    if self._write_queue.empty():
+                        self._writer = None
+                        return
+                continue
+
+            batch = [first]
+            deadline = time.monotonic() + WRITE_MAX_WAIT_MS / 1000
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._write_queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            try:
+                self._write_batch(batch)
+            except OSError as e:
+                logger.error(f"Failed to write memories: {e}")
+            finally:
+                for _ in batch:
+                    self._write_queue.task_done()
+
+    def _write_batch(self, lines: list[bytes]) -> None:
+        """Append queued log lines with a single write."""
+        if self._log_fh is None:
+            self._log_fh = open(self._log_path(), "ab")
+        self._log_fh.write(b"".join(lines))
+        self._log_fh.flush()
+
+    def flush(self) -> None:
+        """Block until every queued write has reached disk."""
+        self._write_queue.join()
+
     def _save_index(self) -> None:
-        """Save memory index to disk."""
-        self._index_path().write_text(json.dumps(self._index, indent=2, default=str))
+        """Save memory index to disk, replacing the previous file atomically."""
+        index_path = self._index_path()
+        tmp_path = index_path.with_name(index_path.name + ".tmp")
+        tmp_path.write_bytes(_dumps_indented(self._index))
+        os.replace(tmp_path, index_path)
+
+    def compact(self) -> None:
+        """Fold the mutation log into index.json and start a new log."""
+        self.flush()
+        self._save_index()
+        if self._log_fh is not None:
+            self._log_fh.close()
+            self._log_fh = None
+        self._log_path().unlink(missing_ok=True)
+        self._log_entries = 0
+        self._log_bytes = 0
+
+    def close(self) -> None:
+        """Finish queued writes and close the mutation log."""
+        self.flush()
+        if self._log_fh is not None:
+            self._log_fh.close()
+            self._log_fh = None
 
     def remember(
         self,
@@ -76,11 +357,9 @@ class MemoryStore:
         Returns:
             Memory ID
         """
-        import hashlib
-        
         # Generate unique ID
         timestamp = datetime.now().isoformat()
-        memory_id = hashlib.md5(f"{content}{timestamp}".encode()).hexdigest()[:12]
+        memory_id = _memory_id(content, timestamp)
         
         memory = {
             "id": memory_id,
@@ -94,12 +373,12 @@ class MemoryStore:
         }
         
         # Store in index
+        previous = self._index.get(memory_id)
+        if previous is not None:
+            self._remove_from_lookups(previous)
         self._index[memory_id] = memory
-        self._save_index()
-        
-        # Also save as individual file for persistence
-        memory_file = self.memories_dir / f"{memory_id}.json"
-        memory_file.write_text(json.dumps(memory, indent=2, default=str))
+        self._add_to_lookups(memory)
+        self._append_log({"op": "put", "memory": memory})
         
         logger.debug(f"Remembered: {memory_id} ({memory_type})")
         return memory_id
@@ -124,25 +403,38 @@ class MemoryStore:
         Returns:
             List of matching memories
         """
-        results = []
-        
-        for memory in self._index.values():
-            # Apply filters
-            if memory_type and memory.get("type") != memory_type:
-                continue
-            if project and memory.get("project") != project:
-                continue
-            if tags and not any(t in memory.get("tags", []) for t in tags):
-                continue
-            if query and query.lower() not in memory.get("content", "").lower():
-                continue
-            
-            results.append(memory)
-        
-        # Sort by recency
-        results.sort(key=lambda x: x.get("created_at", ""), reverse=True)
-        
-        return results[:limit]
+        # Type, project and tag filters are answered exactly by the secondary
+        # indexes, so only the query substring is checked per memory. Word
+        # postings narrow that check; sets are intersected smallest first,
+        # stopping as soon as nothing is left.
+        query_lower = query.lower() if query else None
+        id_sets: list[set[str]] = []
+        if memory_type:
+            id_sets.append(self._by_type.get(memory_type, set()))
+        if project:
+            id_sets.append(self._by_project.get(project, set()))
+        if tags:
+            id_sets.append(set().union(*(self._by_tag.get(t, set()) for t in tags)))
+        if query_lower:
+            id_sets.extend(self._by_token.get(t, set()) for t in _query_tokens(query_lower))
+
+        memory_ids: Iterable[str] = self._index
+        if id_sets:
+            id_sets.sort(key=len)
+            candidates = set(id_sets[0])
+            for ids in id_sets[1:]:
+                if not candidates:
+                    break
+                candidates &= ids
+            memory_ids = candidates
+
+        if query_lower:
+            content_lower = self._content_lower
+            memory_ids = [i for i in memory_ids if query_lower in content_lower[i]]
+
+        # Most recent first; a bounded heap avoids sorting every match
+        index = self._index
+        return heapq.nlargest(limit, (index[i] for i in memory_ids), key=_created_at)
 
     def get_project_context(self, project: str) -> dict[str, Any]:
         """Get all context for a project.
@@ -208,21 +500,25 @@ class MemoryStore:
             return False
         
         memory = self._index[memory_id]
-        
+        changes: dict[str, Any] = {"updated_at": datetime.now().isoformat()}
         if content is not None:
-            memory["content"] = content
+            changes["content"] = content
         if tags is not None:
-            memory["tags"] = tags
+            changes["tags"] = tags
+
+        # Metadata-only updates leave the recall indexes untouched
+        reindex = len(changes) > 1
+        if reindex:
+            self._remove_from_lookups(memory)
+        _apply_update(memory, changes, metadata)
+        if reindex:
+            self._add_to_lookups(memory)
+        
+        # Log only what changed rather than the whole memory
+        entry: dict[str, Any] = {"op": "update", "id": memory_id, "set": changes}
         if metadata:
-            memory["metadata"].update(metadata)
-        
-        memory["updated_at"] = datetime.now().isoformat()
-        
-        self._save_index()
-        
-        # Update file
-        memory_file = self.memories_dir / f"{memory_id}.json"
-        memory_file.write_text(json.dumps(memory, indent=2, default=str))
+            entry["metadata"] = metadata
+        self._append_log(entry)
         
         return True
 
@@ -238,13 +534,8 @@ class MemoryStore:
         if memory_id not in self._index:
             return False
         
-        del self._index[memory_id]
-        self._save_index()
-        
-        # Delete file
-        memory_file = self.memories_dir / f"{memory_id}.json"
-        if memory_file.exists():
-            memory_file.unlink()
+        self._remove_from_lookups(self._index.pop(memory_id))
+        self._append_log({"op": "del", "id": memory_id})
         
         return True
 
@@ -282,9 +573,7 @@ class MemoryStore:
         Returns:
             List of recent memories
         """
-        memories = list(self._index.values())
-        memories.sort(key=lambda x: x.get("created_at", ""), reverse=True)
-        return memories[:limit]
+        return heapq.nlargest(limit, self._index.values(), key=_created_at)
 
     def list_projects(self) -> list[str]:
         """List all projects with memories.
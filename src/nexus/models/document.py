@@ -44,3 +44,5 @@ class Document(BaseModel):
     metadata: dict[str, Any] = Field(default_factory=dict, description="Document metadata")
     indexed_at: datetime = Field(default_factory=datetime.now, description="Indexing timestamp")
     content_hash: str | None = Field(default=None, description="Hash for change detection")
+    mtime_ns: int | None = Field(default=None, description="Source file mtime in nanoseconds")
+    size: int | None = Field(default=None, description="Source file size in bytes")
@@ -3,6 +3,7 @@
 from nexus.rag.embedder import Embedder
 from nexus.rag.search import SearchEngine
 from nexus.rag.bm25 import BM25Index
+from nexus.rag.cache import SemanticCache
 from nexus.rag.hybrid import HybridSearchEngine, reciprocal_rank_fusion
 from nexus.rag.reranker import CrossEncoderReranker
 
@@ -10,6 +11,7 @@ __all__ = [
     "Embedder",
     "SearchEngine",
     "BM25Index",
+    "SemanticCache",
     "HybridSearchEngine",
     "reciprocal_rank_fusion",
     "CrossEncoderReranker",
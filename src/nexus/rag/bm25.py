@@ -1,23 +1,100 @@
 """BM25 keyword search."""
 
+import pickle
+import re
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Any
 
+import numpy as np
 from loguru import logger
 from rank_bm25 import BM25Okapi
 
 from nexus.models.document import Chunk
 from nexus.storage.metadata import MetadataStore
 
+# Compiled once at import rather than looked up on every tokenize call. A
+# maximal run of word characters is already bounded by word boundaries, so
+# this finds the same tokens as r"\b\w+\b" without testing them
+_TOKEN_PATTERN = re.compile(r"\w+")
+
 
 def tokenize(text: str) -> list[str]:
     """Simple tokenization for BM25."""
-    import re
     # Lowercase and split on non-alphanumeric
-    tokens = re.findall(r'\b\w+\b', text.lower())
+    tokens = _TOKEN_PATTERN.findall(text.lower())
     return tokens
 
 
+def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Positions of the k highest scores, best first.
+
+    Partitions around the k-th largest score instead of sorting all of
+    them; ties keep their original order, as with a stable sort.
+    """
+    k = min(k, len(scores))
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    kth = np.partition(scores, len(scores) - k)[len(scores) - k]
+    above = np.flatnonzero(scores > kth)
+    ties = np.flatnonzero(scores == kth)[: k - len(above)]
+    top = np.concatenate((above, ties))
+    return top[np.argsort(-scores[top], kind="stable")]
+
+
+class _IncrementalBM25(BM25Okapi):  # type: ignore[misc]
+    """BM25Okapi that can take more documents without being rebuilt.
+
+    Keeps the document frequencies and token total that ``BM25Okapi`` only
+    uses while constructing, so adding documents costs their own length
+    plus recomputing IDF over the vocabulary instead of re-counting the
+    whole corpus. Scores are identical to a fresh index over all documents.
+    """
+
+    def _initialize(self, corpus: list[list[str]]) -> dict[str, int]:
+        self._nd: dict[str, int] = {}
+        self._num_tokens = 0
+        self.add_documents(corpus, update_idf=False)
+        return self._nd
+
+    def add_documents(self, corpus: list[list[str]], update_idf: bool = True) -> None:
+        """Count new tokenized documents into the index.
+
+        Args:
+            corpus: Tokenized documents to append
+            update_idf: Recompute IDF afterwards (the constructor does it itself)
+        """
+        nd = self._nd
+        for document in corpus:
+            self.doc_len.append(len(document))
+            self._num_tokens += len(document)
+
+            frequencies: dict[str, int] = {}
+            for word in document:
+                frequencies[word] = frequencies.get(word, 0) + 1
+            self.doc_freqs.append(frequencies)
+
+            for word in frequencies:
+                nd[word] = nd.get(word, 0) + 1
+
+            self.corpus_size += 1
+
+        self.avgdl = self._num_tokens / self.corpus_size
+        if update_idf:
+            # Every IDF depends on the corpus size, so all are refreshed
+            self.idf: dict[str, float] = {}
+            self._calc_idf(nd)
+
+
+# Number of recent (query, top_k, filter_term) results kept by BM25Index.search
+SEARCH_CACHE_SIZE = 256
+
+# Bump when the pickled layout changes so old files are rebuilt
+_PERSIST_VERSION = 3
+
+
 class BM25Index:
     """BM25 index for keyword search."""
 
@@ -28,9 +105,16 @@ class BM25Index:
             metadata_store: Metadata store to load chunks from
         """
         self.metadata_store = metadata_store
-        self._index: BM25Okapi | None = None
+        self._index: _IncrementalBM25 | None = None
         self._chunk_ids: list[str] = []
         self._corpus: list[list[str]] = []
+        self._postings: dict[str, set[int]] | None = None
+        # Results of recent searches; dropped whenever the corpus changes
+        self._search_cache: OrderedDict[tuple[str, int, str | None], list[tuple[str, float]]] = (
+            OrderedDict()
+        )
+        self._search_cache_lock = threading.Lock()
+        self._search_generation = 0
 
     def build_index(self, chunk_ids: list[str] | None = None) -> None:
         """Build or rebuild the BM25 index.
@@ -45,9 +129,11 @@ class BM25Index:
             # For now, we iterate through stats to get count
             stats = self.metadata_store.get_stats()
             if stats["chunks"] == 0:
+                self._clear_search_cache()
                 self._index = None
                 self._chunk_ids = []
                 self._corpus = []
+                self._postings = None
                 return
 
             # Load all chunks via a simple query
@@ -58,44 +144,191 @@ class BM25Index:
             chunks = self.metadata_store.get_chunks_by_ids(all_ids)
 
         # Tokenize and build index
+        self._clear_search_cache()
+        self._postings = None
         self._chunk_ids = [c.id for c in chunks]
         self._corpus = [tokenize(c.content) for c in chunks]
 
         if self._corpus:
-            self._index = BM25Okapi(self._corpus)
+            self._index = _IncrementalBM25(self._corpus)
             logger.info(f"Built BM25 index with {len(self._chunk_ids)} chunks")
         else:
             self._index = None
 
+    def save(self, path: Path) -> None:
+        """Persist the built index to disk.
+
+        The file is tagged with the metadata store's chunk fingerprint so
+        ``load`` can tell when it no longer matches the database.
+
+        Args:
+            path: File to write the pickled index to
+        """
+        state = {
+            "version": _PERSIST_VERSION,
+            "fingerprint": self.metadata_store.get_chunks_fingerprint(),
+            "chunk_ids": self._chunk_ids,
+            "corpus": self._corpus,
+            "index": self._index,
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp_path.replace(path)
+        logger.debug(f"Saved BM25 index to {path}")
+
+    def load(self, path: Path) -> bool:
+        """Load a persisted index if it is still current.
+
+        Args:
+            path: File previously written by ``save``
+
+        Returns:
+            True if the index was loaded, False if it is missing, unreadable
+            or stale relative to the metadata store
+        """
+        if not path.exists():
+            return False
+
+        try:
+            with open(path, "rb") as f:
+                state = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError) as e:
+            logger.warning(f"Ignoring unreadable BM25 index {path}: {e}")
+            return False
+
+        if (
+            not isinstance(state, dict)
+            or state.get("version") != _PERSIST_VERSION
+            or state.get("fingerprint") != self.metadata_store.get_chunks_fingerprint()
+        ):
+            logger.debug(f"BM25 index at {path} is stale")
+            return False
+
+        self._chunk_ids = state["chunk_ids"]
+        self._corpus = state["corpus"]
+        self._index = state["index"]
+        self._postings = None
+        self._clear_search_cache()
+        logger.info(f"Loaded BM25 index with {len(self._chunk_ids)} chunks from {path}")
+        return True
+
+    def load_or_build(self, path: Path) -> None:
+        """Load the persisted index, rebuilding and saving it if stale.
+
+        Args:
+            path: File used to persist the index between processes
+        """
+        if self.load(path):
+            return
+
+        self.build_index()
+        try:
+            self.save(path)
+        except OSError as e:
+            logger.warning(f"Failed to persist BM25 index to {path}: {e}")
+
+    def _clear_search_cache(self) -> None:
+        """Forget cached search results after the corpus changes."""
+        with self._search_cache_lock:
+            self._search_cache.clear()
+            self._search_generation += 1
+
+    def _matching_indices(self, term: str) -> set[int]:
+        """Positions of documents containing every token of ``term``."""
+        if self._postings is None:
+            postings: dict[str, set[int]] = {}
+            for idx, tokens in enumerate(self._corpus):
+                for token in set(tokens):
+                    postings.setdefault(token, set()).add(idx)
+            self._postings = postings
+
+        token_sets = [self._postings.get(token, set()) for token in tokenize(term)]
+        if not token_sets:
+            return set()
+        # Intersect smallest posting lists first
+        token_sets.sort(key=len)
+        return set.intersection(*token_sets)
+
+    def matching_ids(self, term: str) -> list[str]:
+        """Get IDs of chunks containing every token of a term.
+
+        Args:
+            term: Keyword or phrase to match
+
+        Returns:
+            Matching chunk IDs
+        """
+        return [self._chunk_ids[idx] for idx in sorted(self._matching_indices(term))]
+
     def search(
         self,
         query: str,
         top_k: int = 20,
+        filter_term: str | None = None,
     ) -> list[tuple[str, float]]:
         """Search using BM25.
 
         Args:
             query: Search query
             top_k: Number of results
+            filter_term: Only score chunks containing every token of this term
 
         Returns:
-            List of (chunk_id, score) tuples
+            List of (chunk_id, score) tuples; repeated searches are served
+            from a cache until the index changes
         """
-        if self._index is None or not self._chunk_ids:
+        index = self._index
+        if index is None or not self._chunk_ids:
             return []
 
+        key = (query, top_k, filter_term)
+        with self._search_cache_lock:
+            cached = self._search_cache.get(key)
+            if cached is not None:
+                self._search_cache.move_to_end(key)
+                return list(cached)
+            generation = self._search_generation
+
+        results = self._search(index, query, top_k, filter_term)
+
+        with self._search_cache_lock:
+            # Skip caching if the corpus changed while scoring
+            if generation == self._search_generation:
+                self._search_cache[key] = results
+                while len(self._search_cache) > SEARCH_CACHE_SIZE:
+                    self._search_cache.popitem(last=False)
+        return list(results)
+
+    def _search(
+        self,
+        index: _IncrementalBM25,
+        query: str,
+        top_k: int,
+        filter_term: str | None,
+    ) -> list[tuple[str, float]]:
+        """Score the corpus for a query with ``index`` (uncached ``search``)."""
         query_tokens = tokenize(query)
-        scores = self._index.get_scores(query_tokens)
+        if filter_term is not None:
+            candidates = sorted(self._matching_indices(filter_term))
+            if not candidates:
+                return []
+            scores = np.asarray(index.get_batch_scores(query_tokens, candidates))
+            indices = np.asarray(candidates)
+        else:
+            scores = index.get_scores(query_tokens)
+            indices = None
 
-        # Get top-k indices
-        scored_indices = list(enumerate(scores))
-        scored_indices.sort(key=lambda x: x[1], reverse=True)
-        top_indices = scored_indices[:top_k]
+        # Get top-k positions without sorting every score
+        top = _top_k(scores, top_k)
 
         # Return (chunk_id, score) pairs
         results = [
             (self._chunk_ids[idx], float(score))
-            for idx, score in top_indices
+            for idx, score in zip(
+                (top if indices is None else indices[top]).tolist(), scores[top].tolist(), strict=True
+            )
             if score > 0
         ]
 
@@ -104,12 +337,22 @@ class BM25Index:
     def add_chunks(self, chunks: list[Chunk]) -> None:
         """Add chunks to the index.
 
+        Only the new chunks are counted; the existing index is extended
+        rather than rebuilt.
+
         Args:
             chunks: Chunks to add
         """
-        for chunk in chunks:
-            self._chunk_ids.append(chunk.id)
-            self._corpus.append(tokenize(chunk.content))
+        if not chunks:
+            return
 
-        if self._corpus:
-            self._index = BM25Okapi(self._corpus)
+        self._clear_search_cache()
+        self._postings = None
+        new_corpus = [tokenize(chunk.content) for chunk in chunks]
+        self._chunk_ids.extend(chunk.id for chunk in chunks)
+        self._corpus.extend(new_corpus)
+
+        if self._index is None:
+            self._index = _IncrementalBM25(self._corpus)
+        else:
+            self._index.add_documents(new_corpus)
@@ -0,0 +1,129 @@
+"""Semantic cache for search results keyed on approximate query similarity."""
+
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+import numpy as np
+from loguru import logger
+
+
+class SemanticCache:
+    """Cache search results for queries whose embeddings are near-duplicates.
+
+    Query vectors are hashed with random-hyperplane LSH. A lookup finds the
+    stored query with the smallest Hamming distance to the new one, then
+    confirms the hit with an exact cosine check against its int8-quantized
+    vector. Entries are partitioned by a caller-supplied scope (e.g. top_k
+    and filters), so results are only reused for equivalent searches.
+    """
+
+    def __init__(
+        self,
+        dimension: int,
+        threshold: float = 0.97,
+        nbits: int = 256,
+        max_entries: int = 1024,
+        seed: int = 0,
+    ) -> None:
+        """Initialize semantic cache.
+
+        Args:
+            dimension: Embedding dimension
+            threshold: Minimum cosine similarity for a cache hit
+            nbits: Number of LSH hyperplanes (signature bits)
+            max_entries: Maximum cached queries per scope
+            seed: Seed for the random hyperplanes
+        """
+        self.dimension = dimension
+        self.threshold = threshold
+        self.max_entries = max_entries
+        rng = np.random.default_rng(seed)
+        self._planes = rng.standard_normal((dimension, nbits)).astype(np.float32)
+        self._scopes: dict[Hashable, OrderedDict[int, tuple[np.ndarray, np.ndarray, Any]]] = {}
+        self._next_id = 0
+        # Lookup outcomes, kept across clear() for tuning the threshold
+        self.hits = 0
+        self.misses = 0
+
+    def _signature(self, vector: np.ndarray) -> np.ndarray:
+        """Packed LSH bit signature for a vector."""
+        return np.packbits(vector @ self._planes > 0)
+
+    @staticmethod
+    def _quantize(vector: np.ndarray) -> np.ndarray:
+        """Quantize a unit vector to int8."""
+        return np.round(vector * 127).astype(np.int8)
+
+    @staticmethod
+    def _normalize(vector: list[float] | np.ndarray) -> np.ndarray | None:
+        """Convert to a float32 unit vector (None for zero vectors)."""
+        array = np.asarray(vector, dtype=np.float32)
+        norm = float(np.linalg.norm(array))
+        if norm == 0.0:
+            return None
+        return array / norm
+
+    def get(self, vector: list[float] | np.ndarray, scope: Hashable = None) -> Any | None:
+        """Look up results cached for a similar query.
+
+        Args:
+            vector: Query embedding
+            scope: Key identifying search parameters the results depend on
+
+        Returns:
+            Cached value, or None on a miss
+        """
+        entries = self._scopes.get(scope)
+        unit = self._normalize(vector)
+        if not entries or unit is None:
+            self.misses += 1
+            return None
+
+        ids = list(entries)
+        signatures = np.stack([entries[i][0] for i in ids])
+        distances = np.unpackbits(signatures ^ self._signature(unit), axis=1).sum(axis=1)
+        best = ids[int(np.argmin(distances))]
+
+        _, quantized, value = entries[best]
+        stored = quantized.astype(np.float32)
+        similarity = float(stored @ unit) / float(np.linalg.norm(stored))
+        if similarity < self.threshold:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        entries.move_to_end(best)
+        logger.debug(f"Semantic cache hit (cosine {similarity:.3f})")
+        return value
+
+    def put(self, vector: list[float] | np.ndarray, value: Any, scope: Hashable = None) -> None:
+        """Cache results for a query.
+
+        Args:
+            vector: Query embedding
+            value: Results to cache
+            scope: Key identifying search parameters the results depend on
+        """
+        unit = self._normalize(vector)
+        if unit is None:
+            return
+
+        entries = self._scopes.setdefault(scope, OrderedDict())
+        entries[self._next_id] = (self._signature(unit), self._quantize(unit), value)
+        self._next_id += 1
+        while len(entries) > self.max_entries:
+            entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        self._scopes.clear()
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of lookups answered from the cache (0.0 before any lookup)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._scopes.values())
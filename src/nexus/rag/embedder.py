@@ -1,7 +1,13 @@
 """Embedding service using sentence-transformers."""
 
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from pathlib import Path
 from typing import Any
 
+import numpy as np
 from loguru import logger
 from sentence_transformers import SentenceTransformer
 
@@ -17,6 +23,10 @@ class Embedder:
         batch_size: int = 32,
         normalize: bool = True,
         device: str | None = None,
+        cache_size: int = 4096,
+        cache_dir: Path | None = None,
+        backend: str = "torch",
+        model_file: str | None = None,
     ) -> None:
         """Initialize embedder.
 
@@ -25,22 +35,56 @@ class Embedder:
             batch_size: Batch size for encoding
             normalize: Whether to normalize embeddings
             device: Device to use (mps, cuda, cpu, or None for auto)
+            cache_size: Number of query embeddings kept in memory (0 disables)
+            cache_dir: Optional directory to persist query embeddings across runs
+            backend: Inference backend passed to sentence-transformers: "torch",
+                or "onnx"/"openvino" for graph-optimized runtimes (needs the
+                ``onnx`` extra)
+            model_file: ONNX/OpenVINO file to load from the model repo, e.g.
+                "onnx/model_qint8_avx512_vnni.onnx" for int8 weights
         """
         self.model_name = model_name
         self.batch_size = batch_size
         self.normalize = normalize
         self._model: SentenceTransformer | None = None
         self._device = device
+        self.backend = backend
+        self.model_file = model_file
         self._dimension: int | None = None
+        self.cache_size = cache_size
+        self._cache: OrderedDict[str, np.ndarray] = OrderedDict()
+        # Searches may run on worker threads (e.g. concurrent evaluation)
+        self._cache_lock = threading.Lock()
+        self._model_lock = threading.Lock()
+        self._cache_dir: Path | None = None
+        if cache_dir is not None:
+            # Namespace by model (and normalization) so different models never share vectors
+            slug = re.sub(r"[^\w.-]+", "_", model_name)
+            slug = f"{slug}-{'norm' if normalize else 'raw'}"
+            # Other runtimes (and quantized weights) give slightly different vectors
+            if backend != "torch":
+                slug += f"-{backend}"
+            if model_file:
+                slug += "-" + re.sub(r"[^\w.-]+", "_", model_file)
+            self._cache_dir = cache_dir / slug
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
 
     @property
     def model(self) -> SentenceTransformer:
         """Lazy load the model."""
         if self._model is None:
-            logger.info(f"Loading embedding model: {self.model_name}")
-            self._model = SentenceTransformer(self.model_name, device=self._device)
-            self._dimension = self._model.get_sentence_embedding_dimension()
-            logger.info(f"Model loaded. Dimension: {self._dimension}")
+            with self._model_lock:
+                if self._model is None:
+                    logger.info(f"Loading embedding model: {self.model_name} ({self.backend})")
+                    kwargs: dict[str, Any] = {}
+                    if self.backend != "torch":
+                        kwargs["backend"] = self.backend
+                    if self.model_file:
+                        kwargs["model_kwargs"] = {"file_name": self.model_file}
+                    model = SentenceTransformer(self.model_name, device=self._device, **kwargs)
+                    self._dimension = model.get_sentence_embedding_dimension()
+                    self._model = model
+                    logger.info(f"Model loaded. Dimension: {self._dimension}")
         return self._model
 
     @property
@@ -51,21 +95,125 @@ class Embedder:
             _ = self.model
         return self._dimension  # type: ignore
 
+    @staticmethod
+    def _cache_key(text: str) -> str:
+        """Content hash used to key cached embeddings."""
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _cache_get(self, key: str) -> np.ndarray | None:
+        """Look up an embedding in the memory cache, then on disk."""
+        with self._cache_lock:
+            embedding: np.ndarray | None = self._cache.get(key)
+            if embedding is not None:
+                self._cache.move_to_end(key)
+                return embedding
+
+        if self._cache_dir is not None:
+            cache_file = self._cache_dir / f"{key}.npy"
+            if cache_file.exists():
+                try:
+                    embedding = np.load(cache_file)
+                except (OSError, ValueError) as e:
+                    logger.warning(f"Ignoring unreadable embedding cache entry {cache_file}: {e}")
+                    return None
+                embedding.setflags(write=False)
+                self._cache_put(key, embedding, persist=False)
+                return embedding
+
+        return None
+
+    def _cache_put(self, key: str, embedding: np.ndarray, persist: bool = True) -> None:
+        """Store an embedding in the memory cache and optionally on disk."""
+        if self.cache_size > 0:
+            with self._cache_lock:
+                self._cache[key] = embedding
+                self._cache.move_to_end(key)
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+
+        if persist and self._cache_dir is not None:
+            try:
+                np.save(self._cache_dir / f"{key}.npy", embedding)
+            except OSError as e:
+                logger.warning(f"Failed to persist embedding cache entry: {e}")
+
+    def clear_cache(self) -> None:
+        """Drop all in-memory cached embeddings."""
+        with self._cache_lock:
+            self._cache.clear()
+
     def embed_text(self, text: str) -> list[float]:
         """Embed a single text string.
 
+        Repeated texts are served from the embedding cache instead of
+        re-running the model.
+
         Args:
             text: Text to embed
 
         Returns:
             Embedding vector
         """
-        embedding = self.model.encode(
-            text,
-            normalize_embeddings=self.normalize,
-            show_progress_bar=False,
+        return self.embed_queries([text])[0]
+
+    def embed_text_np(self, text: str) -> np.ndarray:
+        """Embed a single text string as an array (see ``embed_text``).
+
+        Returns:
+            Read-only embedding vector, shared with the cache when caching
+        """
+        return self.embed_queries_np([text])[0]
+
+    def embed_queries(self, texts: list[str]) -> list[list[float]]:
+        """Embed query strings in a single batch, reusing cached vectors.
+
+        Only texts missing from the cache go through the model, and they
+        are encoded together in one forward pass.
+
+        Args:
+            texts: Query strings to embed
+
+        Returns:
+            List of embedding vectors, in input order
+        """
+        return [vector.tolist() for vector in self.embed_queries_np(texts)]
+
+    def embed_queries_np(self, texts: list[str]) -> list[np.ndarray]:
+        """Embed query strings as arrays, reusing cached vectors.
+
+        Same as ``embed_queries`` without boxing every component into a
+        Python float; cached arrays are returned as-is and are read-only.
+
+        Args:
+            texts: Query strings to embed
+
+        Returns:
+            List of embedding vectors, in input order
+        """
+        if not texts:
+            return []
+
+        caching = self.cache_size > 0 or self._cache_dir is not None
+        keys = [self._cache_key(t) for t in texts] if caching else []
+        vectors: list[np.ndarray | None] = (
+            [self._cache_get(key) for key in keys] if caching else [None] * len(texts)
         )
-        return embedding.tolist()
+
+        missing = [i for i, vector in enumerate(vectors) if vector is None]
+        if missing:
+            encoded = self.model.encode(
+                [texts[i] for i in missing],
+                batch_size=self.batch_size,
+                normalize_embeddings=self.normalize,
+                show_progress_bar=False,
+            )
+            for i, embedding in zip(missing, encoded, strict=True):
+                if caching:
+                    embedding.setflags(write=False)
+                    self._cache_put(keys[i], embedding)
+                vectors[i] = embedding
+
+        return vectors  # type: ignore[return-value]
 
     def embed_texts(self, texts: list[str]) -> list[list[float]]:
         """Embed multiple texts.
@@ -79,13 +227,31 @@ class Embedder:
         if not texts:
             return []
 
+        return self.embed_texts_np(texts).tolist()
+
+    def embed_texts_np(self, texts: list[str]) -> np.ndarray:
+        """Embed multiple texts into one contiguous matrix.
+
+        Saves converting to nested lists and back when the caller does its
+        own math on the vectors.
+
+        Args:
+            texts: List of texts to embed
+
+        Returns:
+            float32 array of shape (len(texts), dimension)
+        """
+        if not texts:
+            return np.empty((0, 0), dtype=np.float32)
+
         embeddings = self.model.encode(
             texts,
             batch_size=self.batch_size,
             normalize_embeddings=self.normalize,
             show_progress_bar=len(texts) > 100,
+            convert_to_numpy=True,
         )
-        return embeddings.tolist()
+        return np.ascontiguousarray(embeddings, dtype=np.float32)
 
     def similarity(self, text1: str, text2: str) -> float:
         """Compute cosine similarity between two texts.
@@ -97,9 +263,7 @@ class Embedder:
         Returns:
             Cosine similarity score (0-1)
         """
-        emb1 = self.embed_text(text1)
-        emb2 = self.embed_text(text2)
+        emb1, emb2 = self.embed_queries_np([text1, text2])
 
         # Compute cosine similarity (embeddings are normalized)
-        dot_product = sum(a * b for a, b in zip(emb1, emb2))
-        return dot_product
+        return float(np.dot(emb1, emb2))
@@ -2,11 +2,13 @@
 
 from typing import Any
 
+import numpy as np
 from loguru import logger
 
 from nexus.config import Config
 from nexus.models.search import SearchResult
 from nexus.rag.bm25 import BM25Index
+from nexus.rag.cache import SemanticCache
 from nexus.rag.embedder import Embedder
 from nexus.storage.metadata import MetadataStore
 from nexus.storage.vectors import VectorStore
@@ -51,6 +53,7 @@ class HybridSearchEngine:
         hybrid_alpha: float = 0.5,
         use_reranking: bool = False,
         rerank_top_k: int = 5,
+        semantic_cache_threshold: float | None = None,
     ) -> None:
         """Initialize hybrid search engine.
 
@@ -63,6 +66,8 @@ class HybridSearchEngine:
             hybrid_alpha: Weight for vector search (1.0 = all vector, 0.0 = all BM25)
             use_reranking: Whether to use cross-encoder reranking
             rerank_top_k: Number of results after reranking
+            semantic_cache_threshold: Cosine similarity above which a previous
+                query's results are reused (None disables the cache)
         """
         self.embedder = embedder
         self.metadata_store = metadata_store
@@ -72,10 +77,19 @@ class HybridSearchEngine:
         self.hybrid_alpha = hybrid_alpha
         self.use_reranking = use_reranking
         self.rerank_top_k = rerank_top_k
+        self.semantic_cache_threshold = semantic_cache_threshold
+        self._semantic_cache: SemanticCache | None = None
 
     def build_bm25_index(self) -> None:
         """Build or rebuild the BM25 index."""
         self.bm25_index.build_index()
+        # The corpus changed, so cached results may be stale
+        self.clear_cache()
+
+    def clear_cache(self) -> None:
+        """Drop cached search results."""
+        if self._semantic_cache is not None:
+            self._semantic_cache.clear()
 
     def search(
         self,
@@ -85,6 +99,7 @@ class HybridSearchEngine:
         source_type: str | None = None,
         tags: list[str] | None = None,
         use_hybrid: bool = True,
+        filter_term: str | None = None,
     ) -> list[SearchResult]:
         """Perform hybrid search.
 
@@ -95,30 +110,139 @@ class HybridSearchEngine:
             source_type: Filter by source type
             tags: Filter by tags
             use_hybrid: Whether to use hybrid (True) or vector-only (False)
+            filter_term: Only consider chunks containing every token of this term
+
+        Returns:
+            List of search results
+        """
+        query_embedding = self.embedder.embed_text_np(query)
+        return self.search_with_vector(
+            query_embedding,
+            query,
+            top_k=top_k,
+            filters=filters,
+            source_type=source_type,
+            tags=tags,
+            use_hybrid=use_hybrid,
+            filter_term=filter_term,
+        )
+
+    def search_many(
+        self,
+        queries: list[str],
+        top_k: int | None = None,
+        filters: dict[str, Any] | None = None,
+        source_type: str | None = None,
+        tags: list[str] | None = None,
+        use_hybrid: bool = True,
+    ) -> list[list[SearchResult]]:
+        """Perform hybrid search for several queries.
+
+        All queries are embedded in one batch, then searched one by one.
+
+        Args:
+            queries: Search queries
+            top_k: Number of final results per query
+            filters: Metadata filters for vector search
+            source_type: Filter by source type
+            tags: Filter by tags
+            use_hybrid: Whether to use hybrid (True) or vector-only (False)
+
+        Returns:
+            List of search results for each query, in input order
+        """
+        query_embeddings = self.embedder.embed_queries_np(queries)
+        return [
+            self.search_with_vector(
+                query_embedding,
+                query,
+                top_k=top_k,
+                filters=filters,
+                source_type=source_type,
+                tags=tags,
+                use_hybrid=use_hybrid,
+            )
+            for query_embedding, query in zip(query_embeddings, queries, strict=True)
+        ]
+
+    def search_with_vector(
+        self,
+        query_embedding: list[float] | np.ndarray,
+        query: str,
+        top_k: int | None = None,
+        filters: dict[str, Any] | None = None,
+        source_type: str | None = None,
+        tags: list[str] | None = None,
+        use_hybrid: bool = True,
+        filter_term: str | None = None,
+    ) -> list[SearchResult]:
+        """Perform hybrid search with a precomputed query embedding.
+
+        Lets callers embed many queries in one batch (see
+        ``Embedder.embed_queries_np``) and skip the per-query forward pass.
+
+        Args:
+            query_embedding: Embedding of ``query``
+            query: Search query text (used for BM25 and reranking)
+            top_k: Number of final results
+            filters: Metadata filters for vector search
+            source_type: Filter by source type
+            tags: Filter by tags
+            use_hybrid: Whether to use hybrid (True) or vector-only (False)
+            filter_term: Only consider chunks containing every token of this term
 
         Returns:
             List of search results
         """
         k = top_k or self.top_k
 
-        # Build filters
-        search_filters = filters.copy() if filters else {}
-        if source_type:
-            search_filters["source_type"] = source_type
+        cache_scope = None
+        if self.semantic_cache_threshold is not None:
+            if self._semantic_cache is None:
+                self._semantic_cache = SemanticCache(
+                    dimension=len(query_embedding),
+                    threshold=self.semantic_cache_threshold,
+                )
+            cache_scope = (
+                k,
+                tuple(sorted((key, repr(value)) for key, value in (filters or {}).items())),
+                source_type,
+                tuple(tags) if tags else None,
+                use_hybrid,
+                filter_term,
+            )
+            cached = self._semantic_cache.get(query_embedding, cache_scope)
+            if cached is not None:
+                return [r.model_copy() for r in cached]
+
+        # Build filters; the caller's dict is only copied when something is added
+        search_filters = {**(filters or {}), "source_type": source_type} if source_type else filters
+
+        # Keyword prefilter: resolve the term against BM25 postings and push
+        # the matching IDs down into the vector search
+        allowed_ids = None
+        if filter_term:
+            if self.bm25_index._index is None:
+                logger.warning("BM25 index not built; ignoring filter_term")
+                filter_term = None
+            else:
+                allowed_ids = self.bm25_index.matching_ids(filter_term)
+                if not allowed_ids:
+                    return []
 
         # Vector search
-        query_embedding = self.embedder.embed_text(query)
         vector_results = self.vector_store.search(
             query_vector=query_embedding,
             limit=k * 2,  # Get more for fusion
             filters=search_filters if search_filters else None,
+            ids=allowed_ids,
         )
         vector_list = [(r["id"], r["score"]) for r in vector_results]
 
         # Combine results
         if use_hybrid and self.bm25_index._index is not None:
             # BM25 search
-            bm25_results = self.bm25_index.search(query, top_k=k * 2)
+            bm25_results = self.bm25_index.search(query, top_k=k * 2, filter_term=filter_term)
 
             # RRF fusion
             fused = reciprocal_rank_fusion([vector_list, bm25_results])
@@ -128,29 +252,18 @@ class HybridSearchEngine:
             result_ids = [doc_id for doc_id, _ in vector_list[:k]]
             scores = {doc_id: score for doc_id, score in vector_list}
 
-        # Get full chunk data
-        chunks = self.metadata_store.get_chunks_by_ids(result_ids)
-        chunk_map = {c.id: c for c in chunks}
+        # Get full chunk data, already in rank order and filtered by tags in SQL
+        chunks = self.metadata_store.get_chunks_by_ids(result_ids, tags=tags)
 
         # Build results
         results: list[SearchResult] = []
-        for chunk_id in result_ids:
-            chunk = chunk_map.get(chunk_id)
-            if not chunk:
-                continue
-
-            # Filter by tags if specified
-            if tags:
-                chunk_tags = chunk.metadata.tags or []
-                if not any(t in chunk_tags for t in tags):
-                    continue
-
+        for chunk in chunks:
             result = SearchResult(
                 chunk_id=chunk.id,
                 content=chunk.content,
                 source=chunk.metadata.source_path,
                 source_type=chunk.metadata.source_type,
-                relevance_score=scores.get(chunk_id, 0.0),
+                relevance_score=scores.get(chunk.id, 0.0),
                 title=chunk.metadata.title,
                 heading=chunk.metadata.heading,
                 tags=chunk.metadata.tags,
@@ -159,25 +272,43 @@ class HybridSearchEngine:
 
         # Reranking (if enabled and cross-encoder available)
         if self.use_reranking and len(results) > self.rerank_top_k:
-            results = self._rerank(query, results)[:self.rerank_top_k]
+            results = self._rerank(query, results, query_embedding)[:self.rerank_top_k]
+
+        if self._semantic_cache is not None and cache_scope is not None:
+            self._semantic_cache.put(
+                query_embedding, [r.model_copy() for r in results], cache_scope
+            )
 
         logger.debug(f"Hybrid search for '{query}' returned {len(results)} results")
         return results
 
-    def _rerank(self, query: str, results: list[SearchResult]) -> list[SearchResult]:
+    def _rerank(
+        self,
+        query: str,
+        results: list[SearchResult],
+        query_embedding: list[float] | np.ndarray | None = None,
+    ) -> list[SearchResult]:
         """Rerank results using cross-encoder (or semantic similarity).
 
-        For now, uses embedder similarity as a simple reranker.
-        Can be extended to use a proper cross-encoder model.
+        For now, uses embedder similarity as a simple reranker: all result
+        texts are embedded in one batch and scored against the query with a
+        single matrix product. Can be extended to use a proper cross-encoder
+        model.
+
+        Args:
+            query: Search query
+            results: Results to rerank
+            query_embedding: Embedding of ``query``, if already computed
         """
-        # Calculate similarity scores with query
-        scored = []
-        for result in results:
-            sim = self.embedder.similarity(query, result.content)
-            scored.append((result, sim))
+        if query_embedding is None:
+            query_embedding = self.embedder.embed_text_np(query)
+        embeddings = self.embedder.embed_texts_np([r.content for r in results])
+
+        # Embeddings are normalized, so the dot product is the cosine similarity
+        sims = (embeddings @ np.asarray(query_embedding, dtype=embeddings.dtype)).tolist()
 
         # Sort by similarity
-        scored.sort(key=lambda x: x[1], reverse=True)
+        scored = sorted(zip(results, sims, strict=True), key=lambda x: x[1], reverse=True)
 
         # Update scores and return
         reranked = []
@@ -1,9 +1,15 @@
 """Cross-encoder reranker for better retrieval quality."""
 
+import re
 from typing import Any
 
 from loguru import logger
 
+from nexus.exceptions import ConfigError
+
+# First sentence-transformers release whose CrossEncoder takes a backend
+MIN_BACKEND_VERSION = (4, 1)
+
 
 class CrossEncoderReranker:
     """Cross-encoder reranker using sentence-transformers."""
@@ -11,29 +17,64 @@ class CrossEncoderReranker:
     def __init__(
         self,
         model_name: str = "BAAI/bge-reranker-base",
+        backend: str = "torch",
+        model_file: str | None = None,
+        batch_size: int = 32,
     ) -> None:
         """Initialize cross-encoder reranker.
         
         Args:
             model_name: Cross-encoder model name
+            backend: Inference backend passed to sentence-transformers: "torch",
+                or "onnx"/"openvino" for graph-optimized runtimes (needs the
+                ``onnx`` extra)
+            model_file: ONNX/OpenVINO file to load from the model repo, e.g.
+                "onnx/model_qint8_avx512_vnni.onnx" for int8 weights
+            batch_size: Query-document pairs scored per forward pass
         """
         self.model_name = model_name
+        self.backend = backend
+        self.model_file = model_file
+        self.batch_size = batch_size
         self._model = None
 
     @property
     def model(self):
         """Lazy-load the cross-encoder model."""
         if self._model is None:
+            if self.backend != "torch":
+                self._check_backend_support()
             try:
                 from sentence_transformers import CrossEncoder
-                logger.info(f"Loading cross-encoder: {self.model_name}")
-                self._model = CrossEncoder(self.model_name)
+                logger.info(f"Loading cross-encoder: {self.model_name} ({self.backend})")
+                kwargs: dict[str, Any] = {}
+                if self.backend != "torch":
+                    kwargs["backend"] = self.backend
+                if self.model_file:
+                    kwargs["model_kwargs"] = {"file_name": self.model_file}
+                self._model = CrossEncoder(self.model_name, **kwargs)
                 logger.info("Cross-encoder loaded")
             except Exception as e:
                 logger.warning(f"Could not load cross-encoder: {e}")
                 self._model = None
         return self._model
 
+    def _check_backend_support(self) -> None:
+        """Fail clearly rather than fall back when the backend cannot be used.
+
+        Raises:
+            ConfigError: If sentence-transformers is too old for ``backend``
+        """
+        import sentence_transformers
+
+        version = sentence_transformers.__version__
+        if tuple(int(part) for part in re.findall(r"\d+", version)[:2]) < MIN_BACKEND_VERSION:
+            raise ConfigError(
+                f"Cross-encoder backend '{self.backend}' needs sentence-transformers "
+                f">= {'.'.join(map(str, MIN_BACKEND_VERSION))} (installed: {version}); "
+                "install the 'onnx' extra"
+            )
+
     def rerank(
         self,
         query: str,
@@ -57,11 +98,16 @@ class CrossEncoderReranker:
             logger.warning("Cross-encoder not available, returning original order")
             return [(i, 1.0 - i * 0.01) for i in range(len(documents))]
 
-        # Create query-document pairs
-        pairs = [[query, doc] for doc in documents]
+        # Create query-document pairs, longest first so each batch is padded
+        # only to its own longest document rather than to a random long one
+        order = sorted(range(len(documents)), key=lambda i: len(documents[i]), reverse=True)
+        pairs = [[query, documents[i]] for i in order]
 
-        # Get scores from cross-encoder
-        scores = self.model.predict(pairs)
+        # Get scores from cross-encoder and put them back in document order
+        sorted_scores = self.model.predict(pairs, batch_size=self.batch_size)
+        scores = [0.0] * len(documents)
+        for i, score in zip(order, sorted_scores, strict=True):
+            scores[i] = score
 
         # Sort by score
         scored = list(enumerate(scores))
@@ -2,10 +2,12 @@
 
 from typing import Any
 
+import numpy as np
 from loguru import logger
 
 from nexus.config import Config
 from nexus.models.search import SearchResult
+from nexus.rag.cache import SemanticCache
 from nexus.rag.embedder import Embedder
 from nexus.storage.metadata import MetadataStore
 from nexus.storage.vectors import VectorStore
@@ -20,6 +22,7 @@ class SearchEngine:
         metadata_store: MetadataStore,
         vector_store: VectorStore,
         top_k: int = 20,
+        semantic_cache_threshold: float | None = None,
     ) -> None:
         """Initialize search engine.
 
@@ -28,11 +31,20 @@ class SearchEngine:
             metadata_store: Metadata storage
             vector_store: Vector storage
             top_k: Number of results to retrieve
+            semantic_cache_threshold: Cosine similarity above which a previous
+                query's results are reused (None disables the cache)
         """
         self.embedder = embedder
         self.metadata_store = metadata_store
         self.vector_store = vector_store
         self.top_k = top_k
+        self.semantic_cache_threshold = semantic_cache_threshold
+        self._semantic_cache: SemanticCache | None = None
+
+    def clear_cache(self) -> None:
+        """Drop cached search results (call after the indexed chunks change)."""
+        if self._semantic_cache is not None:
+            self._semantic_cache.clear()
 
     def search(
         self,
@@ -54,56 +66,127 @@ class SearchEngine:
         Returns:
             List of search results
         """
-        k = top_k or self.top_k
+        # Embed query
+        query_embedding = self.embedder.embed_text_np(query)
+
+        cache_scope = None
+        if self.semantic_cache_threshold is not None:
+            if self._semantic_cache is None:
+                self._semantic_cache = SemanticCache(
+                    dimension=len(query_embedding),
+                    threshold=self.semantic_cache_threshold,
+                )
+            cache_scope = (
+                top_k or self.top_k,
+                tuple(sorted((key, repr(value)) for key, value in (filters or {}).items())),
+                source_type,
+                tuple(tags) if tags else None,
+            )
+            cached = self._semantic_cache.get(query_embedding, cache_scope)
+            if cached is not None:
+                return [r.model_copy() for r in cached]
 
-        # Build filters
-        search_filters = filters.copy() if filters else {}
-        if source_type:
-            search_filters["source_type"] = source_type
+        results = self._search_vector(query_embedding, top_k, filters, source_type, tags)
 
-        # Embed query
-        query_embedding = self.embedder.embed_text(query)
+        if self._semantic_cache is not None and cache_scope is not None:
+            self._semantic_cache.put(
+                query_embedding, [r.model_copy() for r in results], cache_scope
+            )
+
+        logger.debug(f"Search for '{query}' returned {len(results)} results")
+        return results
+
+    def _search_vector(
+        self,
+        query_embedding: np.ndarray,
+        top_k: int | None = None,
+        filters: dict[str, Any] | None = None,
+        source_type: str | None = None,
+        tags: list[str] | None = None,
+    ) -> list[SearchResult]:
+        """Search for chunks near an already embedded query (see ``search``)."""
+        k = top_k or self.top_k
 
         # Vector search
         vector_results = self.vector_store.search(
             query_vector=query_embedding,
             limit=k,
-            filters=search_filters if search_filters else None,
+            filters=self._vector_filters(filters, source_type),
         )
 
-        # Get full chunk data from metadata store
-        chunk_ids = [r["id"] for r in vector_results]
-        chunks = self.metadata_store.get_chunks_by_ids(chunk_ids)
+        return self._to_results(vector_results, tags)
 
-        # Build results with scores
-        chunk_map = {c.id: c for c in chunks}
-        results: list[SearchResult] = []
+    def search_many(
+        self,
+        queries: list[str],
+        top_k: int | None = None,
+        filters: dict[str, Any] | None = None,
+        source_type: str | None = None,
+        tags: list[str] | None = None,
+    ) -> list[list[SearchResult]]:
+        """Search for several queries at once.
 
-        for vr in vector_results:
-            chunk_id = vr["id"]
-            chunk = chunk_map.get(chunk_id)
-            if not chunk:
-                continue
+        All queries are embedded in one batch and sent to the vector store in
+        one batched request; the semantic cache is not consulted.
+
+        Args:
+            queries: Search queries
+            top_k: Number of results per query (defaults to self.top_k)
+            filters: Additional metadata filters
+            source_type: Filter by source type
+            tags: Filter by tags
+
+        Returns:
+            List of search results for each query, in input order
+        """
+        if not queries:
+            return []
 
-            # Filter by tags if specified
-            if tags:
-                chunk_tags = chunk.metadata.tags or []
-                if not any(t in chunk_tags for t in tags):
-                    continue
+        query_embeddings = self.embedder.embed_queries_np(queries)
+        batch_results = self.vector_store.search_many(
+            query_embeddings,
+            limit=top_k or self.top_k,
+            filters=self._vector_filters(filters, source_type),
+        )
+        return [self._to_results(vector_results, tags) for vector_results in batch_results]
+
+    @staticmethod
+    def _vector_filters(
+        filters: dict[str, Any] | None,
+        source_type: str | None,
+    ) -> dict[str, Any] | None:
+        """Combine metadata filters and the source type filter."""
+        search_filters = filters.copy() if filters else {}
+        if source_type:
+            search_filters["source_type"] = source_type
+        return search_filters if search_filters else None
+
+    def _to_results(
+        self,
+        vector_results: list[dict[str, Any]],
+        tags: list[str] | None,
+    ) -> list[SearchResult]:
+        """Turn vector hits into search results with their chunk data."""
+        # Get full chunk data from metadata store, already in rank order and
+        # filtered by tags in SQL
+        scores = {r["id"]: r["score"] for r in vector_results}
+        chunks = self.metadata_store.get_chunks_by_ids(list(scores), tags=tags)
+
+        results: list[SearchResult] = []
 
+        for chunk in chunks:
             result = SearchResult(
                 chunk_id=chunk.id,
                 content=chunk.content,
                 source=chunk.metadata.source_path,
                 source_type=chunk.metadata.source_type,
-                relevance_score=vr["score"],
+                relevance_score=scores[chunk.id],
                 title=chunk.metadata.title,
                 heading=chunk.metadata.heading,
                 tags=chunk.metadata.tags,
             )
             results.append(result)
 
-        logger.debug(f"Search for '{query}' returned {len(results)} results")
         return results
 
     def search_by_source(
@@ -142,10 +225,14 @@ class SearchEngine:
         Returns:
             List of similar chunks
         """
-        # Get the chunk
-        chunk = self.metadata_store.get_chunk(chunk_id)
-        if not chunk:
-            return []
+        # Search from the chunk's stored vector rather than re-embedding its
+        # content; only a chunk missing from the vector store is embedded
+        query_embedding = self.vector_store.get_vector(chunk_id)
+        if query_embedding is None:
+            chunk = self.metadata_store.get_chunk(chunk_id)
+            if not chunk:
+                return []
+            query_embedding = self.embedder.embed_text_np(chunk.content)
 
-        # Use its content as query
-        return self.search(query=chunk.content, top_k=top_k + 1)[1:]  # Exclude self
+        results = self._search_vector(query_embedding, top_k=top_k + 1)
+        return [r for r in results if r.chunk_id != chunk_id][:top_k]  # Exclude self
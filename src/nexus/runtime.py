@@ -0,0 +1,122 @@
+"""Process-wide registry of shared Nexus components.
+
+Loading an embedding model or opening a Qdrant store is expensive, so
+commands that run in the same process share one instance per configuration
+instead of constructing their own. Everything is closed at interpreter exit.
+"""
+
+import atexit
+import functools
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from loguru import logger
+
+if TYPE_CHECKING:
+    from nexus.rag.embedder import Embedder
+    from nexus.storage.metadata import MetadataStore
+    from nexus.storage.vectors import VectorStore
+
+# Stores opened through the registry, closed by close_all()
+_open_stores: list["MetadataStore | VectorStore"] = []
+
+
+@functools.cache
+def get_embedder(
+    model_name: str,
+    batch_size: int = 32,
+    normalize: bool = True,
+    cache_dir: Path | None = None,
+    backend: str = "torch",
+    model_file: str | None = None,
+) -> "Embedder":
+    """Get the shared embedder for a model.
+
+    Args:
+        model_name: Name of the sentence-transformers model
+        batch_size: Batch size for encoding
+        normalize: Whether to normalize embeddings
+        cache_dir: Optional directory to persist query embeddings
+        backend: Inference backend (torch, onnx or openvino)
+        model_file: ONNX/OpenVINO file to load from the model repo
+
+    Returns:
+        Shared Embedder instance
+    """
+    from nexus.rag.embedder import Embedder
+
+    return Embedder(
+        model_name=model_name,
+        batch_size=batch_size,
+        normalize=normalize,
+        cache_dir=cache_dir,
+        backend=backend,
+        model_file=model_file,
+    )
+
+
+@functools.cache
+def get_metadata_store(db_path: Path) -> "MetadataStore":
+    """Get the shared metadata store for a database file.
+
+    Args:
+        db_path: Path to SQLite database file
+
+    Returns:
+        Shared MetadataStore instance
+    """
+    from nexus.storage.metadata import MetadataStore
+
+    store = MetadataStore(db_path)
+    _open_stores.append(store)
+    return store
+
+
+@functools.cache
+def get_vector_store(
+    collection_name: str,
+    path: Path | None = None,
+    url: str | None = None,
+    embedding_dim: int = 768,
+    quantize: bool = False,
+) -> "VectorStore":
+    """Get the shared vector store for a collection.
+
+    Args:
+        collection_name: Name of the Qdrant collection
+        path: Path for embedded Qdrant storage
+        url: URL for Qdrant server (if using server mode)
+        embedding_dim: Dimension of embedding vectors
+        quantize: Create the collection with int8 scalar quantization
+
+    Returns:
+        Shared VectorStore instance
+    """
+    from nexus.storage.vectors import VectorStore
+
+    store = VectorStore(
+        collection_name=collection_name,
+        path=path,
+        url=url,
+        embedding_dim=embedding_dim,
+        quantize=quantize,
+    )
+    _open_stores.append(store)
+    return store
+
+
+def close_all() -> None:
+    """Close every shared store and forget all shared instances."""
+    get_embedder.cache_clear()
+    get_metadata_store.cache_clear()
+    get_vector_store.cache_clear()
+
+    while _open_stores:
+        store = _open_stores.pop()
+        try:
+            store.close()
+        except Exception as e:
+            logger.warning(f"Failed to close {type(store).__name__}: {e}")
+
+
+atexit.register(close_all)
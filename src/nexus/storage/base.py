@@ -30,6 +30,11 @@ class BaseMetadataStore(ABC):
         """Add a document."""
         ...
 
+    @abstractmethod
+    def add_documents(self, docs: list[Document]) -> None:
+        """Add documents and their chunks in one transaction."""
+        ...
+
     @abstractmethod
     def get_document(self, doc_id: str) -> Document | None:
         """Get a document by ID."""
@@ -40,14 +45,26 @@ class BaseMetadataStore(ABC):
         """Add a chunk."""
         ...
 
+    @abstractmethod
+    def add_chunks(self, chunks: list[Chunk]) -> None:
+        """Add multiple chunks in one transaction."""
+        ...
+
     @abstractmethod
     def get_chunk(self, chunk_id: str) -> Chunk | None:
         """Get a chunk by ID."""
         ...
 
     @abstractmethod
-    def get_chunks_by_ids(self, chunk_ids: list[str]) -> list[Chunk]:
-        """Get multiple chunks by IDs."""
+    def get_chunks_by_ids(
+        self,
+        chunk_ids: list[str],
+        tags: list[str] | None = None,
+    ) -> list[Chunk]:
+        """Get multiple chunks by IDs, in the order the IDs are given.
+
+        If ``tags`` is given, only chunks with at least one of them are returned.
+        """
         ...
 
     @abstractmethod
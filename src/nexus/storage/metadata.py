@@ -8,9 +8,26 @@ from typing import Any
 from loguru import logger
 
 from nexus.exceptions import StorageError
-from nexus.models.document import Chunk, ChunkMetadata, Document
+from nexus.models.document import Chunk, Document
 from nexus.models.source import Source, SourceType
 
+# Lists up to this size are padded for IN (...) queries; longer ones are rare
+# bulk reads where the statement would not be reused anyway
+MAX_PADDED_PARAMS = 1024
+
+
+def _pad_params(values: list[str]) -> list[str]:
+    """Pad values for an IN (...) list to the next power of two.
+
+    Repeating the last value leaves the match unchanged, while the number of
+    distinct statements stays small enough for sqlite3's statement cache.
+    """
+    size = len(values)
+    if size > MAX_PADDED_PARAMS:
+        return list(values)
+    padded = 1 << (size - 1).bit_length()
+    return [*values, *[values[-1]] * (padded - size)]
+
 
 class MetadataStore:
     """SQLite-based metadata storage for documents and chunks."""
@@ -55,10 +72,18 @@ class MetadataStore:
                 title TEXT,
                 content_hash TEXT,
                 indexed_at TEXT NOT NULL,
-                metadata TEXT
+                metadata TEXT,
+                mtime_ns INTEGER,
+                size INTEGER
             )
         """)
 
+        # Databases created before the file fingerprint columns existed
+        columns = {row["name"] for row in cursor.execute("PRAGMA table_info(documents)")}
+        for column in ("mtime_ns", "size"):
+            if column not in columns:
+                cursor.execute(f"ALTER TABLE documents ADD COLUMN {column} INTEGER")
+
         # Chunks table
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS chunks (
@@ -80,9 +105,49 @@ class MetadataStore:
             )
         """)
 
+        # One row per chunk tag, so tag filters are an indexed lookup
+        has_chunk_tags = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'chunk_tags'"
+        ).fetchone()
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS chunk_tags (
+                chunk_id TEXT NOT NULL,
+                tag TEXT NOT NULL,
+                PRIMARY KEY (chunk_id, tag)
+            ) WITHOUT ROWID
+        """)
+        if not has_chunk_tags:
+            # Databases created before the table existed
+            cursor.executemany(
+                "INSERT OR IGNORE INTO chunk_tags (chunk_id, tag) VALUES (?, ?)",
+                [
+                    (chunk_id, tag)
+                    for chunk_id, tags in cursor.execute(
+                        "SELECT id, tags FROM chunks WHERE tags IS NOT NULL"
+                    ).fetchall()
+                    for tag in tags.split(",")
+                ],
+            )
+
+        # Change counter for the chunks table, bumped by triggers on every
+        # row written or deleted, so derived indexes can tell they are stale
+        cursor.execute(
+            "CREATE TABLE IF NOT EXISTS chunks_version (id INTEGER PRIMARY KEY, version INTEGER)"
+        )
+        cursor.execute("INSERT OR IGNORE INTO chunks_version (id, version) VALUES (0, 0)")
+        for event in ("INSERT", "UPDATE", "DELETE"):
+            cursor.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS chunks_version_{event.lower()}
+                AFTER {event} ON chunks
+                BEGIN
+                    UPDATE chunks_version SET version = version + 1 WHERE id = 0;
+                END
+            """)
+
         # Create indexes
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_chunks_document ON chunks(document_id)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_documents_source ON documents(source_path)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_chunk_tags_tag ON chunk_tags(tag)")
 
         conn.commit()
         logger.debug(f"Initialized metadata DB at {self.db_path}")
@@ -90,8 +155,18 @@ class MetadataStore:
     def _get_connection(self) -> sqlite3.Connection:
         """Get database connection."""
         if self._connection is None:
-            self._connection = sqlite3.connect(str(self.db_path))
+            # Allow use from worker threads (e.g. asyncio.to_thread); SQLite
+            # serializes access to a shared connection itself
+            self._connection = sqlite3.connect(
+                str(self.db_path), check_same_thread=False, cached_statements=256
+            )
             self._connection.row_factory = sqlite3.Row
+            # WAL lets readers run alongside a writer and, with synchronous=NORMAL,
+            # syncs at checkpoints rather than on every commit
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.execute("PRAGMA temp_store=MEMORY")
+            self._connection.execute("PRAGMA cache_size=-65536")  # 64 MiB
         return self._connection
 
     def close(self) -> None:
@@ -183,32 +258,57 @@ class MetadataStore:
         conn.commit()
 
     # Document operations
+    _INSERT_DOCUMENT = """
+        INSERT OR REPLACE INTO documents
+        (id, source_path, source_type, title, content_hash, indexed_at, metadata, mtime_ns, size)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
+    @staticmethod
+    def _document_row(doc: Document) -> tuple[Any, ...]:
+        """Convert a Document to an INSERT parameter row."""
+        return (
+            doc.id,
+            doc.source_path,
+            doc.source_type,
+            doc.title,
+            doc.content_hash,
+            doc.indexed_at.isoformat(),
+            str(doc.metadata),
+            doc.mtime_ns,
+            doc.size,
+        )
+
     def add_document(self, doc: Document) -> None:
         """Add a document to the database."""
         conn = self._get_connection()
         cursor = conn.cursor()
 
         try:
-            cursor.execute(
-                """
-                INSERT OR REPLACE INTO documents
-                (id, source_path, source_type, title, content_hash, indexed_at, metadata)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    doc.id,
-                    doc.source_path,
-                    doc.source_type,
-                    doc.title,
-                    doc.content_hash,
-                    doc.indexed_at.isoformat(),
-                    str(doc.metadata),
-                ),
-            )
+            cursor.execute(self._INSERT_DOCUMENT, self._document_row(doc))
             conn.commit()
         except sqlite3.Error as e:
             raise StorageError(f"Failed to add document: {e}") from e
 
+    def add_documents(self, docs: list[Document]) -> None:
+        """Add documents and their chunks in a single transaction.
+
+        Either every document and chunk is written or none are.
+
+        Args:
+            docs: Documents with their ``chunks`` populated
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        try:
+            cursor.executemany(self._INSERT_DOCUMENT, [self._document_row(d) for d in docs])
+            self._write_chunks(cursor, [c for d in docs for c in d.chunks])
+            conn.commit()
+        except sqlite3.Error as e:
+            conn.rollback()
+            raise StorageError(f"Failed to add documents: {e}") from e
+
     def get_document(self, doc_id: str) -> Document | None:
         """Get a document by ID."""
         conn = self._get_connection()
@@ -228,6 +328,8 @@ class MetadataStore:
             content="",  # Content not stored in DB
             content_hash=row["content_hash"],
             indexed_at=datetime.fromisoformat(row["indexed_at"]),
+            mtime_ns=row["mtime_ns"],
+            size=row["size"],
         )
 
     def document_exists(self, source_path: str, content_hash: str) -> bool:
@@ -241,54 +343,126 @@ class MetadataStore:
         )
         return cursor.fetchone() is not None
 
+    def fingerprint_matches(self, source_path: str, mtime_ns: int, size: int) -> bool:
+        """Check if a document was indexed from a file with the same mtime and size.
+
+        Lets callers skip unchanged files from a ``stat`` alone, without
+        reading or hashing them.
+
+        Args:
+            source_path: Path of the source file
+            mtime_ns: File modification time in nanoseconds
+            size: File size in bytes
+
+        Returns:
+            True if a matching document exists
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        cursor.execute(
+            "SELECT 1 FROM documents WHERE source_path = ? AND mtime_ns = ? AND size = ?",
+            (source_path, mtime_ns, size),
+        )
+        return cursor.fetchone() is not None
+
+    def update_fingerprint(
+        self,
+        source_path: str,
+        content_hash: str,
+        mtime_ns: int,
+        size: int,
+    ) -> None:
+        """Record a new mtime and size for a document whose content is unchanged.
+
+        Args:
+            source_path: Path of the source file
+            content_hash: Content hash of the indexed document
+            mtime_ns: File modification time in nanoseconds
+            size: File size in bytes
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute(
+                "UPDATE documents SET mtime_ns = ?, size = ? "
+                "WHERE source_path = ? AND content_hash = ?",
+                (mtime_ns, size, source_path, content_hash),
+            )
+            conn.commit()
+        except sqlite3.Error as e:
+            raise StorageError(f"Failed to update fingerprint: {e}") from e
+
     def delete_document(self, doc_id: str) -> None:
         """Delete a document and its chunks."""
         conn = self._get_connection()
         cursor = conn.cursor()
 
+        cursor.execute(
+            "DELETE FROM chunk_tags WHERE chunk_id IN "
+            "(SELECT id FROM chunks WHERE document_id = ?)",
+            (doc_id,),
+        )
         cursor.execute("DELETE FROM chunks WHERE document_id = ?", (doc_id,))
         cursor.execute("DELETE FROM documents WHERE id = ?", (doc_id,))
         conn.commit()
 
     # Chunk operations
+    _INSERT_CHUNK = """
+        INSERT OR REPLACE INTO chunks
+        (id, document_id, content, chunk_index, source_path, source_type,
+         start_line, end_line, heading, tags, title, author, created_at, extra)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
+    @staticmethod
+    def _chunk_row(chunk: Chunk) -> tuple[Any, ...]:
+        """Convert a Chunk to an INSERT parameter row."""
+        return (
+            chunk.id,
+            chunk.document_id,
+            chunk.content,
+            chunk.chunk_index,
+            chunk.metadata.source_path,
+            chunk.metadata.source_type,
+            chunk.metadata.start_line,
+            chunk.metadata.end_line,
+            chunk.metadata.heading,
+            ",".join(chunk.metadata.tags) if chunk.metadata.tags else None,
+            chunk.metadata.title,
+            chunk.metadata.author,
+            chunk.metadata.created_at.isoformat() if chunk.metadata.created_at else None,
+            str(chunk.metadata.extra) if chunk.metadata.extra else None,
+        )
+
+    @classmethod
+    def _write_chunks(cls, cursor: sqlite3.Cursor, chunks: list[Chunk]) -> None:
+        """Insert or replace chunks and their tag rows (caller commits)."""
+        rows = [cls._chunk_row(c) for c in chunks]
+        cursor.executemany(cls._INSERT_CHUNK, rows)
+        # A replaced chunk's old tags go; new ones mirror the stored CSV column
+        cursor.executemany("DELETE FROM chunk_tags WHERE chunk_id = ?", [(c.id,) for c in chunks])
+        cursor.executemany(
+            "INSERT OR IGNORE INTO chunk_tags (chunk_id, tag) VALUES (?, ?)",
+            [(row[0], tag) for row in rows if row[9] for tag in row[9].split(",")],
+        )
+
     def add_chunk(self, chunk: Chunk) -> None:
         """Add a chunk to the database."""
+        self.add_chunks([chunk])
+
+    def add_chunks(self, chunks: list[Chunk]) -> None:
+        """Add multiple chunks to the database in a single transaction."""
         conn = self._get_connection()
         cursor = conn.cursor()
 
         try:
-            cursor.execute(
-                """
-                INSERT OR REPLACE INTO chunks
-                (id, document_id, content, chunk_index, source_path, source_type,
-                 start_line, end_line, heading, tags, title, author, created_at, extra)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    chunk.id,
-                    chunk.document_id,
-                    chunk.content,
-                    chunk.chunk_index,
-                    chunk.metadata.source_path,
-                    chunk.metadata.source_type,
-                    chunk.metadata.start_line,
-                    chunk.metadata.end_line,
-                    chunk.metadata.heading,
-                    ",".join(chunk.metadata.tags) if chunk.metadata.tags else None,
-                    chunk.metadata.title,
-                    chunk.metadata.author,
-                    chunk.metadata.created_at.isoformat() if chunk.metadata.created_at else None,
-                    str(chunk.metadata.extra) if chunk.metadata.extra else None,
-                ),
-            )
+            self._write_chunks(cursor, chunks)
             conn.commit()
         except sqlite3.Error as e:
-            raise StorageError(f"Failed to add chunk: {e}") from e
-
-    def add_chunks(self, chunks: list[Chunk]) -> None:
-        """Add multiple chunks to the database."""
-        for chunk in chunks:
-            self.add_chunk(chunk)
+            conn.rollback()
+            raise StorageError(f"Failed to add chunks: {e}") from e
 
     def get_chunk(self, chunk_id: str) -> Chunk | None:
         """Get a chunk by ID."""
@@ -315,40 +489,81 @@ class MetadataStore:
 
         return [self._row_to_chunk(row) for row in rows]
 
-    def get_chunks_by_ids(self, chunk_ids: list[str]) -> list[Chunk]:
-        """Get multiple chunks by their IDs."""
+    def get_chunks_by_ids(
+        self,
+        chunk_ids: list[str],
+        tags: list[str] | None = None,
+    ) -> list[Chunk]:
+        """Get multiple chunks by their IDs.
+
+        Chunks come back in the order of ``chunk_ids``, so ranked IDs give
+        ranked chunks; unknown IDs are skipped and repeated ones returned once.
+
+        Args:
+            chunk_ids: Chunk IDs to fetch
+            tags: If given, only chunks with at least one of these tags
+        """
         if not chunk_ids:
             return []
 
         conn = self._get_connection()
         cursor = conn.cursor()
 
-        placeholders = ",".join("?" * len(chunk_ids))
-        cursor.execute(f"SELECT * FROM chunks WHERE id IN ({placeholders})", chunk_ids)
-        rows = cursor.fetchall()
+        ids = _pad_params(chunk_ids)
+        query = f"SELECT * FROM chunks WHERE id IN ({','.join('?' * len(ids))})"
+        params = ids
+        if tags:
+            tag_params = _pad_params(tags)
+            query += (
+                " AND EXISTS (SELECT 1 FROM chunk_tags WHERE chunk_id = chunks.id"
+                f" AND tag IN ({','.join('?' * len(tag_params))}))"
+            )
+            params = ids + tag_params
+        cursor.execute(query, params)
+        rows = {row["id"]: row for row in cursor.fetchall()}
 
-        return [self._row_to_chunk(row) for row in rows]
+        return [self._row_to_chunk(rows[id_]) for id_ in dict.fromkeys(chunk_ids) if id_ in rows]
+
+    def get_chunks_fingerprint(self) -> int:
+        """Get a cheap fingerprint of the chunks table.
+
+        Returns:
+            Change counter of the chunks table; every insert, replace, update
+            or delete of a chunk row increments it
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        cursor.execute("SELECT version FROM chunks_version WHERE id = 0")
+        version: int = cursor.fetchone()[0]
+        return version
 
     def _row_to_chunk(self, row: sqlite3.Row) -> Chunk:
-        """Convert a database row to a Chunk object."""
-        return Chunk(
-            id=row["id"],
-            document_id=row["document_id"],
-            content=row["content"],
-            chunk_index=row["chunk_index"],
-            metadata=ChunkMetadata(
-                source_path=row["source_path"],
-                source_type=row["source_type"],
-                start_line=row["start_line"],
-                end_line=row["end_line"],
-                heading=row["heading"],
-                tags=row["tags"].split(",") if row["tags"] else [],
-                title=row["title"],
-                author=row["author"],
-                created_at=datetime.fromisoformat(row["created_at"])
-                if row["created_at"]
-                else None,
-            ),
+        """Convert a database row to a Chunk object.
+
+        The chunk and its metadata are validated from one nested dict, in a
+        single pass of pydantic's validator.
+        """
+        created_at = row["created_at"]
+        tags = row["tags"]
+        return Chunk.model_validate(
+            {
+                "id": row["id"],
+                "document_id": row["document_id"],
+                "content": row["content"],
+                "chunk_index": row["chunk_index"],
+                "metadata": {
+                    "source_path": row["source_path"],
+                    "source_type": row["source_type"],
+                    "start_line": row["start_line"],
+                    "end_line": row["end_line"],
+                    "heading": row["heading"],
+                    "tags": tags.split(",") if tags else [],
+                    "title": row["title"],
+                    "author": row["author"],
+                    "created_at": datetime.fromisoformat(created_at) if created_at else None,
+                },
+            }
         )
 
     def get_stats(self) -> dict[str, int]:
@@ -1,22 +1,41 @@
 """Qdrant vector store wrapper."""
 
 import hashlib
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 from loguru import logger
 from qdrant_client import QdrantClient
 from qdrant_client.models import (
+    Condition,
     Distance,
-    PointStruct,
-    VectorParams,
-    Filter,
     FieldCondition,
+    Filter,
+    HasIdCondition,
     MatchValue,
+    PointStruct,
+    QueryRequest,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
+    ScoredPoint,
+    VectorParams,
 )
 
+try:
+    import xxhash
+
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
 from nexus.exceptions import StorageError
 
+# Points sent per upsert request
+UPSERT_BATCH_SIZE = 256
+
 
 def _string_to_int_id(s: str) -> int:
     """Convert string ID to integer ID for Qdrant."""
@@ -24,6 +43,25 @@ def _string_to_int_id(s: str) -> int:
     return int(hashlib.md5(s.encode()).hexdigest()[:16], 16)
 
 
+def _blake2b_int_id(s: str) -> int:
+    """Convert string ID to a 64-bit integer ID via BLAKE2b."""
+    return int.from_bytes(hashlib.blake2b(s.encode(), digest_size=8).digest(), "big")
+
+
+def _xxh3_int_id(s: str) -> int:
+    """Convert string ID to a 64-bit integer ID via XXH3."""
+    return xxhash.xxh3_64_intdigest(s.encode())
+
+
+# Point ID schemes a collection may use, preferred first. New collections
+# take the first; existing ones keep whichever their points were written with.
+_ID_SCHEMES: list[Callable[[str], int]] = [
+    *([_xxh3_int_id] if XXHASH_AVAILABLE else []),
+    _blake2b_int_id,
+    _string_to_int_id,
+]
+
+
 class VectorStore:
     """Qdrant-based vector storage for embeddings."""
 
@@ -33,6 +71,7 @@ class VectorStore:
         path: Path | None = None,
         url: str | None = None,
         embedding_dim: int = 768,
+        quantize: bool = False,
     ) -> None:
         """Initialize vector store.
 
@@ -41,9 +80,14 @@ class VectorStore:
             path: Path for embedded Qdrant storage
             url: URL for Qdrant server (if using server mode)
             embedding_dim: Dimension of embedding vectors
+            quantize: Create the collection with int8 scalar quantization, so
+                a Qdrant server scores candidates on in-RAM int8 vectors and
+                rescores the best with the originals. Only applies when the
+                collection is created; embedded Qdrant ignores it.
         """
         self.collection_name = collection_name
         self.embedding_dim = embedding_dim
+        self.quantize = quantize
 
         if url:
             self.client = QdrantClient(url=url)
@@ -68,10 +112,45 @@ class VectorStore:
                     size=self.embedding_dim,
                     distance=Distance.COSINE,
                 ),
+                quantization_config=(
+                    ScalarQuantization(
+                        scalar=ScalarQuantizationConfig(
+                            type=ScalarType.INT8,
+                            quantile=0.99,
+                            always_ram=True,
+                        )
+                    )
+                    if self.quantize
+                    else None
+                ),
             )
             logger.info(f"Created collection '{self.collection_name}'")
+            self._point_id = _ID_SCHEMES[0]
         else:
             logger.debug(f"Collection '{self.collection_name}' already exists")
+            self._point_id = self._detect_id_scheme()
+
+    def _detect_id_scheme(self) -> Callable[[str], int]:
+        """Find the string-to-int ID hash an existing collection was written with.
+
+        Checks a stored point's integer ID against the hash of its original
+        string ID, so collections written before a faster hash was adopted
+        keep resolving to the same points.
+        """
+        points, _ = self.client.scroll(
+            collection_name=self.collection_name,
+            limit=1,
+            with_payload=["_original_id"],
+            with_vectors=False,
+        )
+        original_id = (points[0].payload or {}).get("_original_id") if points else None
+        if not original_id:
+            return _ID_SCHEMES[0]
+        for scheme in _ID_SCHEMES:
+            if scheme(original_id) == points[0].id:
+                return scheme
+        logger.warning(f"Unrecognized point IDs in '{self.collection_name}'; using MD5")
+        return _string_to_int_id
 
     def add_vectors(
         self,
@@ -93,34 +172,35 @@ class VectorStore:
             raise StorageError("payloads must have the same length as ids")
 
         # Build points with int IDs and original string ID in payload
-        points = []
-        for i, (str_id, vector) in enumerate(zip(ids, vectors)):
-            int_id = _string_to_int_id(str_id)
-            payload = (payloads[i] if payloads else {}).copy()
-            payload["_original_id"] = str_id  # Store original string ID
-            points.append(
-                PointStruct(
-                    id=int_id,
-                    vector=vector,
-                    payload=payload,
-                )
+        point_ids = map(self._point_id, ids)
+        points = [
+            PointStruct(id=int_id, vector=vector, payload={**payload, "_original_id": str_id})
+            for int_id, vector, payload, str_id in zip(
+                point_ids, vectors, payloads or [{}] * len(ids), ids, strict=True
             )
+        ]
 
+        # Only the last batch waits: Qdrant applies a collection's updates in
+        # order, so once it is acknowledged the earlier ones are applied too
         try:
-            self.client.upsert(
-                collection_name=self.collection_name,
-                points=points,
-            )
+            for start in range(0, len(points), UPSERT_BATCH_SIZE):
+                batch = points[start : start + UPSERT_BATCH_SIZE]
+                self.client.upsert(
+                    collection_name=self.collection_name,
+                    points=batch,
+                    wait=start + UPSERT_BATCH_SIZE >= len(points),
+                )
             logger.debug(f"Added {len(points)} vectors to collection")
         except Exception as e:
             raise StorageError(f"Failed to add vectors: {e}") from e
 
     def search(
         self,
-        query_vector: list[float],
+        query_vector: list[float] | np.ndarray,
         limit: int = 10,
         filters: dict[str, Any] | None = None,
         score_threshold: float | None = None,
+        ids: list[str] | None = None,
     ) -> list[dict[str, Any]]:
         """Search for similar vectors.
 
@@ -129,46 +209,100 @@ class VectorStore:
             limit: Maximum number of results
             filters: Optional metadata filters
             score_threshold: Minimum score threshold
+            ids: Optional allow-list of vector IDs to restrict the search to
 
         Returns:
             List of results with id, score, and payload
         """
-        qdrant_filter = None
-        if filters:
-            conditions = []
-            for key, value in filters.items():
-                conditions.append(
-                    FieldCondition(key=key, match=MatchValue(value=value))
-                )
-            qdrant_filter = Filter(must=conditions)
-
         try:
             response = self.client.query_points(
                 collection_name=self.collection_name,
                 query=query_vector,
                 limit=limit,
-                query_filter=qdrant_filter,
+                query_filter=self._build_filter(filters, ids),
+                score_threshold=score_threshold,
+            )
+        except Exception as e:
+            raise StorageError(f"Search failed: {e}") from e
+
+        return [self._to_result(point) for point in response.points]
+
+    def search_many(
+        self,
+        query_vectors: list[list[float]] | list[np.ndarray] | np.ndarray,
+        limit: int = 10,
+        filters: dict[str, Any] | None = None,
+        score_threshold: float | None = None,
+        ids: list[str] | None = None,
+    ) -> list[list[dict[str, Any]]]:
+        """Search for several query vectors in one request.
+
+        Args:
+            query_vectors: Query embedding vectors
+            limit: Maximum number of results per query
+            filters: Optional metadata filters, shared by all queries
+            score_threshold: Minimum score threshold
+            ids: Optional allow-list of vector IDs to restrict the search to
+
+        Returns:
+            For each query vector, in order, results as returned by ``search``
+        """
+        if len(query_vectors) == 0:
+            return []
+
+        qdrant_filter = self._build_filter(filters, ids)
+        requests = [
+            QueryRequest(
+                query=vector.tolist() if isinstance(vector, np.ndarray) else vector,
+                limit=limit,
+                filter=qdrant_filter,
                 score_threshold=score_threshold,
+                with_payload=True,
             )
+            for vector in query_vectors
+        ]
 
-            return [
-                {
-                    "id": point.payload.get("_original_id", str(point.id)),
-                    "score": point.score,
-                    "payload": {k: v for k, v in (point.payload or {}).items() if k != "_original_id"},
-                }
-                for point in response.points
-            ]
+        try:
+            responses = self.client.query_batch_points(
+                collection_name=self.collection_name,
+                requests=requests,
+            )
         except Exception as e:
             raise StorageError(f"Search failed: {e}") from e
 
+        return [[self._to_result(point) for point in r.points] for r in responses]
+
+    def _build_filter(
+        self,
+        filters: dict[str, Any] | None,
+        ids: list[str] | None,
+    ) -> Filter | None:
+        """Build a Qdrant filter from exact-match conditions and an ID allow-list."""
+        conditions: list[Condition] = [
+            FieldCondition(key=key, match=MatchValue(value=value))
+            for key, value in (filters or {}).items()
+        ]
+        if ids is not None:
+            conditions.append(HasIdCondition(has_id=[self._point_id(id_) for id_ in ids]))
+        return Filter(must=conditions) if conditions else None
+
+    @staticmethod
+    def _to_result(point: ScoredPoint) -> dict[str, Any]:
+        """Convert a scored point to a result dict keyed by the original string ID."""
+        payload = point.payload or {}
+        return {
+            "id": payload.get("_original_id", str(point.id)),
+            "score": point.score,
+            "payload": {k: v for k, v in payload.items() if k != "_original_id"},
+        }
+
     def delete_vectors(self, ids: list[str]) -> None:
         """Delete vectors by IDs.
 
         Args:
             ids: Vector IDs to delete (string IDs, converted to int internally)
         """
-        int_ids = [_string_to_int_id(id_) for id_ in ids]
+        int_ids = [self._point_id(id_) for id_ in ids]
         try:
             self.client.delete(
                 collection_name=self.collection_name,
@@ -178,6 +312,28 @@ class VectorStore:
         except Exception as e:
             raise StorageError(f"Failed to delete vectors: {e}") from e
 
+    def get_vector(self, id_: str) -> np.ndarray | None:
+        """Get the stored vector for an ID.
+
+        Args:
+            id_: Vector ID
+
+        Returns:
+            The vector, or None if the ID is not in the collection
+        """
+        try:
+            points = self.client.retrieve(
+                collection_name=self.collection_name,
+                ids=[self._point_id(id_)],
+                with_payload=False,
+                with_vectors=True,
+            )
+        except Exception as e:
+            raise StorageError(f"Failed to get vector: {e}") from e
+        if not points:
+            return None
+        return np.asarray(points[0].vector, dtype=np.float32)
+
     def get_count(self) -> int:
         """Get total number of vectors in collection."""
         try:
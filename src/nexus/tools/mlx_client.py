@@ -33,6 +33,7 @@ class MLXLMClient:
         messages: list[dict[str, str]],
         temperature: float = 0.7,
         max_tokens: int = 1024,
+        stop: list[str] | None = None,
     ) -> str:
         """Send chat completion request.
         
@@ -40,19 +41,24 @@ class MLXLMClient:
             messages: List of message dicts with 'role' and 'content'
             temperature: Sampling temperature
             max_tokens: Maximum tokens to generate
+            stop: Sequences that end generation server-side
             
         Returns:
             Generated response text
         """
+        payload: dict[str, Any] = {
+            "model": self.model,
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+        }
+        if stop:
+            payload["stop"] = stop
+        
         try:
             response = self._client.post(
                 f"{self.base_url}/v1/chat/completions",
-                json={
-                    "model": self.model,
-                    "messages": messages,
-                    "temperature": temperature,
-                    "max_tokens": max_tokens,
-                },
+                json=payload,
             )
             response.raise_for_status()
             data = response.json()
@@ -72,6 +78,7 @@ class MLXLMClient:
         prompt: str,
         temperature: float = 0.7,
         max_tokens: int = 1024,
+        stop: list[str] | None = None,
     ) -> str:
         """Generate text from a prompt.
         
@@ -79,12 +86,13 @@ class MLXLMClient:
             prompt: Input prompt
             temperature: Sampling temperature
             max_tokens: Maximum tokens to generate
+            stop: Sequences that end generation server-side
             
         Returns:
             Generated text
         """
         messages = [{"role": "user", "content": prompt}]
-        return self.chat(messages, temperature=temperature, max_tokens=max_tokens)
+        return self.chat(messages, temperature=temperature, max_tokens=max_tokens, stop=stop)
 
     def is_available(self) -> bool:
         """Check if MLX-LM server is available."""
@@ -1,6 +1,7 @@
 """Nexus MCP Server implementation."""
 
 import asyncio
+from collections.abc import Coroutine
 from pathlib import Path
 from typing import Any
 
@@ -20,6 +21,26 @@ from nexus.storage.metadata import MetadataStore
 from nexus.storage.vectors import VectorStore
 from nexus.memory.store import MemoryStore, MemoryType
 
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+
+def run_async(main: Coroutine[Any, Any, Any]) -> Any:
+    """Run a coroutine to completion, on uvloop when it is installed.
+
+    Args:
+        main: Coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+    if UVLOOP_AVAILABLE:
+        return uvloop.run(main)
+    return asyncio.run(main)
+
 
 class NexusServer:
     """Nexus MCP server for knowledge retrieval."""
@@ -59,6 +80,8 @@ class NexusServer:
                 model_name=self.config.embedding.model,
                 batch_size=self.config.embedding.batch_size,
                 normalize=self.config.embedding.normalize,
+                backend=self.config.embedding.backend,
+                model_file=self.config.embedding.model_file,
             )
         return self._embedder
 
@@ -77,6 +100,7 @@ class NexusServer:
                 collection_name=self.config.storage.collection_name,
                 path=self.config.storage.qdrant_path,
                 embedding_dim=self.embedder.dimension,
+                quantize=self.config.storage.quantize_vectors,
             )
         return self._vector_store
 
@@ -85,13 +109,14 @@ class NexusServer:
         """Lazy-load search engine."""
         if self._search_engine is None:
             bm25_index = BM25Index(self.metadata_store)
-            bm25_index.build_index()
+            bm25_index.load_or_build(self.config.storage.qdrant_path.parent / "bm25.pkl")
             self._search_engine = HybridSearchEngine(
                 embedder=self.embedder,
                 metadata_store=self.metadata_store,
                 vector_store=self.vector_store,
                 bm25_index=bm25_index,
                 top_k=self.config.retrieval.top_k,
+                semantic_cache_threshold=self.config.retrieval.semantic_cache_threshold,
             )
         return self._search_engine
 
@@ -716,7 +741,7 @@ def run_server(config_path: Path | None = None) -> None:
     """Run the Nexus MCP server."""
     server = NexusServer(config_path=config_path)
     try:
-        asyncio.run(server.run_stdio())
+        run_async(server.run_stdio())
     finally:
         server.close()
 
@@ -176,3 +176,39 @@ class TestHybridSearch:
         assert len(results) <= 2
         
         hybrid_setup.use_reranking = False
+
+    def test_search_with_vector_matches_search(self, hybrid_setup):
+        """Test that a precomputed query embedding gives the same results."""
+        query = "machine learning neural networks"
+        vector = hybrid_setup.embedder.embed_queries([query])[0]
+
+        expected = hybrid_setup.search(query)
+        results = hybrid_setup.search_with_vector(vector, query)
+
+        assert [r.chunk_id for r in results] == [r.chunk_id for r in expected]
+
+    def test_search_many_matches_search(self, hybrid_setup):
+        """Test that batched search returns per-query results in order."""
+        queries = ["machine learning neural networks", "python programming"]
+
+        batched = hybrid_setup.search_many(queries, top_k=3)
+
+        assert len(batched) == len(queries)
+        for query, results in zip(queries, batched, strict=True):
+            expected = hybrid_setup.search(query, top_k=3)
+            assert [r.chunk_id for r in results] == [r.chunk_id for r in expected]
+
+    def test_semantic_cache_reuses_results(self, hybrid_setup):
+        """Test that a repeated query is served from the semantic cache."""
+        hybrid_setup.semantic_cache_threshold = 0.97
+        query = "python programming"
+
+        first = hybrid_setup.search(query)
+        assert len(hybrid_setup._semantic_cache) == 1
+
+        second = hybrid_setup.search(query)
+        assert [r.chunk_id for r in second] == [r.chunk_id for r in first]
+        assert len(hybrid_setup._semantic_cache) == 1
+
+        hybrid_setup.build_bm25_index()
+        assert len(hybrid_setup._semantic_cache) == 0
@@ -0,0 +1,208 @@
+"""Tests for LLM-judged evaluation."""
+
+import threading
+
+import pytest
+
+from nexus.eval.extended_ragas import (
+    LEXICAL_MATCH_THRESHOLD,
+    _lexical_overlap,
+    _parse_judge_scores,
+    create_extended_eval_dataset,
+    evaluate_with_llm,
+    iter_extended_eval_dataset,
+)
+from nexus.exceptions import EvaluationError
+from nexus.models.search import SearchResult
+
+
+class FakeSearchEngine:
+    """Search engine returning one fixed result per query."""
+
+    def search(self, query: str, top_k: int = 5) -> list[SearchResult]:
+        return [
+            SearchResult(
+                chunk_id=f"{query}-0",
+                content=f"Context for {query}",
+                source="/notes/python_guide.md",
+                source_type="markdown",
+                relevance_score=1.0,
+            )
+        ]
+
+    def search_many(self, queries: list[str], top_k: int = 5) -> list[list[SearchResult]]:
+        return [self.search(query, top_k) for query in queries]
+
+
+class FakeLLM:
+    """LLM client that answers generation prompts and scores judge prompts."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def generate(
+        self,
+        prompt: str,
+        temperature: float = 0.7,
+        max_tokens: int = 1024,
+        stop: list[str] | None = None,
+    ) -> str:
+        with self._lock:
+            self.calls += 1
+        if prompt.startswith("Based on"):
+            return "An answer."
+        return '{"faithfulness": 0.8, "relevancy": 0.6}'
+
+
+class TestEvaluateWithLLM:
+    """Tests for evaluate_with_llm."""
+
+    def test_metrics_and_order(self):
+        """Test that concurrent evaluation keeps input order and aggregates metrics."""
+        eval_data = [
+            {"question": f"Question {i}?", "ground_truth": "Truth", "expected_source": "python_guide.md"}
+            for i in range(10)
+        ]
+        llm = FakeLLM()
+
+        report = evaluate_with_llm(
+            FakeSearchEngine(), llm, eval_data, max_workers=4, cache=False, lexical_shortcut=False
+        )
+
+        assert [d["question"] for d in report["details"]] == [e["question"] for e in eval_data]
+        assert report["metrics"]["hit_rate"] == 1.0
+        assert report["metrics"]["avg_context_precision"] == 1.0
+        assert abs(report["metrics"]["avg_faithfulness"] - 0.8) < 1e-9
+        assert abs(report["metrics"]["avg_answer_relevancy"] - 0.6) < 1e-9
+        assert report["metrics"]["num_queries"] == 10
+        assert llm.calls == 20
+
+    def test_responses_are_cached(self, temp_dir):
+        """Test that a second run reuses cached LLM responses."""
+        eval_data = [
+            {"question": "What is Python?", "ground_truth": "A language", "expected_source": "python_guide.md"}
+        ]
+        llm = FakeLLM()
+
+        first = evaluate_with_llm(
+            FakeSearchEngine(), llm, eval_data, cache_dir=temp_dir, lexical_shortcut=False
+        )
+        assert llm.calls == 2
+
+        second = evaluate_with_llm(
+            FakeSearchEngine(), llm, eval_data, cache_dir=temp_dir, lexical_shortcut=False
+        )
+        assert llm.calls == 2
+        assert second["details"] == first["details"]
+
+    def test_repeated_inputs_are_judged_once(self):
+        """Test identical question/context/answer triples share one judge call."""
+        llm = FakeLLM()
+        eval_data = [
+            {"question": "Q", "ground_truth": "A", "expected_source": "python_guide.md"}
+        ] * 4
+
+        report = evaluate_with_llm(
+            FakeSearchEngine(), llm, eval_data, max_workers=1, cache=False, lexical_shortcut=False
+        )
+
+        # One generation per example, one judge call for the shared input
+        assert llm.calls == 4 + 1
+        assert all(r["faithfulness"] == 0.8 for r in report["details"])
+
+    def test_contexts_are_optional_and_truncated(self):
+        """Test contexts are dropped by default and truncated when kept."""
+        eval_data = create_extended_eval_dataset()[:2]
+
+        report = evaluate_with_llm(FakeSearchEngine(), FakeLLM(), eval_data, cache=False)
+        assert all(r["contexts"] is None for r in report["details"])
+
+        report = evaluate_with_llm(
+            FakeSearchEngine(), FakeLLM(), eval_data, cache=False,
+            keep_contexts=True, context_max_chars=7,
+        )
+        assert report["details"][0]["contexts"] == ["Context"]
+
+    def test_empty_retrieval_skips_llm(self):
+        """Test examples with no retrieved context score zero without LLM calls."""
+
+        class EmptySearchEngine:
+            def search_many(self, queries: list[str], top_k: int = 5) -> list[list[SearchResult]]:
+                return [[] for _ in queries]
+
+        llm = FakeLLM()
+        eval_data = create_extended_eval_dataset()[:3]
+
+        report = evaluate_with_llm(EmptySearchEngine(), llm, eval_data, cache=False)
+
+        assert llm.calls == 0
+        assert report["metrics"]["hit_rate"] == 0.0
+        assert report["metrics"]["avg_faithfulness"] == 0.0
+
+    def test_aborts_after_consecutive_failures(self):
+        """Test a run with a failing LLM stops early instead of scoring fallbacks."""
+
+        class BrokenLLM:
+            def __init__(self) -> None:
+                self.calls = 0
+
+            def generate(self, prompt: str, **kwargs) -> str:
+                self.calls += 1
+                raise ConnectionError("LLM server not running")
+
+        llm = BrokenLLM()
+        eval_data = create_extended_eval_dataset()
+
+        with pytest.raises(EvaluationError):
+            evaluate_with_llm(
+                FakeSearchEngine(), llm, eval_data, max_workers=1, cache=False,
+                max_consecutive_failures=3,
+            )
+        assert llm.calls < len(eval_data)
+
+    def test_lexical_shortcut_skips_judge(self):
+        """Test answers matching the ground truth are scored without the judge."""
+        pytest.importorskip("rapidfuzz")
+        llm = FakeLLM()
+        eval_data = [
+            {"question": "Q", "ground_truth": "An answer.", "expected_source": "python_guide.md"}
+        ]
+
+        report = evaluate_with_llm(
+            FakeSearchEngine(), llm, eval_data, cache=False, lexical_shortcut=True
+        )
+
+        assert llm.calls == 1  # generation only
+        assert report["details"][0]["faithfulness"] == 1.0
+
+    def test_lexical_overlap_penalizes_missing_tokens(self):
+        """Test a one-word answer is not a lexical match for a long ground truth."""
+        pytest.importorskip("rapidfuzz")
+        ground_truth = "Nexus is written in Python and stores vectors in Qdrant."
+
+        assert _lexical_overlap("Python", ground_truth) < LEXICAL_MATCH_THRESHOLD
+        assert _lexical_overlap(ground_truth, ground_truth) == 1.0
+
+    def test_parse_judge_scores(self):
+        """Test parsing JSON and free-form judge replies."""
+        assert _parse_judge_scores('{"faithfulness":1,"relevancy":0.5}') == (1.0, 0.5)
+        assert _parse_judge_scores("Faithfulness: 0.9, relevancy: 0.7") == (0.9, 0.7)
+        assert _parse_judge_scores('{"faithfulness":1.5,"relevancy":-1}') == (1.0, 0.0)
+        assert _parse_judge_scores("faithfulness: 1.5, relevancy 0.3") == (1.0, 0.3)
+
+        with pytest.raises(ValueError):
+            _parse_judge_scores("no scores here")
+
+
+class TestExtendedDataset:
+    """Tests for the packaged evaluation dataset."""
+
+    def test_dataset_loads_from_jsonl(self):
+        """Test the streamed and materialized datasets match."""
+        dataset = create_extended_eval_dataset()
+
+        assert len(dataset) >= 50
+        assert list(iter_extended_eval_dataset()) == dataset
+        assert set(dataset[0]) == {"question", "ground_truth", "expected_source"}
+        assert create_extended_eval_dataset() is dataset
@@ -0,0 +1,65 @@
+"""Tests for retrieval evaluation."""
+
+import json
+from pathlib import Path
+
+from nexus.eval.ragas import evaluate_retrieval, save_evaluation_report
+from nexus.models.search import SearchResult
+
+
+class FakeSearchEngine:
+    """Search engine returning a fixed ranking of sources."""
+
+    SOURCES = ["/notes/a.md", "/notes/b.md", "/notes/c.md"]
+
+    def search(self, query: str, top_k: int = 5) -> list[SearchResult]:
+        return [
+            SearchResult(
+                chunk_id=f"{query}-{i}",
+                content=f"Context {i}",
+                source=source,
+                source_type="markdown",
+                relevance_score=1.0 - i * 0.25,
+            )
+            for i, source in enumerate(self.SOURCES[:top_k])
+        ]
+
+    def search_many(self, queries: list[str], top_k: int = 5) -> list[list[SearchResult]]:
+        return [self.search(query, top_k) for query in queries]
+
+
+class TestEvaluateRetrieval:
+    """Tests for evaluate_retrieval."""
+
+    def test_metrics(self):
+        """Test hit rate, MRR and top score aggregation."""
+        eval_data = [
+            {"question": "q1", "expected_source": "a.md"},
+            {"question": "q2", "expected_source": "b.md"},
+            {"question": "q3", "expected_source": "missing.md"},
+        ]
+
+        report = evaluate_retrieval(FakeSearchEngine(), eval_data)
+        metrics = report["metrics"]
+
+        assert abs(metrics["hit_rate@k"] - 2 / 3) < 1e-9
+        assert abs(metrics["mrr"] - 0.5) < 1e-9
+        assert metrics["avg_top_score"] == 1.0
+        assert metrics["num_queries"] == 3
+        assert [r["hit_position"] for r in report["details"]] == [1, 2, 0]
+
+    def test_save_report(self, temp_dir: Path):
+        """Test the report is written as readable JSON."""
+        report = {
+            "metrics": evaluate_retrieval(
+                FakeSearchEngine(), [{"question": "q1", "expected_source": "a.md"}]
+            )["metrics"],
+            "path": temp_dir,
+        }
+        output_path = temp_dir / "report.json"
+
+        save_evaluation_report(report, output_path)
+
+        saved = json.loads(output_path.read_text())
+        assert saved["metrics"]["num_queries"] == 1
+        assert saved["path"] == str(temp_dir)
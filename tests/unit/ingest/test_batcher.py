@@ -0,0 +1,64 @@
+"""Tests for the embedding batcher."""
+
+import threading
+
+import pytest
+
+from nexus.ingest.batcher import EmbeddingBatcher
+
+
+class RecordingEmbedder:
+    """Embedder that records the batches it is called with."""
+
+    def __init__(self) -> None:
+        self.batches: list[list[str]] = []
+
+    def embed_texts(self, texts: list[str]) -> list[list[float]]:
+        self.batches.append(list(texts))
+        return [[float(len(text))] for text in texts]
+
+
+class TestEmbeddingBatcher:
+    """Tests for EmbeddingBatcher class."""
+
+    def test_concurrent_requests_share_a_batch(self):
+        """Test that requests arriving together are embedded in one call."""
+        embedder = RecordingEmbedder()
+        batcher = EmbeddingBatcher(embedder, max_batch=100, max_wait_ms=200)
+
+        texts = [["a"], ["bb", "ccc"], ["dddd"]]
+        results: list[list[list[float]]] = [[] for _ in texts]
+        start = threading.Barrier(len(texts))
+
+        def run(i: int) -> None:
+            start.wait()
+            results[i] = batcher.embed_texts(texts[i])
+
+        threads = [threading.Thread(target=run, args=(i,)) for i in range(len(texts))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == [[[1.0]], [[2.0], [3.0]], [[4.0]]]
+        assert len(embedder.batches) == 1
+
+    def test_full_batch_does_not_wait(self):
+        """Test that a request of max_batch texts is embedded right away."""
+        embedder = RecordingEmbedder()
+        batcher = EmbeddingBatcher(embedder, max_batch=2, max_wait_ms=10_000)
+
+        assert batcher.embed_texts(["a", "bb"]) == [[1.0], [2.0]]
+
+    def test_errors_reach_the_caller(self):
+        """Test that an embedding failure is raised from the caller's future."""
+
+        class FailingEmbedder:
+            def embed_texts(self, texts: list[str]) -> list[list[float]]:
+                raise RuntimeError("model unavailable")
+
+        batcher = EmbeddingBatcher(FailingEmbedder(), max_wait_ms=0)
+
+        with pytest.raises(RuntimeError, match="model unavailable"):
+            batcher.embed_texts(["a"])
+        assert batcher.embed_texts([]) == []
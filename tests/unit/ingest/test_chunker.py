@@ -1,8 +1,10 @@
 """Tests for text chunker."""
 
+import re
+
 import pytest
 
-from nexus.ingest.chunker import TextChunker
+from nexus.ingest.chunker import TextChunker, _split_sentences
 
 
 class TestTextChunker:
@@ -117,3 +119,97 @@ Second paragraph."""
         for chunk in chunks:
             assert chunk.start_line >= 1
             assert chunk.end_line >= chunk.start_line
+
+    def test_sections_split_exactly_at_heading_lines(self):
+        """Test that each section holds exactly the lines up to the next heading."""
+        chunker = TextChunker(chunk_size=500, min_chunk_size=1)
+
+        text = "Intro line.\n# One\nBody one.\n\n## Two\nBody two.\n\n"
+        headings = [(1, "One", 2), (2, "Two", 5)]
+
+        chunks = chunker.chunk_text(text, headings)
+
+        assert [(c.content, c.start_line, c.end_line) for c in chunks] == [
+            ("Intro line.", 1, 1),
+            ("# One\nBody one.", 2, 4),
+            ("## Two\nBody two.", 5, 8),
+        ]
+
+    def test_unknown_strategy_is_rejected(self):
+        """Test that an unknown strategy name raises."""
+        with pytest.raises(ValueError):
+            TextChunker(strategy="fixed")
+
+    def test_hierarchical_leaves_and_overlaps(self):
+        """Test balanced leaves with one overlap chunk between each pair."""
+        chunker = TextChunker(
+            chunk_size=110, min_chunk_size=1, strategy="hierarchical", max_depth=2
+        )
+        # 52 characters each, so two paragraphs (106 with the separator) fit
+        paragraphs = [f"Paragraph {i} " + "x" * 40 for i in range(8)]
+        text = "\n\n".join(paragraphs)
+
+        chunks = chunker.chunk_text(text)
+
+        # 4 leaves of 2 paragraphs, and 3 overlap chunks of 1 + 1 paragraphs
+        assert len(chunks) == 2 * 4 - 1
+        leaves = chunks[::2]
+        assert [c.content for c in leaves] == [
+            "\n\n".join(paragraphs[i : i + 2]) for i in range(0, 8, 2)
+        ]
+        assert chunks[1].content == "\n\n".join(paragraphs[1:3])
+        assert [(c.start_line, c.end_line) for c in leaves] == [
+            (1, 3), (5, 7), (9, 11), (13, 15)
+        ]
+
+    def test_hierarchical_splits_oversized_leaves_by_sentence(self):
+        """Test that a paragraph longer than chunk_size is split by sentences."""
+        chunker = TextChunker(
+            chunk_size=200, chunk_overlap=20, min_chunk_size=1, strategy="hierarchical"
+        )
+        long_paragraph = " ".join(f"Sentence number {i} of the long paragraph." for i in range(70))
+        text = "Short intro paragraph.\n\n" + long_paragraph
+
+        chunks = chunker.chunk_text(text)
+
+        assert chunks[0].content == "Short intro paragraph."
+        assert len(chunks) > 2
+        assert all(len(c.content) <= 200 for c in chunks)
+        assert all(c.start_line == 3 for c in chunks[1:])
+
+    def test_hierarchical_overlaps_fit_chunk_size(self):
+        """Test that overlap chunks never exceed chunk_size."""
+        chunker = TextChunker(chunk_size=512, min_chunk_size=1, strategy="hierarchical")
+        # Single-paragraph leaves, so any overlap would hold two whole leaves
+        paragraphs = [f"Paragraph {i} " + "y" * 387 for i in range(4)]
+
+        chunks = chunker.chunk_text("\n\n".join(paragraphs))
+
+        assert all(len(c.content) <= 512 for c in chunks)
+        assert [c.content for c in chunks] == paragraphs
+
+    def test_hierarchical_stops_when_text_fits(self):
+        """Test that text within chunk_size stays a single chunk."""
+        chunker = TextChunker(chunk_size=500, min_chunk_size=1, strategy="hierarchical")
+
+        chunks = chunker.chunk_text("First paragraph.\n\nSecond paragraph.")
+
+        assert [c.content for c in chunks] == ["First paragraph.\n\nSecond paragraph."]
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "",
+        "No punctuation here",
+        "One. Two! Three? Four",
+        "Ends with a stop.",
+        "Trailing space. ",
+        "a. . b",
+        "Wait... what?!  Yes.\n\nNext",
+        "Tabs.\tand\u00a0.\u00a0unicode",
+    ],
+)
+def test_split_sentences_matches_lookbehind_split(text: str):
+    """Test that _split_sentences equals the lookbehind regex split."""
+    assert _split_sentences(text) == re.split(r"(?<=[.!?])\s+", text)
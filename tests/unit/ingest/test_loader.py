@@ -1,9 +1,12 @@
 """Tests for markdown loader."""
 
+import pickle
+import re
+
 import pytest
 from pathlib import Path
 
-from nexus.ingest.loader import MarkdownLoader
+from nexus.ingest.loader import MarkdownLoader, _split_frontmatter, find_files
 
 
 class TestMarkdownLoader:
@@ -64,6 +67,14 @@ Content 2
         assert doc.headings[1][1] == "Section 1"
         assert doc.headings[2][1] == "Subsection 1.1"
         assert doc.headings[3][1] == "Section 2"
+        assert [line for _, _, line in doc.headings] == [1, 3, 7, 9]
+
+    def test_heading_marker_without_text_on_same_line(self):
+        """Test a bare '#' line does not swallow the following line as a heading."""
+        loader = MarkdownLoader()
+        doc = loader.parse("#\nNot a heading\n\n## Real heading\n")
+
+        assert doc.headings == [(2, "Real heading", 4)]
 
     def test_load_file(self, sample_markdown_file: Path):
         """Test loading a markdown file."""
@@ -75,6 +86,50 @@ Content 2
         assert "python" in doc.tags
         assert "machine learning" in doc.content
 
+    def test_parse_bytes_matches_text_mode_read(self, temp_dir: Path):
+        """Test that parsing raw bytes equals parsing the text-mode read."""
+        loader = MarkdownLoader()
+        path = temp_dir / "note.md"
+        path.write_bytes(b"---\r\ntitle: CRLF\r\n---\r\n# Heading\r\n\r\nBody\r\n")
+
+        assert loader.parse_bytes(path.read_bytes()) == loader.parse(path.read_text())
+
+    def test_load_file_reuses_parse_until_file_changes(self, temp_dir: Path, monkeypatch):
+        """Test that an unchanged file is parsed once and a changed one again."""
+        loader = MarkdownLoader()
+        parses: list[bytes] = []
+        parse_bytes = loader.parse_bytes
+
+        def counting_parse_bytes(raw: bytes):
+            parses.append(raw)
+            return parse_bytes(raw)
+
+        monkeypatch.setattr(loader, "parse_bytes", counting_parse_bytes)
+        path = temp_dir / "note.md"
+        path.write_text("---\ntags: [a]\n---\n# First\n\nBody")
+
+        first = loader.load_file(path)
+        first.tags.append("mutated")
+        again = loader.load_file(path)
+        assert len(parses) == 1
+        assert again.tags == ["a"]
+
+        path.write_text("# Second title\n\nBody")
+        assert loader.load_file(path).title == "Second title"
+        assert len(parses) == 2
+
+    def test_loader_pickles_without_cache(self, temp_dir: Path):
+        """Test that a loader sent to a worker process starts with an empty cache."""
+        loader = MarkdownLoader()
+        path = temp_dir / "note.md"
+        path.write_text("# First\n\nBody")
+        loader.load_file(path)
+
+        clone = pickle.loads(pickle.dumps(loader))
+
+        assert len(clone._file_cache) == 0
+        assert clone.load_file(path).title == "First"
+
     def test_load_directory(self, temp_dir: Path):
         """Test loading all files from a directory."""
         loader = MarkdownLoader()
@@ -93,6 +148,21 @@ Content 2
         results = loader.load_directory(temp_dir, recursive=True)
         assert len(results) == 3
 
+    def test_find_files_matches_rglob(self, temp_dir: Path):
+        """Test that find_files returns what sorted rglob plus is_file would."""
+        (temp_dir / "b.md").write_text("b")
+        (temp_dir / "a.txt").write_text("a")
+        (temp_dir / "dir.md").mkdir()
+        (temp_dir / "sub" / "deep").mkdir(parents=True)
+        (temp_dir / "sub" / "c.md").write_text("c")
+        (temp_dir / "sub" / "deep" / "d.md").write_text("d")
+        (temp_dir / "link").symlink_to(temp_dir / "sub", target_is_directory=True)
+
+        for recursive in (True, False):
+            glob_func = temp_dir.rglob if recursive else temp_dir.glob
+            expected = [p for p in sorted(glob_func("*.md")) if p.is_file()]
+            assert find_files(temp_dir, recursive=recursive) == expected
+
     def test_parse_date_in_frontmatter(self):
         """Test parsing date from frontmatter."""
         loader = MarkdownLoader()
@@ -123,3 +193,23 @@ Content
         
         assert len(doc.tags) == 3
         assert "python" in doc.tags
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "# No frontmatter",
+        "---\ntitle: A\n---\nBody",
+        "---  \ntitle: A\n---\t\n\nBody",
+        "---\n\n---\nEmpty frontmatter",
+        "---\ntitle: A\n----\nnot closed\n---\nBody",
+        "---\nA horizontal rule opening a note, never closed\n",
+        "---\ntitle: A\n---",
+    ],
+)
+def test_split_frontmatter_matches_regex(content: str):
+    """Test that _split_frontmatter agrees with the frontmatter regex."""
+    match = re.match(r"^---\s*\n(.*?)\n---\s*\n", content, re.DOTALL)
+    expected = (match.group(1), content[match.end() :]) if match else None
+
+    assert _split_frontmatter(content) == expected
@@ -0,0 +1,125 @@
+"""Tests for ingestion pipeline helpers."""
+
+import hashlib
+from pathlib import Path
+
+import pytest
+
+from nexus.ingest.pipeline import IngestionPipeline, _read_source
+from nexus.models.document import Document
+from nexus.storage.metadata import MetadataStore
+
+
+class FakeEmbedder:
+    """Embedder returning fixed vectors, or failing on demand."""
+
+    def __init__(self, fail: bool = False) -> None:
+        self.fail = fail
+
+    def embed_texts(self, texts: list[str]) -> list[list[float]]:
+        if self.fail:
+            raise RuntimeError("embedding failed")
+        return [[0.0, 1.0] for _ in texts]
+
+
+class FakeVectorStore:
+    """Vector store that records upserted IDs."""
+
+    def __init__(self) -> None:
+        self.ids: list[str] = []
+
+    def add_vectors(self, ids, vectors, payloads) -> None:
+        self.ids.extend(ids)
+
+
+class TestReadSource:
+    """Tests for _read_source."""
+
+    def test_newlines_are_normalized(self, temp_dir: Path):
+        """Test that content matches text-mode reading."""
+        path = temp_dir / "note.md"
+        path.write_bytes(b"# Title\r\n\r\nBody\rMore\n")
+
+        content, _ = _read_source(path)
+
+        assert content == path.read_text(encoding="utf-8")
+
+    def test_hash_tracks_content(self, temp_dir: Path):
+        """Test that the hash is stable and changes with the file."""
+        path = temp_dir / "note.md"
+        path.write_text("# Title\n\nBody\n")
+        _, first = _read_source(path)
+        _, again = _read_source(path)
+
+        path.write_text("# Title\n\nChanged\n")
+        _, changed = _read_source(path)
+
+        assert first == again
+        assert changed != first
+
+    def test_hash_matches_stored_md5(self, temp_dir: Path):
+        """Test that the hash is the MD5 of the text, as stored for indexed documents."""
+        path = temp_dir / "note.md"
+        path.write_bytes(b"# Title\r\n\nBody\n")
+
+        _, content_hash = _read_source(path)
+
+        assert content_hash == hashlib.md5(b"# Title\n\nBody\n").hexdigest()
+
+
+class TestIngestionPipeline:
+    """Tests for IngestionPipeline storage."""
+
+    def test_ingest_file_stores_metadata_and_vectors(self, temp_dir: Path):
+        """Test that chunks reach both stores."""
+        store = MetadataStore(temp_dir / "test.db")
+        vectors = FakeVectorStore()
+        pipeline = IngestionPipeline(FakeEmbedder(), store, vectors)
+        path = temp_dir / "note.md"
+        path.write_text("# Title\n\n" + "Some body text. " * 20)
+
+        doc = pipeline.ingest_file(path)
+
+        assert doc is not None
+        assert vectors.ids == [c.id for c in doc.chunks]
+        assert store.get_stats()["chunks"] == len(doc.chunks)
+
+        store.close()
+
+    def test_failed_embedding_leaves_no_metadata(self, temp_dir: Path):
+        """Test that metadata written during embedding is removed if it fails."""
+        store = MetadataStore(temp_dir / "test.db")
+        pipeline = IngestionPipeline(FakeEmbedder(fail=True), store, FakeVectorStore())
+        path = temp_dir / "note.md"
+        path.write_text("# Title\n\n" + "Some body text. " * 20)
+
+        with pytest.raises(RuntimeError):
+            pipeline.ingest_file(path)
+
+        assert store.get_stats() == {"sources": 0, "documents": 0, "chunks": 0}
+
+        store.close()
+
+    def test_document_indexed_with_md5_is_not_duplicated(self, temp_dir: Path):
+        """Test that a file whose stored hash is the text's MD5 is not ingested again."""
+        store = MetadataStore(temp_dir / "test.db")
+        vectors = FakeVectorStore()
+        pipeline = IngestionPipeline(FakeEmbedder(), store, vectors)
+        path = temp_dir / "note.md"
+        content = "# Title\n\n" + "Some body text. " * 20
+        path.write_text(content)
+        store.add_document(
+            Document(
+                id="doc-1",
+                source_path=str(path),
+                source_type="markdown",
+                content=content,
+                content_hash=hashlib.md5(content.encode()).hexdigest(),
+            )
+        )
+
+        assert pipeline.ingest_file(path) is None
+        assert store.get_stats()["documents"] == 1
+        assert vectors.ids == []
+
+        store.close()
@@ -0,0 +1,26 @@
+"""Tests for file watcher."""
+
+from nexus.ingest.watcher import DEBOUNCE_MAX_PATHS, MarkdownHandler
+
+
+class TestMarkdownHandler:
+    """Tests for MarkdownHandler class."""
+
+    def test_debounce_repeated_events(self):
+        """Test that a second event on the same file within the window is dropped."""
+        handler = MarkdownHandler()
+
+        assert handler._debounce("/notes/a.md")
+        assert not handler._debounce("/notes/a.md")
+        assert handler._debounce("/notes/b.md")
+
+    def test_debounce_memory_is_bounded(self):
+        """Test that only the most recently touched paths are remembered."""
+        handler = MarkdownHandler()
+
+        for i in range(DEBOUNCE_MAX_PATHS + 10):
+            handler._debounce(f"/notes/{i}.md")
+
+        assert len(handler._last_event) == DEBOUNCE_MAX_PATHS
+        assert "/notes/0.md" not in handler._last_event
+        assert f"/notes/{DEBOUNCE_MAX_PATHS + 9}.md" in handler._last_event
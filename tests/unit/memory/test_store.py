@@ -66,3 +66,95 @@ def test_update(memory_store):
     memories = memory_store.recall()
     assert memories[0]["content"] == "New content"
     assert "updated" in memories[0]["tags"]
+
+def test_changes_survive_reopen(tmp_path):
+    """Test that logged mutations are replayed when the store is reopened."""
+    store = MemoryStore(tmp_path)
+    kept = store.remember("Keep me")
+    dropped = store.remember("Drop me")
+    store.update_memory(kept, content="Kept and updated")
+    store.forget(dropped)
+    store.close()
+
+    reopened = MemoryStore(tmp_path)
+
+    assert [m["content"] for m in reopened.recall()] == ["Kept and updated"]
+
+def test_append_after_partial_log_line(tmp_path):
+    """Test that a write after a crash mid-append starts on a new line."""
+    store = MemoryStore(tmp_path)
+    store.remember("First")
+    store.close()
+    log_path = tmp_path / "memories" / "log.jsonl"
+    with open(log_path, "ab") as f:
+        f.write(b'{"op":"put","memory":{"id":"tor')
+
+    store = MemoryStore(tmp_path)
+    store.remember("Second")
+    store.close()
+
+    contents = [m["content"] for m in MemoryStore(tmp_path).recall()]
+    assert sorted(contents) == ["First", "Second"]
+    assert len(log_path.read_bytes().splitlines()) == 2
+
+def test_log_is_compacted(tmp_path, monkeypatch):
+    """Test that the log is folded into the index once it grows."""
+    monkeypatch.setattr("nexus.memory.store.LOG_COMPACT_ENTRIES", 3)
+    store = MemoryStore(tmp_path)
+    for i in range(4):
+        store.remember(f"Memory {i}")
+    store.close()
+
+    log_lines = (tmp_path / "memories" / "log.jsonl").read_bytes().splitlines()
+    assert len(log_lines) == 1
+    assert len(MemoryStore(tmp_path).recall()) == 4
+
+def test_recall_query_matches_substrings(memory_store):
+    """Test that indexed recall still matches partial words and phrases."""
+    memory_store.remember("User likes Python and dark mode", tags=["coding"])
+    memory_store.remember("Deploy on Fridays is forbidden")
+
+    assert len(memory_store.recall(query="pyth")) == 1
+    assert len(memory_store.recall(query="kes python and da")) == 1
+    assert len(memory_store.recall(query="python", tags=["other"])) == 0
+    assert memory_store.recall(query="fridays is")[0]["content"].startswith("Deploy")
+
+def test_recall_sees_updates(memory_store):
+    """Test that the recall indexes follow updates and deletions."""
+    mem_id = memory_store.remember("Use Postgres", tags=["db"])
+    memory_store.update_memory(mem_id, content="Use SQLite", tags=["embedded"])
+
+    assert memory_store.recall(query="postgres") == []
+    assert memory_store.recall(tags=["db"]) == []
+    assert len(memory_store.recall(query="use sqlite", tags=["embedded"])) == 1
+
+    memory_store.forget(mem_id)
+    assert memory_store.recall(query="use sqlite") == []
+
+def test_flush_writes_queued_changes(tmp_path):
+    """Test that flush waits for the background writer."""
+    store = MemoryStore(tmp_path)
+    mem_id = store.remember("Written in the background")
+    store.forget(mem_id)
+    store.flush()
+
+    log_lines = (tmp_path / "memories" / "log.jsonl").read_bytes().splitlines()
+    assert len(log_lines) == 2
+    # The index and log hold every memory; no file is written per memory
+    assert sorted(p.name for p in (tmp_path / "memories").iterdir()) == ["log.jsonl"]
+    store.close()
+
+def test_updates_are_logged_as_deltas(tmp_path):
+    """Test that updates log only their changes and replay on reopen."""
+    store = MemoryStore(tmp_path)
+    mem_id = store.remember("Use Postgres", tags=["db"], metadata={"source": "chat"})
+    store.update_memory(mem_id, metadata={"confidence": "high"})
+    store.update_memory(mem_id, tags=["database"])
+    store.close()
+
+    log_lines = (tmp_path / "memories" / "log.jsonl").read_bytes().splitlines()
+    assert b"Use Postgres" not in log_lines[1]
+
+    memory = MemoryStore(tmp_path).recall(tags=["database"])[0]
+    assert memory["content"] == "Use Postgres"
+    assert memory["metadata"] == {"source": "chat", "confidence": "high"}
@@ -0,0 +1,132 @@
+"""Tests for BM25 index."""
+
+import re
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from nexus.models.document import Chunk, ChunkMetadata, Document
+from nexus.rag.bm25 import BM25Index, _top_k, tokenize
+from nexus.storage.metadata import MetadataStore
+
+
+def _add_chunk(store: MetadataStore, chunk_id: str, content: str) -> None:
+    store.add_chunk(
+        Chunk(
+            id=chunk_id,
+            document_id="doc-1",
+            content=content,
+            chunk_index=0,
+            metadata=ChunkMetadata(source_path="/test.md", source_type="markdown"),
+        )
+    )
+
+
+@pytest.fixture
+def store(temp_dir: Path):
+    """Metadata store with a few chunks."""
+    store = MetadataStore(temp_dir / "test.db")
+    store.add_document(
+        Document(id="doc-1", source_path="/test.md", source_type="markdown", content="x")
+    )
+    _add_chunk(store, "chunk-1", "Python is a programming language")
+    _add_chunk(store, "chunk-2", "Qdrant stores vectors for similarity search")
+    _add_chunk(store, "chunk-3", "Markdown notes with YAML frontmatter")
+    yield store
+    store.close()
+
+
+@pytest.mark.parametrize(
+    "text",
+    ["", "Hello, World!", "snake_case and foo-bar", "Straße über naïve 42x", "a.b\nc\td  "],
+)
+def test_tokenize_matches_word_boundary_pattern(text: str):
+    """Test that tokens are the same as with explicit word boundaries."""
+    assert tokenize(text) == re.findall(r"\b\w+\b", text.lower())
+
+
+@pytest.mark.parametrize("k", [0, 1, 3, 5, 8])
+def test_top_k_matches_stable_sort(k: int):
+    """Test that top-k selection orders ties like a stable full sort."""
+    scores = np.array([0.5, 2.0, 0.5, 1.0, 2.0, 0.0, 0.5])
+
+    expected = sorted(range(len(scores)), key=lambda i: scores[i], reverse=True)[:k]
+    assert _top_k(scores, k).tolist() == expected
+
+
+class TestBM25Index:
+    """Tests for BM25Index class."""
+
+    def test_search(self, store: MetadataStore):
+        """Test keyword search over indexed chunks."""
+        index = BM25Index(store)
+        index.build_index()
+
+        results = index.search("python programming")
+        assert results[0][0] == "chunk-1"
+
+    def test_filter_term(self, store: MetadataStore):
+        """Test restricting search to chunks containing a term."""
+        index = BM25Index(store)
+        index.build_index()
+
+        assert index.matching_ids("similarity search") == ["chunk-2"]
+        assert index.matching_ids("python search") == []
+        assert [cid for cid, _ in index.search("language", filter_term="qdrant")] == []
+        assert index.search("vectors", filter_term="qdrant")[0][0] == "chunk-2"
+
+    def test_load_or_build_persists(self, store: MetadataStore, temp_dir: Path):
+        """Test the index is saved, reloaded, and rebuilt when stale."""
+        path = temp_dir / "bm25.pkl"
+
+        BM25Index(store).load_or_build(path)
+        assert path.exists()
+
+        loaded = BM25Index(store)
+        assert loaded.load(path) is True
+        assert loaded.search("vectors")[0][0] == "chunk-2"
+
+        # New chunks invalidate the persisted index
+        _add_chunk(store, "chunk-4", "Reranking with a cross encoder")
+        stale = BM25Index(store)
+        assert stale.load(path) is False
+
+        stale.load_or_build(path)
+        assert "chunk-4" in stale._chunk_ids
+        assert BM25Index(store).load(path) is True
+
+    def test_load_detects_replaced_chunks(self, store: MetadataStore, temp_dir: Path):
+        """Test that deleting chunks and adding as many new ones invalidates the index."""
+        path = temp_dir / "bm25.pkl"
+        BM25Index(store).load_or_build(path)
+
+        # Reuses the deleted rows' rowids, keeping the chunk count and max rowid
+        store.delete_document("doc-1")
+        for i in range(3):
+            _add_chunk(store, f"new-{i}", "Completely different content")
+
+        assert BM25Index(store).load(path) is False
+
+    def test_add_chunks_matches_rebuild(self, store: MetadataStore):
+        """Test that extending the index scores like building it from scratch."""
+        index = BM25Index(store)
+        index.build_index(["chunk-1"])
+        index.add_chunks(store.get_chunks_by_ids(["chunk-2"]))
+        index.add_chunks(store.get_chunks_by_ids(["chunk-3"]))
+
+        rebuilt = BM25Index(store)
+        rebuilt.build_index(["chunk-1", "chunk-2", "chunk-3"])
+
+        for query in ["python search", "vectors", "markdown notes yaml"]:
+            assert index.search(query) == rebuilt.search(query)
+
+    def test_search_cache_is_invalidated(self, store: MetadataStore):
+        """Test that cached results are dropped when chunks are added."""
+        index = BM25Index(store)
+        index.build_index(["chunk-1", "chunk-2"])
+
+        assert [cid for cid, _ in index.search("markdown")] == []
+
+        index.add_chunks(store.get_chunks_by_ids(["chunk-3"]))
+        assert [cid for cid, _ in index.search("markdown")] == ["chunk-3"]
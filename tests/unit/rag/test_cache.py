@@ -0,0 +1,59 @@
+"""Tests for semantic search cache."""
+
+import numpy as np
+
+from nexus.rag.cache import SemanticCache
+
+
+class TestSemanticCache:
+    """Tests for SemanticCache class."""
+
+    def test_near_duplicate_query_hits(self):
+        """Test that a nearly identical vector returns cached results."""
+        rng = np.random.default_rng(1)
+        vector = rng.standard_normal(64)
+        cache = SemanticCache(dimension=64, threshold=0.97)
+
+        cache.put(vector, ["result"])
+
+        assert cache.get(vector + rng.normal(scale=0.01, size=64)) == ["result"]
+        assert cache.get(rng.standard_normal(64)) is None
+
+    def test_scopes_are_isolated(self):
+        """Test that results are only reused for the same scope."""
+        vector = np.ones(16)
+        cache = SemanticCache(dimension=16)
+
+        cache.put(vector, ["top-5"], scope=5)
+
+        assert cache.get(vector, scope=5) == ["top-5"]
+        assert cache.get(vector, scope=10) is None
+
+    def test_eviction_and_clear(self):
+        """Test max_entries bound and clearing."""
+        rng = np.random.default_rng(2)
+        cache = SemanticCache(dimension=32, max_entries=2)
+        vectors = [rng.standard_normal(32) for _ in range(3)]
+        for i, vector in enumerate(vectors):
+            cache.put(vector, i)
+
+        assert len(cache) == 2
+        assert cache.get(vectors[0]) is None
+        assert cache.get(vectors[2]) == 2
+
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_hit_rate(self):
+        """Test that lookups are counted as hits or misses."""
+        vector = np.ones(16)
+        cache = SemanticCache(dimension=16)
+        assert cache.hit_rate == 0.0
+
+        cache.get(vector)
+        cache.put(vector, ["result"])
+        cache.get(vector)
+        cache.get(vector)
+
+        assert (cache.hits, cache.misses) == (2, 1)
+        assert cache.hit_rate == 2 / 3
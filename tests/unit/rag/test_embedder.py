@@ -1,5 +1,6 @@
 """Tests for embedder."""
 
+import numpy as np
 import pytest
 
 from nexus.rag.embedder import Embedder
@@ -48,6 +49,16 @@ class TestEmbedder:
         embeddings = embedder.embed_texts([])
         assert embeddings == []
 
+    def test_embed_texts_np(self, embedder):
+        """Test that the array form matches the list form."""
+        texts = ["First document about Python.", "Second document about Rust."]
+
+        matrix = embedder.embed_texts_np(texts)
+
+        assert matrix.dtype == np.float32
+        assert matrix.shape == (2, embedder.dimension)
+        assert np.allclose(matrix, embedder.embed_texts(texts))
+
     def test_similarity(self, embedder):
         """Test similarity between texts."""
         text1 = "Machine learning is a subset of artificial intelligence."
@@ -65,3 +76,38 @@ class TestEmbedder:
         """Test that dimension property works."""
         assert embedder.dimension > 0
         assert embedder.dimension == 384  # bge-small dimension
+
+    def test_embed_text_uses_cache(self, embedder):
+        """Test that repeated texts are served from the cache."""
+        text = "Caching avoids re-running the model for the same query."
+
+        first = embedder.embed_text(text)
+        cached = embedder._cache[embedder._cache_key(text)]
+        second = embedder.embed_text(text)
+
+        assert first == second
+        assert not cached.flags.writeable
+
+    def test_embed_text_persistent_cache(self, embedder, tmp_path):
+        """Test that cached embeddings are reloaded from disk by a new embedder."""
+        text = "Persisted embeddings survive across processes."
+        cached = Embedder(model_name=embedder.model_name, cache_dir=tmp_path)
+        cached._model = embedder.model
+        expected = cached.embed_text(text)
+
+        fresh = Embedder(model_name=embedder.model_name, cache_dir=tmp_path)
+        assert fresh.embed_text(text) == expected
+        # A disk hit must not load the model
+        assert fresh._model is None
+
+
+def test_cache_dir_separates_backends(tmp_path):
+    """Test that other runtimes don't share cached vectors with torch."""
+    torch_dir = Embedder(cache_dir=tmp_path)._cache_dir
+    onnx_dir = Embedder(cache_dir=tmp_path, backend="onnx")._cache_dir
+    quantized_dir = Embedder(
+        cache_dir=tmp_path, backend="onnx", model_file="onnx/model_qint8_avx512_vnni.onnx"
+    )._cache_dir
+
+    assert torch_dir.name == "BAAI_bge-base-en-v1.5-norm"
+    assert len({torch_dir, onnx_dir, quantized_dir}) == 3
@@ -0,0 +1,72 @@
+"""Tests for hybrid search."""
+
+from pathlib import Path
+
+import numpy as np
+
+from nexus.models.search import SearchResult
+from nexus.rag.hybrid import HybridSearchEngine, reciprocal_rank_fusion
+from nexus.storage.metadata import MetadataStore
+
+
+class FakeEmbedder:
+    """Embedder mapping known texts to fixed unit vectors and counting calls."""
+
+    VECTORS = {
+        "query": [1.0, 0.0],
+        "close": [0.8, 0.6],
+        "far": [0.0, 1.0],
+        "middle": [0.6, 0.8],
+    }
+
+    def __init__(self) -> None:
+        self.batches: list[list[str]] = []
+
+    def embed_text(self, text: str) -> list[float]:
+        return self.embed_texts([text])[0]
+
+    def embed_texts(self, texts: list[str]) -> list[list[float]]:
+        self.batches.append(texts)
+        return [self.VECTORS[t] for t in texts]
+
+    def embed_texts_np(self, texts: list[str]) -> np.ndarray:
+        return np.array(self.embed_texts(texts), dtype=np.float32)
+
+    def embed_text_np(self, text: str) -> np.ndarray:
+        return self.embed_texts_np([text])[0]
+
+
+def _result(chunk_id: str, content: str) -> SearchResult:
+    return SearchResult(
+        chunk_id=chunk_id,
+        content=content,
+        source="/test.md",
+        source_type="markdown",
+        relevance_score=0.0,
+    )
+
+
+def test_reciprocal_rank_fusion():
+    """Test that documents ranked well by both lists come first."""
+    fused = reciprocal_rank_fusion([[("a", 0.9), ("b", 0.5)], [("b", 3.0), ("c", 1.0)]])
+
+    assert [doc_id for doc_id, _ in fused] == ["b", "a", "c"]
+
+
+class TestRerank:
+    """Tests for HybridSearchEngine._rerank."""
+
+    def test_orders_by_similarity_in_one_batch(self, temp_dir: Path):
+        """Test that results are embedded together and sorted by cosine."""
+        store = MetadataStore(temp_dir / "test.db")
+        embedder = FakeEmbedder()
+        engine = HybridSearchEngine(embedder, store, vector_store=None)
+        results = [_result("1", "far"), _result("2", "close"), _result("3", "middle")]
+
+        reranked = engine._rerank("query", results, query_embedding=[1.0, 0.0])
+
+        assert [r.chunk_id for r in reranked] == ["2", "3", "1"]
+        assert np.allclose([r.relevance_score for r in reranked], [0.8, 0.6, 0.0])
+        assert embedder.batches == [["far", "close", "middle"]]
+
+        store.close()
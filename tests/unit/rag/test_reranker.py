@@ -0,0 +1,62 @@
+"""Tests for the cross-encoder reranker."""
+
+import pytest
+import sentence_transformers
+
+from nexus.exceptions import ConfigError
+from nexus.rag.reranker import CrossEncoderReranker
+
+
+class FakeCrossEncoder:
+    """Cross-encoder recording its constructor arguments."""
+
+    def __init__(self, model_name: str, **kwargs) -> None:
+        self.model_name = model_name
+        self.kwargs = kwargs
+
+
+def test_model_loads_with_backend_and_file(monkeypatch):
+    """Test that the runtime and weights file reach sentence-transformers."""
+    monkeypatch.setattr(sentence_transformers, "CrossEncoder", FakeCrossEncoder)
+    reranker = CrossEncoderReranker(
+        "reranker", backend="onnx", model_file="onnx/model_qint8_avx512_vnni.onnx"
+    )
+
+    assert reranker.model.kwargs == {
+        "backend": "onnx",
+        "model_kwargs": {"file_name": "onnx/model_qint8_avx512_vnni.onnx"},
+    }
+    assert CrossEncoderReranker("reranker").model.kwargs == {}
+
+
+class LengthScorer:
+    """Cross-encoder scoring a pair by its document length, recording input order."""
+
+    def __init__(self) -> None:
+        self.seen: list[str] = []
+
+    def predict(self, pairs, batch_size: int = 32) -> list[float]:
+        self.seen = [doc for _, doc in pairs]
+        return [float(len(doc)) for _, doc in pairs]
+
+
+def test_rerank_batches_by_length_and_restores_order():
+    """Test that pairs are scored longest first and scores map to their documents."""
+    reranker = CrossEncoderReranker()
+    reranker._model = LengthScorer()
+    documents = ["bb", "a", "dddd", "ccc"]
+
+    ranked = reranker.rerank("query", documents, top_k=3)
+
+    assert reranker._model.seen == ["dddd", "ccc", "bb", "a"]
+    assert ranked == [(2, 4.0), (3, 3.0), (0, 2.0)]
+
+
+def test_backend_needs_recent_sentence_transformers(monkeypatch):
+    """Test that an unsupported backend raises instead of disabling reranking."""
+    monkeypatch.setattr(sentence_transformers, "__version__", "3.4.1")
+    monkeypatch.setattr(sentence_transformers, "CrossEncoder", FakeCrossEncoder)
+
+    with pytest.raises(ConfigError):
+        _ = CrossEncoderReranker("reranker", backend="onnx").model
+    assert CrossEncoderReranker("reranker").model is not None
@@ -0,0 +1,99 @@
+"""Tests for the RAG search engine."""
+
+from pathlib import Path
+
+import numpy as np
+
+from nexus.models.document import Chunk, ChunkMetadata
+from nexus.rag.search import SearchEngine
+from nexus.storage.metadata import MetadataStore
+from nexus.storage.vectors import VectorStore
+
+
+class CountingEmbedder:
+    """Embedder mapping every text to one vector and counting calls."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def embed_text_np(self, text: str) -> np.ndarray:
+        self.calls += 1
+        return np.array([1.0, 0.0, 0.0, 0.0], dtype=np.float32)
+
+    def embed_queries_np(self, texts: list[str]) -> list[np.ndarray]:
+        self.calls += 1
+        return [np.array([1.0, 0.0, 0.0, 0.0], dtype=np.float32) for _ in texts]
+
+
+def _stores(temp_dir: Path) -> tuple[MetadataStore, VectorStore]:
+    """Stores holding three chunks, c0 and c1 close together."""
+    store = MetadataStore(temp_dir / "test.db")
+    vectors = VectorStore(collection_name="test", path=temp_dir / "qdrant", embedding_dim=4)
+    store.add_chunks(
+        [
+            Chunk(
+                id=f"c{i}",
+                document_id="doc-1",
+                content=f"Content {i}",
+                chunk_index=i,
+                metadata=ChunkMetadata(source_path="/test.md", source_type="markdown"),
+            )
+            for i in range(3)
+        ]
+    )
+    vectors.add_vectors(
+        ["c0", "c1", "c2"],
+        [[0.0, 1.0, 0.0, 0.0], [0.1, 1.0, 0.0, 0.0], [1.0, 0.0, 0.0, 0.0]],
+    )
+    return store, vectors
+
+
+def test_similar_chunks_uses_stored_vector(temp_dir: Path):
+    """Test that similar chunks are found without embedding the chunk again."""
+    store, vectors = _stores(temp_dir)
+    embedder = CountingEmbedder()
+    engine = SearchEngine(embedder, store, vectors)
+
+    results = engine.similar_chunks("c0", top_k=1)
+
+    assert [r.chunk_id for r in results] == ["c1"]
+    assert embedder.calls == 0
+
+    vectors.close()
+    store.close()
+
+
+def test_semantic_cache_reuses_results(temp_dir: Path):
+    """Test that a repeated query is answered without a vector search."""
+    store, vectors = _stores(temp_dir)
+    engine = SearchEngine(CountingEmbedder(), store, vectors, semantic_cache_threshold=0.99)
+
+    first = engine.search("query", top_k=1)
+    vectors.delete_vectors(["c2"])
+    again = engine.search("query", top_k=1)
+
+    assert [r.chunk_id for r in first] == ["c2"]
+    assert again == first
+    assert engine._semantic_cache.hits == 1
+
+    engine.clear_cache()
+    assert [r.chunk_id for r in engine.search("query", top_k=1)] == ["c1"]
+
+    vectors.close()
+    store.close()
+
+
+def test_search_many_matches_search(temp_dir: Path):
+    """Test that batched queries give the same results as searching each one."""
+    store, vectors = _stores(temp_dir)
+    embedder = CountingEmbedder()
+    engine = SearchEngine(embedder, store, vectors)
+
+    batched = engine.search_many(["first", "second"], top_k=2)
+
+    assert embedder.calls == 1
+    assert batched == [engine.search("first", top_k=2)] * 2
+    assert engine.search_many([]) == []
+
+    vectors.close()
+    store.close()
@@ -1,13 +1,29 @@
 """Tests for metadata storage."""
 
+import sqlite3
+
 import pytest
 from pathlib import Path
 
-from nexus.storage.metadata import MetadataStore
+from nexus.exceptions import StorageError
+from nexus.storage.metadata import MAX_PADDED_PARAMS, MetadataStore, _pad_params
 from nexus.models.document import Document, Chunk, ChunkMetadata
 from nexus.models.source import Source, SourceType
 
 
+@pytest.mark.parametrize("size", [1, 2, 3, 5, 17, MAX_PADDED_PARAMS + 1])
+def test_pad_params(size: int):
+    """Test that IN lists are padded to a power of two with the same values."""
+    values = [f"id-{i}" for i in range(size)]
+
+    padded = _pad_params(values)
+
+    assert padded[:size] == values
+    assert set(padded) == set(values)
+    if size <= MAX_PADDED_PARAMS:
+        assert len(padded) & (len(padded) - 1) == 0
+
+
 class TestMetadataStore:
     """Tests for MetadataStore class."""
 
@@ -163,6 +179,28 @@ class TestMetadataStore:
         
         store.close()
 
+    def test_add_chunks(self, temp_dir: Path):
+        """Test adding many chunks in one call."""
+        store = MetadataStore(temp_dir / "test.db")
+
+        store.add_chunks(
+            [
+                Chunk(
+                    id=f"chunk-{i}",
+                    document_id="doc-1",
+                    content=f"Content {i}",
+                    chunk_index=i,
+                    metadata=ChunkMetadata(source_path="/test.md", source_type="markdown"),
+                )
+                for i in range(4)
+            ]
+        )
+
+        chunks = store.get_chunks_by_document("doc-1")
+        assert [c.chunk_index for c in chunks] == [0, 1, 2, 3]
+
+        store.close()
+
     def test_get_chunks_by_ids(self, temp_dir: Path):
         """Test getting chunks by list of IDs."""
         store = MetadataStore(temp_dir / "test.db")
@@ -190,9 +228,41 @@ class TestMetadataStore:
         
         chunks = store.get_chunks_by_ids(["chunk-1", "chunk-3"])
         assert len(chunks) == 2
+
+        # Chunks follow the requested order; unknown IDs are skipped
+        chunks = store.get_chunks_by_ids(["chunk-4", "missing", "chunk-0", "chunk-2"])
+        assert [c.id for c in chunks] == ["chunk-4", "chunk-0", "chunk-2"]
         
         store.close()
 
+    def test_get_chunks_by_ids_filters_tags(self, temp_dir: Path):
+        """Test that only chunks with one of the requested tags are returned."""
+        store = MetadataStore(temp_dir / "test.db")
+
+        def make_chunk(i: int, tags: list[str]) -> Chunk:
+            return Chunk(
+                id=f"chunk-{i}",
+                document_id="doc-1",
+                content=f"Content {i}",
+                chunk_index=i,
+                metadata=ChunkMetadata(source_path="/test.md", source_type="markdown", tags=tags),
+            )
+
+        store.add_chunks([make_chunk(0, ["python"]), make_chunk(1, ["rust"]), make_chunk(2, [])])
+        ids = ["chunk-0", "chunk-1", "chunk-2"]
+
+        assert [c.id for c in store.get_chunks_by_ids(ids, tags=["rust", "go"])] == ["chunk-1"]
+
+        # Replacing a chunk replaces its tags
+        store.add_chunk(make_chunk(1, ["go"]))
+        assert [c.id for c in store.get_chunks_by_ids(ids, tags=["rust"])] == []
+        assert [c.id for c in store.get_chunks_by_ids(ids, tags=["go"])] == ["chunk-1"]
+
+        store.delete_document("doc-1")
+        assert store._get_connection().execute("SELECT COUNT(*) FROM chunk_tags").fetchone()[0] == 0
+
+        store.close()
+
     def test_delete_document(self, temp_dir: Path):
         """Test deleting a document and its chunks."""
         store = MetadataStore(temp_dir / "test.db")
@@ -255,3 +325,115 @@ class TestMetadataStore:
         assert stats["chunks"] == 1
         
         store.close()
+
+    def test_usable_from_worker_thread(self, temp_dir: Path):
+        """Test that a store opened on one thread can be queried from another."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        store = MetadataStore(temp_dir / "test.db")
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            stats = pool.submit(store.get_stats).result()
+
+        assert stats["chunks"] == 0
+
+        store.close()
+
+    def test_add_documents_is_atomic(self, temp_dir: Path):
+        """Test bulk-adding documents with chunks in one transaction."""
+        store = MetadataStore(temp_dir / "test.db")
+
+        def make_doc(doc_id: str, chunk_ids: list[str]) -> Document:
+            doc = Document(
+                id=doc_id, source_path=f"/{doc_id}.md", source_type="markdown", content="x"
+            )
+            doc.chunks = [
+                Chunk(
+                    id=chunk_id,
+                    document_id=doc_id,
+                    content=f"Content of {chunk_id}",
+                    chunk_index=i,
+                    metadata=ChunkMetadata(source_path=f"/{doc_id}.md", source_type="markdown"),
+                )
+                for i, chunk_id in enumerate(chunk_ids)
+            ]
+            return doc
+
+        store.add_documents([make_doc("doc-1", ["c1", "c2"]), make_doc("doc-2", ["c3"])])
+        assert store.get_stats() == {"sources": 0, "documents": 2, "chunks": 3}
+
+        # A failing row rolls back the whole batch
+        broken = make_doc("doc-3", ["c4"])
+        broken.chunks[0].content = None  # violates NOT NULL
+        with pytest.raises(StorageError):
+            store.add_documents([make_doc("doc-4", ["c5"]), broken])
+        assert store.get_stats() == {"sources": 0, "documents": 2, "chunks": 3}
+
+        store.close()
+
+    def test_fingerprint_matches(self, temp_dir: Path):
+        """Test the mtime and size check used to skip unchanged files."""
+        store = MetadataStore(temp_dir / "test.db")
+
+        store.add_document(
+            Document(
+                id="doc-1",
+                source_path="/a.md",
+                source_type="markdown",
+                content="x",
+                content_hash="abc",
+                mtime_ns=1_000,
+                size=10,
+            )
+        )
+
+        assert store.fingerprint_matches("/a.md", 1_000, 10)
+        assert not store.fingerprint_matches("/a.md", 2_000, 10)
+        assert not store.fingerprint_matches("/a.md", 1_000, 11)
+
+        store.update_fingerprint("/a.md", "abc", 2_000, 10)
+        assert store.fingerprint_matches("/a.md", 2_000, 10)
+
+        store.close()
+
+    def test_adds_fingerprint_columns_to_old_database(self, temp_dir: Path):
+        """Test that a database without the fingerprint columns is migrated."""
+        db_path = temp_dir / "test.db"
+        conn = sqlite3.connect(db_path)
+        conn.execute(
+            "CREATE TABLE documents (id TEXT PRIMARY KEY, source_path TEXT NOT NULL, "
+            "source_type TEXT NOT NULL, title TEXT, content_hash TEXT, "
+            "indexed_at TEXT NOT NULL, metadata TEXT)"
+        )
+        conn.commit()
+        conn.close()
+
+        store = MetadataStore(db_path)
+
+        assert not store.fingerprint_matches("/a.md", 1_000, 10)
+
+        store.close()
+
+    def test_backfills_chunk_tags_in_old_database(self, temp_dir: Path):
+        """Test that tags of chunks written before the tag table existed are indexed."""
+        db_path = temp_dir / "test.db"
+        store = MetadataStore(db_path)
+        store.add_chunk(
+            Chunk(
+                id="chunk-1",
+                document_id="doc-1",
+                content="Content",
+                chunk_index=0,
+                metadata=ChunkMetadata(
+                    source_path="/test.md", source_type="markdown", tags=["python", "ml"]
+                ),
+            )
+        )
+        store._get_connection().execute("DROP TABLE chunk_tags")
+        store.close()
+
+        store = MetadataStore(db_path)
+
+        assert [c.id for c in store.get_chunks_by_ids(["chunk-1"], tags=["ml"])] == ["chunk-1"]
+
+        store.close()
@@ -1,9 +1,10 @@
 """Tests for vector storage."""
 
+import numpy as np
 import pytest
 from pathlib import Path
 
-from nexus.storage.vectors import VectorStore
+from nexus.storage.vectors import UPSERT_BATCH_SIZE, VectorStore
 from nexus.exceptions import StorageError
 
 
@@ -91,6 +92,62 @@ class TestVectorStore:
         
         store.close()
 
+    def test_search_restricted_to_ids(self, temp_dir: Path):
+        """Test searching within an allow-list of IDs."""
+        store = VectorStore(
+            collection_name="test_collection",
+            path=temp_dir / "qdrant",
+            embedding_dim=4,
+        )
+
+        store.add_vectors(
+            ["v1", "v2", "v3"],
+            [[1.0, 0.0, 0.0, 0.0], [0.9, 0.1, 0.0, 0.0], [0.0, 1.0, 0.0, 0.0]],
+        )
+
+        results = store.search([1.0, 0.0, 0.0, 0.0], limit=10, ids=["v2", "v3"])
+
+        assert [r["id"] for r in results] == ["v2", "v3"]
+
+        store.close()
+
+    def test_search_many(self, temp_dir: Path):
+        """Test that batched search matches searching one vector at a time."""
+        store = VectorStore(
+            collection_name="test_collection",
+            path=temp_dir / "qdrant",
+            embedding_dim=4,
+        )
+        store.add_vectors(
+            ["v1", "v2", "v3"],
+            [[1.0, 0.0, 0.0, 0.0], [0.0, 1.0, 0.0, 0.0], [0.9, 0.1, 0.0, 0.0]],
+            [{"source": "doc1"}, {"source": "doc2"}, {"source": "doc1"}],
+        )
+        queries = np.array([[1.0, 0.0, 0.0, 0.0], [0.0, 1.0, 0.0, 0.0]], dtype=np.float32)
+
+        batched = store.search_many(queries, limit=2, filters={"source": "doc1"})
+
+        assert batched == [store.search(q, limit=2, filters={"source": "doc1"}) for q in queries]
+        assert [r["id"] for r in batched[0]] == ["v1", "v3"]
+        assert store.search_many([]) == []
+
+        store.close()
+
+    def test_get_vector(self, temp_dir: Path):
+        """Test reading back a stored vector."""
+        store = VectorStore(
+            collection_name="test_collection",
+            path=temp_dir / "qdrant",
+            embedding_dim=4,
+        )
+
+        store.add_vectors(ids=["v1"], vectors=[[0.6, 0.8, 0.0, 0.0]])
+
+        assert np.allclose(store.get_vector("v1"), [0.6, 0.8, 0.0, 0.0])
+        assert store.get_vector("missing") is None
+
+        store.close()
+
     def test_delete_vectors(self, temp_dir: Path):
         """Test deleting vectors."""
         store = VectorStore(
@@ -135,6 +192,29 @@ class TestVectorStore:
         
         store.close()
 
+    def test_add_vectors_in_batches(self, temp_dir: Path):
+        """Test that upserts larger than one batch store every point."""
+        store = VectorStore(
+            collection_name="test_collection",
+            path=temp_dir / "qdrant",
+            embedding_dim=4,
+        )
+        count = 2 * UPSERT_BATCH_SIZE + 1
+        payload = {"source": "doc"}
+
+        store.add_vectors(
+            ids=[f"v{i}" for i in range(count)],
+            vectors=[[1.0, float(i), 0.0, 0.0] for i in range(count)],
+            payloads=[payload] * count,
+        )
+
+        assert store.get_count() == count
+        assert payload == {"source": "doc"}
+        results = store.search([1.0, 0.0, 0.0, 0.0], limit=1, ids=[f"v{count - 1}"])
+        assert results[0]["payload"]["source"] == "doc"
+
+        store.close()
+
     def test_add_vectors_validates_length(self, temp_dir: Path):
         """Test that mismatched lengths raise error."""
         store = VectorStore(
@@ -150,3 +230,51 @@ class TestVectorStore:
             )
         
         store.close()
+
+    def test_quantized_collection_searches(self, temp_dir: Path):
+        """Test that a collection created with int8 quantization is searchable."""
+        store = VectorStore(
+            collection_name="test_collection",
+            path=temp_dir / "qdrant",
+            embedding_dim=4,
+            quantize=True,
+        )
+
+        store.add_vectors(
+            ids=["v1", "v2"],
+            vectors=[[1.0, 0.0, 0.0, 0.0], [0.0, 1.0, 0.0, 0.0]],
+        )
+
+        assert store.search([0.9, 0.1, 0.0, 0.0], limit=1)[0]["id"] == "v1"
+
+        store.close()
+
+    def test_reopened_collection_keeps_md5_ids(self, temp_dir: Path, monkeypatch):
+        """Test that a collection written with MD5 point IDs is still addressable."""
+        from nexus.storage import vectors
+
+        monkeypatch.setattr(vectors, "_ID_SCHEMES", [vectors._string_to_int_id])
+        store = VectorStore(
+            collection_name="test_collection",
+            path=temp_dir / "qdrant",
+            embedding_dim=4,
+        )
+        store.add_vectors(
+            ids=["v1", "v2"],
+            vectors=[[1.0, 0.0, 0.0, 0.0], [0.0, 1.0, 0.0, 0.0]],
+        )
+        store.close()
+        monkeypatch.undo()
+
+        store = VectorStore(
+            collection_name="test_collection",
+            path=temp_dir / "qdrant",
+            embedding_dim=4,
+        )
+
+        results = store.search([1.0, 0.0, 0.0, 0.0], limit=10, ids=["v2"])
+        assert [r["id"] for r in results] == ["v2"]
+        store.delete_vectors(["v1"])
+        assert store.get_count() == 1
+
+        store.close()
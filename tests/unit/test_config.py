@@ -7,12 +7,14 @@ import tempfile
 from nexus.config import (
     Config,
     EmbeddingConfig,
+    SourceConfig,
     StorageConfig,
     load_config,
     save_config,
     create_default_config,
 )
 from nexus.exceptions import ConfigError
+from pydantic import ValidationError
 
 
 class TestConfig:
@@ -42,8 +44,7 @@ class TestConfig:
             config_path = Path(tmpdir) / "config.yaml"
             
             # Create and save config
-            config = create_default_config()
-            config.embedding.batch_size = 64
+            config = Config(embedding=EmbeddingConfig(batch_size=64))
             save_config(config, config_path)
             
             # Load and verify
@@ -51,6 +52,55 @@ class TestConfig:
             assert loaded.embedding.batch_size == 64
             assert loaded.embedding.model == config.embedding.model
 
+    def test_load_config_is_memoized(self):
+        """Test repeated loads reuse the parsed config until the file changes."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = Path(tmpdir) / "config.yaml"
+            save_config(create_default_config(), config_path)
+
+            first = load_config(config_path)
+            assert load_config(config_path) is first
+
+            save_config(Config(embedding=EmbeddingConfig(batch_size=8)), config_path)
+
+            reloaded = load_config(config_path)
+            assert reloaded is not first
+            assert reloaded.embedding.batch_size == 8
+
+    def test_saved_config_round_trips_without_validation(self):
+        """Test that our own saved config loads with the right types."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = Path(tmpdir) / "config.yaml"
+            config = Config(sources=[SourceConfig(path=Path(tmpdir), watch=False)])
+            save_config(config, config_path)
+
+            loaded = load_config(config_path)
+            assert loaded == config
+            assert isinstance(loaded.storage.qdrant_path, Path)
+            assert isinstance(loaded.sources[0], SourceConfig)
+            assert loaded.sources[0].path == Path(tmpdir)
+
+    def test_edited_config_is_validated(self):
+        """Test that a hand-edited config file is still validated."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = Path(tmpdir) / "config.yaml"
+            save_config(create_default_config(), config_path)
+
+            config_path.write_text("retrieval:\n  hybrid_alpha: 5.0\n")
+
+            with pytest.raises(ConfigError):
+                load_config(config_path)
+
+    def test_config_is_frozen(self):
+        """Test that configs cannot be mutated in place."""
+        config = create_default_config()
+
+        with pytest.raises(ValidationError):
+            config.embedding.batch_size = 64
+
+        updated = config.model_copy(update={"notes_dir": Path("/tmp/notes")})
+        assert updated.notes_dir == Path("/tmp/notes")
+
     def test_load_missing_config_returns_default(self):
         """Test loading missing config file returns default."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -0,0 +1,32 @@
+"""Tests for the shared component registry."""
+
+from pathlib import Path
+
+from nexus import runtime
+
+
+class TestRuntime:
+    """Tests for runtime getters."""
+
+    def test_metadata_store_is_shared(self, temp_dir: Path):
+        """Test that the same path returns the same store until close_all."""
+        db_path = temp_dir / "metadata.db"
+
+        store = runtime.get_metadata_store(db_path)
+        assert runtime.get_metadata_store(db_path) is store
+
+        runtime.close_all()
+        assert store._connection is None
+        assert runtime.get_metadata_store(db_path) is not store
+
+        runtime.close_all()
+
+    def test_embedder_is_shared(self):
+        """Test that embedders are shared per configuration without loading models."""
+        embedder = runtime.get_embedder("BAAI/bge-small-en-v1.5")
+
+        assert runtime.get_embedder("BAAI/bge-small-en-v1.5") is embedder
+        assert runtime.get_embedder("BAAI/bge-small-en-v1.5", batch_size=8) is not embedder
+        assert embedder._model is None
+
+        runtime.close_all()
@@ -3,7 +3,7 @@
 import pytest
 from pathlib import Path
 
-from nexus.tools.server import NexusServer
+from nexus.tools.server import NexusServer, run_async
 from nexus.config import Config
 
 
@@ -115,3 +115,11 @@ class TestNexusServer:
         result = await server_setup._handle_get_stats()
         
         assert "Documents: 1" in result[0].text
+
+
+def test_run_async_returns_result():
+    """Test that run_async drives a coroutine to completion."""
+    async def answer() -> int:
+        return 42
+
+    assert run_async(answer()) == 42